@@ -12,6 +12,7 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http import LoopBoundClient
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,18 @@ _COST_TABLE = {
     "claude-opus-4-6": (15.0, 75.0),
 }
 
+_TIMEOUT = 60.0
+
+# Shared Messages API client — model calls reuse a pooled HTTP/2 connection
+# instead of a fresh TCP+TLS handshake each (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=_TIMEOUT,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+))
+get_http_client = _http.get
+close_client = _http.close
+
 
 class ClaudeClient:
     """Thin wrapper around the Anthropic Messages API with audit trail."""
@@ -95,14 +108,13 @@ class ClaudeClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                resp = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    json=body,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                "https://api.anthropic.com/v1/messages",
+                json=body,
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             elapsed_ms = int((time.monotonic() - start) * 1000)
 
@@ -4,7 +4,6 @@ Each function calls Claude, persists the ai_run record, and returns structured o
 All functions are sync (use _run_async for the async Claude client).
 """
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
@@ -55,17 +54,14 @@ from app.models.schema import (
     ScriptVersion,
     ContactChannel,
 )
+from app.workers.celery_app import run_async
 
 logger = logging.getLogger(__name__)
 
 
 def _run_async(coro):
-    """Run an async coroutine from sync context."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    """Run an async coroutine from sync context, on the worker's persistent loop."""
+    return run_async(coro)
 
 
 def _build_memory_context(db: Session, scopes: list[str]) -> str:
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
     create_access_token,
     get_current_user,
     hash_password,
@@ -56,13 +57,16 @@ async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
     user = result.scalar_one_or_none()
 
     if not user:
+        # Spend the same bcrypt time as a real check so unknown emails can't be
+        # told apart by response latency.
+        await verify_password(payload.password, DUMMY_PASSWORD_HASH)
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     # If user has no password hash yet (legacy seed data), set it on first login
     if not user.password_hash:
-        user.password_hash = hash_password(payload.password)
+        user.password_hash = await hash_password(payload.password)
         await db.flush()
-    elif not verify_password(payload.password, user.password_hash):
+    elif not await verify_password(payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     if not user.is_active:
@@ -122,9 +126,11 @@ async def update_profile(
     if payload.new_password:
         if not payload.current_password:
             raise HTTPException(status_code=400, detail="Current password required to set new password")
-        if current_user.password_hash and not verify_password(payload.current_password, current_user.password_hash):
+        if current_user.password_hash and not await verify_password(
+            payload.current_password, current_user.password_hash
+        ):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
-        current_user.password_hash = hash_password(payload.new_password)
+        current_user.password_hash = await hash_password(payload.new_password)
 
     await db.flush()
 
@@ -160,7 +166,7 @@ async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db))
         name=payload.name,
         phone=payload.phone,
         role=role,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password(payload.password),
         is_active=True,
     )
     db.add(user)
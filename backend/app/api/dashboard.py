@@ -10,10 +10,10 @@ from app.core.security import get_current_user
 from app.models.schema import (
     Appointment,
     AppointmentStatus,
-    Lead,
     LeadScore,
     LeadStatus,
     OutreachAttempt,
+    lead_status_counts,
 )
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"], dependencies=[Depends(get_current_user)])
@@ -35,14 +35,13 @@ class KPIResponse(BaseModel):
 @router.get("/kpis", response_model=KPIResponse)
 async def get_kpis(db: AsyncSession = Depends(get_db)):
     """Return dashboard KPIs for the overview page."""
-    # Total leads
-    total_leads = (await db.execute(select(func.count(Lead.id)))).scalar() or 0
-
-    # Status counts
+    # Status counts, from the per-minute materialized view instead of a lead scan
     status_result = await db.execute(
-        select(Lead.status, func.count(Lead.id)).group_by(Lead.status)
+        select(lead_status_counts.c.status, func.sum(lead_status_counts.c.lead_count))
+        .group_by(lead_status_counts.c.status)
     )
-    status_breakdown = {row[0].value: row[1] for row in status_result.all()}
+    status_breakdown = {row[0].value: int(row[1]) for row in status_result.all()}
+    total_leads = sum(status_breakdown.values())
 
     hot_leads = status_breakdown.get("hot", 0)
     warm_leads = status_breakdown.get("warm", 0)
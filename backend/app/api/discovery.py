@@ -17,7 +17,7 @@ from app.connectors.md_sdat import run_discovery
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.security import get_current_user
-from app.enrichment.pipeline import enrich_lead, skip_trace_leads, validate_contact
+from app.enrichment.pipeline import enrich_lead, enrich_leads, skip_trace_leads, validate_contact
 from app.services.email import send_skip_trace_notification as send_skip_trace_email
 from app.services.sms import send_skip_trace_notification as send_skip_trace_sms
 from app.models.schema import (
@@ -295,7 +295,7 @@ class RejectRequest(BaseModel):
 # ── Helper to build a DiscoveredLeadRow from DB objects ───────────────
 
 
-def _build_lead_row(lead: Lead, prop: Property, score: LeadScore | None) -> dict:
+def _build_lead_row(lead: Lead, prop: Property) -> dict:
     """Build a DiscoveredLeadRow dict from ORM objects."""
     owner_name = None
     if lead.first_name or lead.last_name:
@@ -308,8 +308,8 @@ def _build_lead_row(lead: Lead, prop: Property, score: LeadScore | None) -> dict
     return {
         "id": str(lead.id),
         "status": _lead_status_to_discovery(lead.status),
-        "discovery_score": score.total_score if score else None,
-        "activation_score": score.total_score if score else None,
+        "discovery_score": lead.current_score,
+        "activation_score": lead.current_score,
         "address": prop.address_line1,
         "city": prop.city,
         "state": prop.state,
@@ -345,46 +345,18 @@ async def list_discovered_leads(
     page_size: int = Query(50, ge=1, le=200),
 ):
     """List discovered leads with filtering and pagination."""
-    # Base query: join Lead + Property, optionally LeadScore
-    query = (
-        select(Lead, Property, LeadScore)
-        .join(Property, Lead.property_id == Property.id)
-        .outerjoin(
-            LeadScore,
-            (LeadScore.lead_id == Lead.id),
-        )
-    )
-
-    # Use a subquery to get only the latest score per lead
-    latest_score_sq = (
-        select(
-            LeadScore.lead_id,
-            func.max(LeadScore.scored_at).label("max_scored_at"),
-        )
-        .group_by(LeadScore.lead_id)
-        .subquery()
-    )
-
-    query = (
-        select(Lead, Property, LeadScore)
-        .join(Property, Lead.property_id == Property.id)
-        .outerjoin(latest_score_sq, latest_score_sq.c.lead_id == Lead.id)
-        .outerjoin(
-            LeadScore,
-            (LeadScore.lead_id == Lead.id)
-            & (LeadScore.scored_at == latest_score_sq.c.max_scored_at),
-        )
-    )
+    # Base query: join Lead + Property; the latest score lives on Lead.current_score
+    query = select(Lead, Property).join(Property, Lead.property_id == Property.id)
 
     # Apply filters
     if county:
         query = query.where(Property.county == county)
 
     if min_score is not None:
-        query = query.where(LeadScore.total_score >= min_score)
+        query = query.where(Lead.current_score >= min_score)
 
     if max_score is not None:
-        query = query.where(LeadScore.total_score <= max_score)
+        query = query.where(Lead.current_score <= max_score)
 
     if status_filter:
         lead_statuses = _discovery_to_lead_statuses(status_filter)
@@ -398,7 +370,7 @@ async def list_discovered_leads(
     # Paginate
     offset = (page - 1) * page_size
     query = query.offset(offset).limit(page_size).order_by(
-        LeadScore.total_score.desc().nulls_last(),
+        Lead.current_score.desc().nulls_last(),
         Lead.created_at.desc(),
     )
 
@@ -406,8 +378,8 @@ async def list_discovered_leads(
     rows = result.all()
 
     leads_out = []
-    for lead, prop, score in rows:
-        leads_out.append(DiscoveredLeadRow(**_build_lead_row(lead, prop, score)))
+    for lead, prop in rows:
+        leads_out.append(DiscoveredLeadRow(**_build_lead_row(lead, prop)))
 
     return DiscoveredLeadListResponse(
         leads=leads_out,
@@ -686,7 +658,6 @@ async def batch_enrich_discovered(
     query = (
         select(Lead)
         .join(Property)
-        .outerjoin(LeadScore, LeadScore.lead_id == Lead.id)
         .where(Lead.status.in_([
             LeadStatus.ingested, LeadStatus.scored,
             LeadStatus.hot, LeadStatus.warm, LeadStatus.cool,
@@ -697,23 +668,15 @@ async def batch_enrich_discovered(
     if county:
         query = query.where(Property.county == county)
     if min_score is not None:
-        query = query.where(LeadScore.total_score >= min_score)
+        query = query.where(Lead.current_score >= min_score)
     if max_score is not None:
-        query = query.where(LeadScore.total_score <= max_score)
+        query = query.where(Lead.current_score <= max_score)
 
-    query = query.order_by(LeadScore.total_score.desc().nulls_last()).limit(limit)
+    query = query.order_by(Lead.current_score.desc().nulls_last()).limit(limit)
     result = await db.execute(query)
     leads = result.scalars().all()
 
-    enriched_count = 0
-    for lead in leads:
-        try:
-            enrichment = await enrich_lead(db, lead)
-            if enrichment:
-                await validate_contact(db, lead)
-                enriched_count += 1
-        except Exception:
-            pass
+    enriched_count = await enrich_leads(db, list(leads))
 
     return {"status": "batch_enrichment_completed", "count": enriched_count}
 
@@ -746,7 +709,6 @@ async def skip_trace_discovered(
     query = (
         select(Lead.id)
         .join(Property)
-        .outerjoin(LeadScore, LeadScore.lead_id == Lead.id)
         .where(Lead.status.in_([
             LeadStatus.ingested, LeadStatus.scored,
             LeadStatus.hot, LeadStatus.warm, LeadStatus.cool,
@@ -757,9 +719,9 @@ async def skip_trace_discovered(
     if payload.county:
         query = query.where(Property.county == payload.county)
     if payload.min_score is not None:
-        query = query.where(LeadScore.total_score >= payload.min_score)
+        query = query.where(Lead.current_score >= payload.min_score)
 
-    query = query.order_by(LeadScore.total_score.desc().nulls_last()).limit(payload.limit)
+    query = query.order_by(Lead.current_score.desc().nulls_last()).limit(payload.limit)
     result = await db.execute(query)
     lead_ids = [row[0] for row in result.all()]
 
@@ -890,7 +852,6 @@ async def run_full_pipeline(
     trace_query = (
         select(Lead.id)
         .join(Property)
-        .outerjoin(LeadScore, LeadScore.lead_id == Lead.id)
         .where(Lead.status.in_([
             LeadStatus.ingested, LeadStatus.scored,
             LeadStatus.hot, LeadStatus.warm, LeadStatus.cool,
@@ -899,9 +860,9 @@ async def run_full_pipeline(
     )
     trace_query = trace_query.where(Property.county == payload.county)
     if payload.min_score is not None:
-        trace_query = trace_query.where(LeadScore.total_score >= payload.min_score)
+        trace_query = trace_query.where(Lead.current_score >= payload.min_score)
 
-    trace_query = trace_query.order_by(LeadScore.total_score.desc().nulls_last()).limit(payload.trace_limit)
+    trace_query = trace_query.order_by(Lead.current_score.desc().nulls_last()).limit(payload.trace_limit)
     result = await db.execute(trace_query)
     lead_ids = [row[0] for row in result.all()]
 
@@ -988,34 +949,19 @@ async def list_activation_queue(
     page_size: int = Query(50, ge=1, le=200),
 ):
     """List activation-ready leads (scored >= 50)."""
-    latest_score_sq = (
-        select(
-            LeadScore.lead_id,
-            func.max(LeadScore.scored_at).label("max_scored_at"),
-        )
-        .group_by(LeadScore.lead_id)
-        .subquery()
-    )
-
     query = (
-        select(Lead, Property, LeadScore)
+        select(Lead, Property)
         .join(Property, Lead.property_id == Property.id)
-        .join(latest_score_sq, latest_score_sq.c.lead_id == Lead.id)
-        .join(
-            LeadScore,
-            (LeadScore.lead_id == Lead.id)
-            & (LeadScore.scored_at == latest_score_sq.c.max_scored_at),
-        )
-        .where(LeadScore.total_score >= 50)
+        .where(Lead.current_score >= 50)
         .where(Lead.status.in_([LeadStatus.hot, LeadStatus.warm, LeadStatus.scored]))
     )
 
     if county:
         query = query.where(Property.county == county)
     if min_discovery_score is not None:
-        query = query.where(LeadScore.total_score >= min_discovery_score)
+        query = query.where(Lead.current_score >= min_discovery_score)
     if min_activation_score is not None:
-        query = query.where(LeadScore.total_score >= min_activation_score)
+        query = query.where(Lead.current_score >= min_activation_score)
 
     # Count
     count_q = select(func.count()).select_from(query.subquery())
@@ -1023,13 +969,15 @@ async def list_activation_queue(
 
     # Paginate
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(LeadScore.total_score.desc())
+    query = query.offset(offset).limit(page_size).order_by(
+        Lead.current_score.desc().nulls_last(), Lead.created_at.desc()
+    )
     result = await db.execute(query)
     rows = result.all()
 
     leads_out = []
-    for lead, prop, score in rows:
-        row = _build_lead_row(lead, prop, score)
+    for lead, prop in rows:
+        row = _build_lead_row(lead, prop)
         row["best_contact_confidence"] = None
         row["dnc_status"] = "flagged" if lead.status == LeadStatus.dnc else "clear"
         row["consent_status"] = "unknown"
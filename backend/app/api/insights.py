@@ -11,13 +11,13 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.schema import (
     InboundMessage,
-    Lead,
     LeadScore,
     LeadStatus,
     MessageDirection,
     NBADecision,
     ObjectionTag,
     QAReview,
+    lead_status_counts,
 )
 from app.services.ai_client import get_ai_client
 from app.services.prompts import INSIGHTS_SYSTEM, INSIGHTS_USER, render_template
@@ -39,12 +39,13 @@ class InsightsResponse(BaseModel):
 async def get_insights(db: AsyncSession = Depends(get_db)):
     """Weekly AI summary narrative with key drivers."""
     # Gather KPI data
-    total_leads = (await db.execute(select(func.count(Lead.id)))).scalar() or 0
-
+    # Status counts, from the per-minute materialized view instead of a lead scan
     status_result = await db.execute(
-        select(Lead.status, func.count(Lead.id)).group_by(Lead.status)
+        select(lead_status_counts.c.status, func.sum(lead_status_counts.c.lead_count))
+        .group_by(lead_status_counts.c.status)
     )
-    status_map = {row[0].value: row[1] for row in status_result.all()}
+    status_map = {row[0].value: int(row[1]) for row in status_result.all()}
+    total_leads = sum(status_map.values())
     hot_leads = status_map.get("hot", 0)
     appointments_set = status_map.get("appointment_set", 0)
 
@@ -6,8 +6,9 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from pydantic import BaseModel
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
 
 from app.connectors.md_sdat import normalize_address
 from app.core.database import get_db
@@ -19,7 +20,6 @@ from app.models.schema import (
     ConsentType,
     ContactChannel,
     Lead,
-    LeadScore,
     LeadStatus,
     Note,
     OutreachAttempt,
@@ -203,6 +203,30 @@ class CSVUploadResponse(BaseModel):
     errors: list[str]
 
 
+# ── Query builders ──────────────────────────────────────────────────────
+
+
+def leads_with_full_context(outreach_since: datetime | None = None) -> Select:
+    """select(Lead) with property, scores and notes loaded in one batch each.
+
+    Outreach attempts are included only when outreach_since is given, and then
+    only those started after it. Any other relationship raises if touched, so
+    a missing option fails loudly instead of querying once per lead.
+    """
+    options = [
+        selectinload(Lead.property),
+        selectinload(Lead.scores),
+        selectinload(Lead.notes),
+    ]
+    if outreach_since is not None:
+        options.append(
+            selectinload(
+                Lead.outreach_attempts.and_(OutreachAttempt.started_at > outreach_since)
+            )
+        )
+    return select(Lead).options(*options, raiseload("*"))
+
+
 # ── Endpoints ───────────────────────────────────────────────────────────
 
 
@@ -352,7 +376,7 @@ async def list_leads(
     status_filter: LeadStatus | None = None,
     county: str | None = None,
     min_score: int | None = None,
-    q: str | None = Query(None, description="Search by name, phone, or email"),
+    q: str | None = Query(None, description="Search by name, phone, email, or street address"),
 ):
     """List leads with optional filters."""
     query = select(Lead).join(Property)
@@ -361,6 +385,8 @@ async def list_leads(
         query = query.where(Lead.status == status_filter)
     if county:
         query = query.where(Property.county == county)
+    if min_score is not None:
+        query = query.where(Lead.current_score >= min_score)
     if q:
         pattern = f"%{q.strip()}%"
         query = query.where(
@@ -369,6 +395,7 @@ async def list_leads(
                 Lead.last_name.ilike(pattern),
                 Lead.phone.ilike(pattern),
                 Lead.email.ilike(pattern),
+                Property.address_line1.ilike(pattern),
             )
         )
 
@@ -376,32 +403,28 @@ async def list_leads(
     count_query = select(func.count()).select_from(query.subquery())
     total = (await db.execute(count_query)).scalar() or 0
 
-    # Paginate
+    # Paginate; property comes from the join, the score from Lead.current_score
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Lead.created_at.desc())
+    query = (
+        query.options(contains_eager(Lead.property), raiseload("*"))
+        .offset(offset)
+        .limit(page_size)
+        .order_by(Lead.created_at.desc())
+    )
     result = await db.execute(query)
     leads = result.scalars().all()
 
-    # Build response with latest scores
+    # Build response
     summaries = []
     for lead in leads:
-        # Get latest score
-        score_result = await db.execute(
-            select(LeadScore.total_score)
-            .where(LeadScore.lead_id == lead.id)
-            .order_by(LeadScore.scored_at.desc())
-            .limit(1)
-        )
-        score = score_result.scalar()
-
-        prop = await db.get(Property, lead.property_id)
+        prop = lead.property
         summaries.append(
             LeadSummary(
                 id=lead.id,
                 first_name=lead.first_name,
                 last_name=lead.last_name,
                 status=lead.status.value,
-                score=score,
+                score=lead.current_score,
                 county=prop.county if prop else None,
                 address=prop.address_line1 if prop else None,
                 phone=lead.phone,
@@ -417,17 +440,15 @@ async def list_leads(
 @router.get("/{lead_id}", response_model=LeadDetailResponse)
 async def get_lead_detail(lead_id: int, db: AsyncSession = Depends(get_db)):
     """Full lead detail with property, scores, outreach, notes, consent."""
-    lead = await db.get(Lead, lead_id)
+    result = await db.execute(leads_with_full_context().where(Lead.id == lead_id))
+    lead = result.scalar_one_or_none()
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
 
-    prop = await db.get(Property, lead.property_id)
-
-    # Scores
-    score_result = await db.execute(
-        select(LeadScore).where(LeadScore.lead_id == lead_id).order_by(LeadScore.scored_at.desc())
-    )
-    scores = score_result.scalars().all()
+    # Property, scores and notes (both newest-first) come with the lead
+    prop = lead.property
+    scores = lead.scores
+    notes = lead.notes
 
     # Recent outreach
     outreach_result = await db.execute(
@@ -438,12 +459,6 @@ async def get_lead_detail(lead_id: int, db: AsyncSession = Depends(get_db)):
     )
     attempts = outreach_result.scalars().all()
 
-    # Notes
-    notes_result = await db.execute(
-        select(Note).where(Note.lead_id == lead_id).order_by(Note.created_at.desc())
-    )
-    notes = notes_result.scalars().all()
-
     # Consent
     consent_result = await db.execute(
         select(ConsentLog).where(ConsentLog.lead_id == lead_id).order_by(
@@ -284,8 +284,7 @@ async def request_appointment(token: str, data: AppointmentRequest):
 
         # Update lead status
         lead.status = LeadStatus.appointment_set
-        await db.commit()
-        await db.refresh(apt)
+        await db.commit()  # apt.id is populated by the flush; no refresh needed
 
         # Send appointment confirmation SMS
         date_str = data.preferred_date.strftime("%A, %B %d")
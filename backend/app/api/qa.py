@@ -6,6 +6,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.core.security import get_current_user, require_role
 from app.models.schema import Lead, QAReview
 
@@ -31,7 +32,11 @@ class QAReviewOut(BaseModel):
     created_at: str
 
 
-@lead_router.get("/{lead_id}/qa", response_model=list[QAReviewOut])
+@lead_router.get(
+    "/{lead_id}/qa",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[QAReviewOut]}},
+)
 async def get_lead_qa(lead_id: int, db: AsyncSession = Depends(get_db)):
     """Get QA reviews for a specific lead."""
     lead = await db.get(Lead, lead_id)
@@ -45,20 +50,20 @@ async def get_lead_qa(lead_id: int, db: AsyncSession = Depends(get_db)):
     )
     reviews = result.scalars().all()
 
-    return [
-        QAReviewOut(
-            id=r.id,
-            lead_id=r.lead_id,
-            conversation_id=r.conversation_id,
-            compliance_score=r.compliance_score,
-            flags=r.flags,
-            checklist_pass=r.checklist_pass,
-            rationale=r.rationale,
-            reviewed_by=r.reviewed_by,
-            created_at=r.created_at.isoformat() if r.created_at else "",
-        )
+    return ORJSONResponse([
+        {
+            "id": r.id,
+            "lead_id": r.lead_id,
+            "conversation_id": r.conversation_id,
+            "compliance_score": r.compliance_score,
+            "flags": r.flags,
+            "checklist_pass": r.checklist_pass,
+            "rationale": r.rationale,
+            "reviewed_by": r.reviewed_by,
+            "created_at": r.created_at.isoformat() if r.created_at else "",
+        }
         for r in reviews
-    ]
+    ])
 
 
 # ── Admin QA queue ───────────────────────────────────────────────────────
@@ -81,7 +86,11 @@ class QAQueueItem(BaseModel):
     created_at: str
 
 
-@admin_router.get("/qa", response_model=list[QAQueueItem])
+@admin_router.get(
+    "/qa",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[QAQueueItem]}},
+)
 async def get_qa_queue(
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -106,20 +115,20 @@ async def get_qa_queue(
     result = await db.execute(query)
     rows = result.all()
 
-    return [
-        QAQueueItem(
-            id=qa.id,
-            lead_id=qa.lead_id,
-            lead_name=f"{lead.first_name or ''} {lead.last_name or ''}".strip() or "Unknown",
-            conversation_id=qa.conversation_id,
-            compliance_score=qa.compliance_score,
-            flags=qa.flags,
-            checklist_pass=qa.checklist_pass,
-            reviewed_by=qa.reviewed_by,
-            created_at=qa.created_at.isoformat() if qa.created_at else "",
-        )
+    return ORJSONResponse([
+        {
+            "id": qa.id,
+            "lead_id": qa.lead_id,
+            "lead_name": f"{lead.first_name or ''} {lead.last_name or ''}".strip() or "Unknown",
+            "conversation_id": qa.conversation_id,
+            "compliance_score": qa.compliance_score,
+            "flags": qa.flags,
+            "checklist_pass": qa.checklist_pass,
+            "reviewed_by": qa.reviewed_by,
+            "created_at": qa.created_at.isoformat() if qa.created_at else "",
+        }
         for qa, lead in rows
-    ]
+    ])
 
 
 router.include_router(lead_router)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import and_, case, cast, func, or_, select, Date
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.security import get_current_user
@@ -232,18 +233,12 @@ async def get_my_appointments(
     today_start = datetime.combine(now.date(), time.min, tzinfo=timezone.utc)
     today_end = datetime.combine(now.date(), time.max, tzinfo=timezone.utc)
 
-    async def build_detail(appt: Appointment) -> AppointmentDetail:
-        lead = await db.get(Lead, appt.lead_id)
+    # Leads come batch-loaded with each appointment list (selectinload) and carry
+    # their latest score, so building a row issues no queries
+    def build_detail(appt: Appointment) -> AppointmentDetail:
+        lead = appt.lead
         lead_name = f"{lead.first_name or ''} {lead.last_name or ''}".strip() if lead else None
         lead_phone = lead.phone if lead else None
-        # Get latest score
-        score_result = await db.execute(
-            select(LeadScore.total_score)
-            .where(LeadScore.lead_id == appt.lead_id)
-            .order_by(LeadScore.scored_at.desc())
-            .limit(1)
-        )
-        score = score_result.scalar()
         return AppointmentDetail(
             id=appt.id,
             lead_id=appt.lead_id,
@@ -254,39 +249,39 @@ async def get_my_appointments(
             scheduled_start=appt.scheduled_start.isoformat(),
             scheduled_end=appt.scheduled_end.isoformat(),
             notes=appt.notes,
-            lead_score=score,
+            lead_score=lead.current_score if lead else None,
         )
 
     # Today's appointments
     today_result = await db.execute(
-        select(Appointment).where(
+        select(Appointment).options(selectinload(Appointment.lead)).where(
             Appointment.rep_id == uid,
             Appointment.scheduled_start >= today_start,
             Appointment.scheduled_start <= today_end,
         ).order_by(Appointment.scheduled_start.asc())
     )
-    today_appts = [await build_detail(a) for a in today_result.scalars().all()]
+    today_appts = [build_detail(a) for a in today_result.scalars().all()]
 
     # Upcoming (next 7 days, excluding today)
     upcoming_result = await db.execute(
-        select(Appointment).where(
+        select(Appointment).options(selectinload(Appointment.lead)).where(
             Appointment.rep_id == uid,
             Appointment.scheduled_start > today_end,
             Appointment.scheduled_start <= today_end + timedelta(days=7),
             Appointment.status.in_([AppointmentStatus.scheduled, AppointmentStatus.confirmed]),
         ).order_by(Appointment.scheduled_start.asc()).limit(20)
     )
-    upcoming_appts = [await build_detail(a) for a in upcoming_result.scalars().all()]
+    upcoming_appts = [build_detail(a) for a in upcoming_result.scalars().all()]
 
     # Recently completed (last 7 days)
     recent_result = await db.execute(
-        select(Appointment).where(
+        select(Appointment).options(selectinload(Appointment.lead)).where(
             Appointment.rep_id == uid,
             Appointment.status == AppointmentStatus.completed,
             Appointment.scheduled_start >= today_start - timedelta(days=7),
         ).order_by(Appointment.scheduled_start.desc()).limit(10)
     )
-    recent_appts = [await build_detail(a) for a in recent_result.scalars().all()]
+    recent_appts = [build_detail(a) for a in recent_result.scalars().all()]
 
     return MyAppointmentsResponse(
         today=today_appts,
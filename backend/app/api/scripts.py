@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.core.security import require_role
 from app.models.schema import ScriptExperiment, ScriptVersion
 from app.workers.ai_tasks import task_script_suggest
@@ -40,7 +41,11 @@ class ExperimentOut(BaseModel):
     variant_conversion_rate: float
 
 
-@router.get("/experiments", response_model=list[ExperimentOut])
+@router.get(
+    "/experiments",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[ExperimentOut]}},
+)
 async def list_experiments(db: AsyncSession = Depends(get_db)):
     """List script A/B experiments with metrics."""
     result = await db.execute(
@@ -48,37 +53,37 @@ async def list_experiments(db: AsyncSession = Depends(get_db)):
     )
     experiments = result.scalars().all()
 
-    return [
-        ExperimentOut(
-            id=e.id,
-            name=e.name,
-            channel=e.channel.value if e.channel else "",
-            control_script_id=e.control_script_id,
-            variant_script_id=e.variant_script_id,
-            control_sends=e.control_sends,
-            variant_sends=e.variant_sends,
-            control_responses=e.control_responses,
-            variant_responses=e.variant_responses,
-            control_conversions=e.control_conversions,
-            variant_conversions=e.variant_conversions,
-            is_active=e.is_active,
-            started_at=e.started_at.isoformat() if e.started_at else "",
-            ended_at=e.ended_at.isoformat() if e.ended_at else None,
-            control_response_rate=(
+    return ORJSONResponse([
+        {
+            "id": e.id,
+            "name": e.name,
+            "channel": e.channel.value if e.channel else "",
+            "control_script_id": e.control_script_id,
+            "variant_script_id": e.variant_script_id,
+            "control_sends": e.control_sends,
+            "variant_sends": e.variant_sends,
+            "control_responses": e.control_responses,
+            "variant_responses": e.variant_responses,
+            "control_conversions": e.control_conversions,
+            "variant_conversions": e.variant_conversions,
+            "is_active": e.is_active,
+            "started_at": e.started_at.isoformat() if e.started_at else "",
+            "ended_at": e.ended_at.isoformat() if e.ended_at else None,
+            "control_response_rate": (
                 e.control_responses / e.control_sends * 100 if e.control_sends > 0 else 0.0
             ),
-            variant_response_rate=(
+            "variant_response_rate": (
                 e.variant_responses / e.variant_sends * 100 if e.variant_sends > 0 else 0.0
             ),
-            control_conversion_rate=(
+            "control_conversion_rate": (
                 e.control_conversions / e.control_sends * 100 if e.control_sends > 0 else 0.0
             ),
-            variant_conversion_rate=(
+            "variant_conversion_rate": (
                 e.variant_conversions / e.variant_sends * 100 if e.variant_sends > 0 else 0.0
             ),
-        )
+        }
         for e in experiments
-    ]
+    ])
 
 
 class SuggestResponse(BaseModel):
@@ -87,7 +92,11 @@ class SuggestResponse(BaseModel):
     expected_lift: float
 
 
-@router.post("/{script_id}/suggest", response_model=SuggestResponse)
+@router.post(
+    "/{script_id}/suggest",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SuggestResponse}},
+)
 async def suggest_script_revision(
     script_id: int,
     db: AsyncSession = Depends(get_db),
@@ -102,8 +111,8 @@ async def suggest_script_revision(
         args=[script.channel.value, script_id, 30]
     ).get(timeout=60)
 
-    return SuggestResponse(
-        edits=result.get("edits", []),
-        hypotheses=result.get("hypotheses", []),
-        expected_lift=result.get("expected_lift", 0.0),
-    )
+    return ORJSONResponse({
+        "edits": result.get("edits", []),
+        "hypotheses": result.get("hypotheses", []),
+        "expected_lift": result.get("expected_lift", 0.0),
+    })
@@ -8,16 +8,18 @@ the assistant's serverUrl. This router handles those tool invocations:
 """
 
 import logging
-import re
+import time
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, HTTPException, Request, status
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings
-from app.core.database import async_engine
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.phone import normalize_phone
+from app.core.security import verify_api_key
 from app.models.schema import (
     Appointment,
     AppointmentStatus,
@@ -66,17 +68,36 @@ _STATUS_MAP = {
 }
 
 
-def _normalize_phone(raw: str) -> str:
-    digits = re.sub(r"\D", "", raw)
-    return digits[-10:] if len(digits) >= 10 else digits
+# Fixed English names for spoken date/time in tool responses — avoids strftime's
+# locale lookups and the Linux-only "%-I" directive.
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Fallback rep for unassigned leads — cached briefly so concurrent Vapi calls
+# don't each hit the DB for the same row. Holds (expires_at, rep_id).
+_ACTIVE_REP_TTL_SECONDS = 30.0
+_active_rep_cache: tuple[float, int] | None = None
+
+
+def _format_spoken_datetime(dt: datetime) -> str:
+    """Format like strftime("%A, %B %d at %-I:%M %p"), e.g. "Monday, March 09 at 2:30 PM"."""
+    hour12 = (dt.hour - 1) % 12 + 1
+    meridiem = "AM" if dt.hour < 12 else "PM"
+    return (
+        f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month]} {dt.day:02d} "
+        f"at {hour12}:{dt.minute:02d} {meridiem}"
+    )
 
 
 async def _find_lead_by_phone(db: AsyncSession, phone: str) -> Lead | None:
-    normalized = _normalize_phone(phone)
+    normalized = normalize_phone(phone)
     if len(normalized) < 10:
         return None
     result = await db.execute(
-        select(Lead).where(Lead.phone.ilike(f"%{normalized}")).limit(1)
+        select(Lead).where(Lead.phone_last10 == normalized).limit(1)
     )
     return result.scalar_one_or_none()
 
@@ -85,10 +106,41 @@ async def _get_available_rep(db: AsyncSession, lead: Lead) -> RepUser | None:
     """Return the lead's assigned rep, or the first active rep."""
     if lead.assigned_rep_id:
         return await db.get(RepUser, lead.assigned_rep_id)
+    rep_id = await _first_active_rep_id(db)
+    if rep_id is None:
+        return None
+    rep = await db.get(RepUser, rep_id)
+    if rep is None or not rep.is_active:
+        # Cached rep was deleted or deactivated since — drop it and re-query once
+        invalidate_active_rep_cache()
+        rep_id = await _first_active_rep_id(db)
+        return await db.get(RepUser, rep_id) if rep_id is not None else None
+    return rep
+
+
+async def _first_active_rep_id(db: AsyncSession) -> int | None:
+    """Return the id of the first active rep, memoized for a short TTL.
+
+    Only the id is cached so the RepUser itself is still loaded in the
+    caller's session.
+    """
+    global _active_rep_cache
+    now = time.monotonic()
+    if _active_rep_cache is not None and _active_rep_cache[0] > now:
+        return _active_rep_cache[1]
     result = await db.execute(
-        select(RepUser).where(RepUser.is_active.is_(True)).limit(1)
+        select(RepUser.id).where(RepUser.is_active.is_(True)).limit(1)
     )
-    return result.scalar_one_or_none()
+    rep_id = result.scalar_one_or_none()
+    if rep_id is not None:
+        _active_rep_cache = (now + _ACTIVE_REP_TTL_SECONDS, rep_id)
+    return rep_id
+
+
+def invalidate_active_rep_cache() -> None:
+    """Forget the memoized fallback rep (call after deactivating a rep)."""
+    global _active_rep_cache
+    _active_rep_cache = None
 
 
 # ── Main Vapi Server URL Endpoint ──────────────────────────────────────
@@ -103,12 +155,9 @@ async def vapi_server_handler(request: Request):
     - Call status updates
     - End-of-call reports
     """
-    settings = get_settings()
-
     # Verify webhook secret if configured
     if settings.webhook_api_key:
-        secret = request.headers.get("X-Vapi-Secret", "")
-        if secret != settings.webhook_api_key:
+        if not verify_api_key(request.headers.get("X-Vapi-Secret"), settings.webhook_api_key):
             raise HTTPException(status_code=403, detail="Invalid server URL secret")
 
     payload = await request.json()
@@ -163,7 +212,7 @@ async def _tool_schedule_appointment(
     params: dict, customer_number: str, call_id: str
 ) -> str:
     """Create an appointment and update lead status."""
-    async with AsyncSession(async_engine) as db:
+    async with async_session() as db:
         lead = await _find_lead_by_phone(db, customer_number)
         if not lead:
             return "I couldn't find your account — our team will follow up to confirm the appointment."
@@ -186,7 +235,9 @@ async def _tool_schedule_appointment(
         prop = await db.get(Property, lead.property_id)
         address = prop.address_line1 if prop else None
 
-        appt = Appointment(
+        # Core insert/update statements: skip unit-of-work bookkeeping since none
+        # of these rows are read back in this session.
+        await db.execute(insert(Appointment).values(
             lead_id=lead.id,
             rep_id=rep.id,
             status=AppointmentStatus.scheduled,
@@ -194,16 +245,16 @@ async def _tool_schedule_appointment(
             scheduled_end=end,
             address=address,
             notes=_build_appt_notes(params),
-        )
-        db.add(appt)
+        ))
 
         # Update lead status
-        lead.status = LeadStatus.appointment_set
+        lead_values = {"status": LeadStatus.appointment_set}
         if not lead.assigned_rep_id:
-            lead.assigned_rep_id = rep.id
+            lead_values["assigned_rep_id"] = rep.id
+        await db.execute(update(Lead).where(Lead.id == lead.id).values(**lead_values))
 
         # Create outreach attempt record
-        attempt = OutreachAttempt(
+        await db.execute(insert(OutreachAttempt).values(
             lead_id=lead.id,
             channel=ContactChannel.voice,
             disposition=ContactDisposition.appointment_booked,
@@ -215,10 +266,11 @@ async def _tool_schedule_appointment(
                 "utility_bill_confirmed": params.get("utility_bill_confirmed"),
                 "agent": "rebecca",
             },
-        )
-        db.add(attempt)
+        ))
 
-        db.add(AuditLog(
+        # Built before commit while rep/start are loaded; the shared session
+        # factory also disables expire_on_commit so later reads don't refresh.
+        await db.execute(insert(AuditLog).values(
             actor="vapi:rebecca",
             action="appointment.booked_by_agent",
             entity_type="lead",
@@ -229,7 +281,7 @@ async def _tool_schedule_appointment(
         await db.commit()
 
         return (
-            f"Appointment confirmed for {start.strftime('%A, %B %d at %-I:%M %p')} ET. "
+            f"Appointment confirmed for {_format_spoken_datetime(start)} ET. "
             "You'll receive a text confirmation shortly."
         )
 
@@ -238,7 +290,7 @@ async def _tool_schedule_callback(
     params: dict, customer_number: str, call_id: str
 ) -> str:
     """Record a scheduled callback and update lead for re-contact."""
-    async with AsyncSession(async_engine) as db:
+    async with async_session() as db:
         lead = await _find_lead_by_phone(db, customer_number)
         if not lead:
             return "Callback noted — we'll reach out at the time discussed."
@@ -253,12 +305,15 @@ async def _tool_schedule_callback(
             callback_at = datetime.now(ET) + timedelta(hours=4)
 
         # Update lead for next outreach
-        lead.next_outreach_at = callback_at
-        lead.next_outreach_channel = ContactChannel.voice
+        lead_values = {
+            "next_outreach_at": callback_at,
+            "next_outreach_channel": ContactChannel.voice,
+        }
         if lead.status in (LeadStatus.ingested, LeadStatus.scored):
-            lead.status = LeadStatus.contacted
+            lead_values["status"] = LeadStatus.contacted
+        await db.execute(update(Lead).where(Lead.id == lead.id).values(**lead_values))
 
-        attempt = OutreachAttempt(
+        await db.execute(insert(OutreachAttempt).values(
             lead_id=lead.id,
             channel=ContactChannel.voice,
             disposition=ContactDisposition.callback_scheduled,
@@ -270,10 +325,9 @@ async def _tool_schedule_callback(
                 "notes": params.get("notes"),
                 "agent": "rebecca",
             },
-        )
-        db.add(attempt)
+        ))
 
-        db.add(AuditLog(
+        await db.execute(insert(AuditLog).values(
             actor="vapi:rebecca",
             action="callback.scheduled_by_agent",
             entity_type="lead",
@@ -283,14 +337,14 @@ async def _tool_schedule_callback(
 
         await db.commit()
 
-        return f"Callback scheduled for {callback_at.strftime('%A, %B %d at %-I:%M %p')} ET."
+        return f"Callback scheduled for {_format_spoken_datetime(callback_at)} ET."
 
 
 async def _tool_log_call_outcome(
     params: dict, customer_number: str, call_id: str
 ) -> str:
     """Log the final call disposition."""
-    async with AsyncSession(async_engine) as db:
+    async with async_session() as db:
         lead = await _find_lead_by_phone(db, customer_number)
 
         disposition_raw = params.get("disposition", "completed")
@@ -299,17 +353,22 @@ async def _tool_log_call_outcome(
         if lead:
             # Update lead status based on disposition
             new_status = _STATUS_MAP.get(disposition_raw)
-            if new_status and lead.status not in (
+            if new_status and lead.status in (
                 LeadStatus.appointment_set,
                 LeadStatus.closed_won,
             ):
-                lead.status = new_status
+                new_status = None
 
             # DNC: mark immediately
             if disposition_raw == "dnc":
-                lead.status = LeadStatus.dnc
+                new_status = LeadStatus.dnc
 
-            attempt = OutreachAttempt(
+            if new_status:
+                await db.execute(
+                    update(Lead).where(Lead.id == lead.id).values(status=new_status)
+                )
+
+            await db.execute(insert(OutreachAttempt).values(
                 lead_id=lead.id,
                 channel=ContactChannel.voice,
                 disposition=db_disposition,
@@ -321,10 +380,9 @@ async def _tool_log_call_outcome(
                     "notes": params.get("notes"),
                     "agent": "rebecca",
                 },
-            )
-            db.add(attempt)
+            ))
 
-            db.add(AuditLog(
+            await db.execute(insert(AuditLog).values(
                 actor="vapi:rebecca",
                 action="call.outcome_logged",
                 entity_type="lead",
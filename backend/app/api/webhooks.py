@@ -3,20 +3,23 @@
 Public endpoints protected by signature verification + rate limiting.
 """
 
-import hashlib
 import hmac
 import logging
-import re
 import time
-from collections import defaultdict
 
+import orjson
+import redis.asyncio as aioredis
 from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings
+from app.core import cache
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.phone import normalize_phone
+from app.core.responses import ORJSONResponse
+from app.core.security import verify_api_key
 from app.models.schema import (
     AuditLog,
     ContactChannel,
@@ -34,30 +37,39 @@ from app.workers.ai_tasks import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+router = APIRouter(
+    prefix="/webhooks",
+    tags=["webhooks"],
+    default_response_class=ORJSONResponse,
+)
 
-# Simple in-memory rate limiter
-_rate_store: dict[str, list[float]] = defaultdict(list)
+# Fixed-window rate limiter shared across workers via Redis (one counter per IP
+# per minute). Uses the shared cache client, whose short socket timeouts keep a
+# stalled Redis from hanging the webhook.
+_RATE_WINDOW_SECONDS = 60
 
 
-def _check_rate_limit(client_ip: str) -> bool:
-    """Returns True if within rate limit, False if exceeded."""
-    settings = get_settings()
-    now = time.time()
-    window = 60.0  # 1 minute
+async def _check_rate_limit(client_ip: str) -> bool:
+    """Returns True if within rate limit, False if exceeded.
 
-    # Clean old entries
-    _rate_store[client_ip] = [t for t in _rate_store[client_ip] if now - t < window]
-    if len(_rate_store[client_ip]) >= settings.webhook_rate_limit:
-        return False
-    _rate_store[client_ip].append(now)
-    return True
+    Fails open if Redis is unreachable so inbound messages aren't dropped.
+    """
+    window = int(time.time() // _RATE_WINDOW_SECONDS)
+    key = f"ratelimit:webhook:{client_ip}:{window}"
+
+    try:
+        async with cache.get_redis().pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, _RATE_WINDOW_SECONDS * 2)
+            count, _ = await pipe.execute()
+    except aioredis.RedisError:
+        logger.warning("Rate limiter unavailable — allowing webhook from %s", client_ip)
+        return True
+
+    return count <= settings.webhook_rate_limit
 
 
-def _normalize_phone(raw: str) -> str:
-    """Normalize a phone number to last 10 digits for matching."""
-    digits = re.sub(r"\D", "", raw)
-    return digits[-10:] if len(digits) >= 10 else digits
+_TWILIO_SECRET = settings.twilio_webhook_secret.encode()
 
 
 def _verify_twilio_signature(request: Request, body: bytes) -> bool:
@@ -66,7 +78,6 @@ def _verify_twilio_signature(request: Request, body: bytes) -> bool:
     In production (secret configured): requires valid HMAC-SHA256 signature.
     In dev (no secret + DEBUG=true): allows requests but logs a warning.
     """
-    settings = get_settings()
     if not settings.twilio_webhook_secret:
         if not settings.debug:
             logger.warning(
@@ -81,12 +92,30 @@ def _verify_twilio_signature(request: Request, body: bytes) -> bool:
     if not signature:
         return False
 
-    expected = hmac.new(
-        settings.twilio_webhook_secret.encode(),
-        body,
-        hashlib.sha256,
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected)
+    try:
+        provided = bytes.fromhex(signature)
+    except ValueError:
+        return False
+
+    # One-shot C HMAC; compare raw digests to skip hex-encoding ours
+    expected = hmac.digest(_TWILIO_SECRET, body, "sha256")
+    return hmac.compare_digest(provided, expected)
+
+
+def _is_twilio_request(request: Request, content_type: str, body: bytes) -> bool:
+    """Decide whether a voice callback came from Twilio.
+
+    Twilio always signs its callbacks and posts form data, so headers settle it
+    for nearly every request; the body is only scanned for form posts that
+    carry neither signal.
+    """
+    if "X-Twilio-Signature" in request.headers:
+        return True
+    if request.headers.get("user-agent", "").startswith("TwilioProxy"):
+        return True
+    if "json" in content_type:
+        return False
+    return b"CallSid" in body
 
 
 def _verify_webhook_api_key(request: Request) -> bool:
@@ -95,7 +124,6 @@ def _verify_webhook_api_key(request: Request) -> bool:
     Checks X-Webhook-Key header against WEBHOOK_API_KEY setting.
     In dev (no key configured + DEBUG=true): allows requests but logs a warning.
     """
-    settings = get_settings()
     if not settings.webhook_api_key:
         if not settings.debug:
             logger.warning(
@@ -106,11 +134,7 @@ def _verify_webhook_api_key(request: Request) -> bool:
         logger.warning("Webhook API key not configured — skipping verification (DEBUG mode)")
         return True
 
-    provided = request.headers.get("X-Webhook-Key", "")
-    if not provided:
-        return False
-
-    return hmac.compare_digest(provided, settings.webhook_api_key)
+    return verify_api_key(request.headers.get("X-Webhook-Key"), settings.webhook_api_key)
 
 
 # ── Inbound SMS Webhook ──────────────────────────────────────────────────
@@ -130,7 +154,7 @@ async def sms_webhook(request: Request):
     """Twilio-compatible inbound SMS webhook handler."""
     client_ip = request.client.host if request.client else "unknown"
 
-    if not _check_rate_limit(client_ip):
+    if not await _check_rate_limit(client_ip):
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
     # Parse form data (Twilio sends application/x-www-form-urlencoded)
@@ -152,30 +176,27 @@ async def sms_webhook(request: Request):
 
     # Also support JSON payloads for testing
     if not from_number:
-        import json
         try:
-            data = json.loads(body)
+            data = orjson.loads(body)
             from_number = data.get("From", "")
             to_number = data.get("To", "")
             message_body = data.get("Body", "")
             message_sid = data.get("MessageSid", "")
-        except (json.JSONDecodeError, Exception):
+        except Exception:
             raise HTTPException(status_code=422, detail="Invalid payload")
 
     # Find lead by phone number — normalize to last 10 digits
     from app.core.database import async_engine
     from sqlalchemy.ext.asyncio import AsyncSession as AS
 
-    phone_normalized = _normalize_phone(from_number)
+    phone_normalized = normalize_phone(from_number)
     if len(phone_normalized) < 10:
         logger.warning("Inbound SMS from invalid number: %s", from_number)
         return {"status": "invalid_sender"}
 
     async with AS(async_engine) as db:
         result = await db.execute(
-            select(Lead).where(
-                Lead.phone.ilike(f"%{phone_normalized}")
-            ).limit(1)
+            select(Lead).where(Lead.phone_last10 == phone_normalized).limit(1)
         )
         lead = result.scalar_one_or_none()
 
@@ -204,13 +225,16 @@ async def sms_webhook(request: Request):
             new_value=message_body[:200],
         ))
 
+        # The flush's INSERT ... RETURNING populates msg.id; read it before commit
+        # (this session expires attributes on commit) instead of a refresh SELECT.
+        await db.flush()
+        message_id = msg.id
         await db.commit()
-        await db.refresh(msg)
 
         # Dispatch async processing
-        task_process_inbound_sms.delay(msg.id)
+        task_process_inbound_sms.delay(message_id)
 
-        return {"status": "received", "message_id": msg.id}
+        return {"status": "received", "message_id": message_id}
 
 
 # ── Call Outcome Webhook ─────────────────────────────────────────────────
@@ -231,7 +255,7 @@ async def call_webhook(payload: CallWebhookPayload, request: Request):
     """Call outcome/transcript webhook handler (provider-agnostic)."""
     client_ip = request.client.host if request.client else "unknown"
 
-    if not _check_rate_limit(client_ip):
+    if not await _check_rate_limit(client_ip):
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
     # Verify webhook API key
@@ -285,13 +309,13 @@ async def call_webhook(payload: CallWebhookPayload, request: Request):
 async def voice_status_webhook(request: Request):
     """Voice call status callback — works with Twilio, Vapi, Retell."""
     client_ip = request.client.host if request.client else "unknown"
-    if not _check_rate_limit(client_ip):
+    if not await _check_rate_limit(client_ip):
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
     # Verify: Twilio uses signature, others use API key
     body = await request.body()
     content_type = request.headers.get("content-type", "")
-    is_twilio = b"CallSid" in body
+    is_twilio = _is_twilio_request(request, content_type, body)
 
     if is_twilio:
         if not _verify_twilio_signature(request, body):
@@ -302,7 +326,7 @@ async def voice_status_webhook(request: Request):
 
     # Parse payload — could be JSON or form data
     if "json" in content_type:
-        payload = await request.json()
+        payload = orjson.loads(body)
     else:
         form = await request.form()
         payload = dict(form)
@@ -360,12 +384,12 @@ async def voice_status_webhook(request: Request):
 async def voice_recording_webhook(request: Request):
     """Voice recording ready callback — updates conversation with recording URL."""
     client_ip = request.client.host if request.client else "unknown"
-    if not _check_rate_limit(client_ip):
+    if not await _check_rate_limit(client_ip):
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
     body = await request.body()
     content_type = request.headers.get("content-type", "")
-    is_twilio = b"CallSid" in body
+    is_twilio = _is_twilio_request(request, content_type, body)
 
     if is_twilio:
         if not _verify_twilio_signature(request, body):
@@ -375,7 +399,7 @@ async def voice_recording_webhook(request: Request):
             raise HTTPException(status_code=403, detail="Invalid webhook API key")
 
     if "json" in content_type:
-        payload = await request.json()
+        payload = orjson.loads(body)
     else:
         form = await request.form()
         payload = dict(form)
@@ -10,14 +10,20 @@ condo, multi-family) — not just the top N by assessed value.
 import asyncio
 import logging
 import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
-from sqlalchemy import select
+import orjson
+from sqlalchemy import String, column, func, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http import LoopBoundClient
 from app.models.schema import Lead, LeadStatus, Property, PropertyType
-from app.services.scoring import score_lead
+from app.services.scoring import score_leads
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +70,7 @@ _SUFFIX_MAP: dict[str, str] = {
 _SUFFIX_RE = re.compile(
     r"\b(" + "|".join(_SUFFIX_MAP.keys()) + r")\b", re.IGNORECASE,
 )
+_PUNCT_RE = re.compile(r"[.,#]+")
 
 
 def normalize_address(raw: str) -> str:
@@ -74,13 +81,39 @@ def normalize_address(raw: str) -> str:
     - Replace common street suffix long forms with abbreviations
     - Strip trailing punctuation
     """
-    addr = raw.strip().upper()
-    addr = re.sub(r"[.,#]+", " ", addr)
+    addr = _PUNCT_RE.sub(" ", raw.upper())
     addr = _SUFFIX_RE.sub(lambda m: _SUFFIX_MAP[m.group(1).upper()], addr)
-    addr = re.sub(r"\s+", " ", addr).strip()
-    return addr
+    return " ".join(addr.split())  # collapse + strip whitespace without a regex
 
 
+# Concurrent SODA page requests per county fetch — enough to hide RTT while
+# staying polite to the public API
+_FETCH_CONCURRENCY = 4
+
+_SODA_HEADERS = {"User-Agent": "SolarCommand/1.0", "Accept": "application/json"}
+
+# Shared SODA client — keeps TLS connections alive across pages and discovery
+# runs, and multiplexes concurrent page requests over HTTP/2 (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=60.0,
+    headers=_SODA_HEADERS,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+))
+get_client = _http.get
+close_client = _http.close
+
+# Candidate rows per bulk INSERT in run_discovery (~15 params/row, well under asyncpg's 32767)
+_INGEST_BATCH_SIZE = 500
+
+# Ingest statements are built once and executed with a list of row dicts:
+# SQLAlchemy batches the rows into multi-VALUES INSERTs itself, and every
+# batch reuses the same cached compiled form instead of one per batch size.
+# ON CONFLICT covers both the parcel_id unique constraint and the
+# (UPPER(address_line1), zip_code) unique index.
+_PROPERTY_INSERT = pg_insert(Property).on_conflict_do_nothing().returning(Property.id)
+_LEAD_INSERT = pg_insert(Lead).returning(Lead.id)
+
 # Land-use code extraction: "Residential (R)" → "R"
 LAND_USE_RE = re.compile(r"\(([^)]+)\)")
 
@@ -99,52 +132,67 @@ RESIDENTIAL_LAND_USE_CODES = [
     "Residential Multi-Family (MF)",
 ]
 
+# Known land-use strings → code, so the common case skips the regex entirely
+_LAND_USE_CODE_LOOKUP: dict[str, str] = {
+    raw: LAND_USE_RE.search(raw).group(1).strip() for raw in RESIDENTIAL_LAND_USE_CODES
+}
+
 # Maryland zip code → utility company mapping
 # BGE serves central MD, Pepco serves DC suburbs, SMECO serves southern MD,
 # Delmarva serves Eastern Shore, Potomac Edison serves western MD
-MD_ZIP_UTILITY: dict[str, str] = {}
+# Keyed by integer zip so import does no str() conversions; read-only at runtime.
 
 # BGE — Baltimore Gas & Electric (Exelon)
 # Baltimore City, Baltimore County, Anne Arundel, Howard, Harford, Cecil (partial)
-for _z in [
+_BGE_ZIPS = (
     *range(21001, 21058), *range(21060, 21095), *range(21102, 21163),
     *range(21201, 21298), *range(21401, 21412), 21701, 21702,
     *range(21220, 21238), *range(21784, 21798),
     21042, 21043, 21044, 21045, 21046, 21075, 21076, 21090, 21093, 21094,
     21108, 21113, 21114, 21122, 21144, 21146, 21225, 21226, 21227, 21228,
     21229, 21230, 21244, 21250, 21286,
-]:
-    MD_ZIP_UTILITY[str(_z)] = "BGE"
+)
 
 # Pepco — Potomac Electric Power (Exelon)
 # Montgomery County, Prince George's County
-for _z in [
+_PEPCO_ZIPS = (
     *range(20601, 20623), *range(20700, 20800), *range(20810, 20920),
     20901, 20902, 20903, 20904, 20905, 20906, 20910, 20912,
     20850, 20851, 20852, 20853, 20854, 20855, 20860, 20861, 20862,
     20871, 20872, 20874, 20876, 20877, 20878, 20879, 20880, 20882, 20886,
     20770, 20771, 20772, 20774, 20781, 20782, 20783, 20784, 20785,
-]:
-    MD_ZIP_UTILITY[str(_z)] = "Pepco"
+)
 
-# SMECO — Southern Maryland Electric Cooperative
-for _z in [20601, 20602, 20603, 20607, 20608, 20611, 20613, 20616, 20617,
-           20618, 20619, 20620, 20621, 20622, 20623, 20624, 20625, 20628,
-           20630, 20632, 20634, 20636, 20637, 20639, 20640, 20643, 20645,
-           20646, 20650, 20653, 20657, 20658, 20659, 20661, 20662, 20667,
-           20670, 20674, 20675, 20676, 20677, 20678, 20680, 20684, 20685,
-           20686, 20687, 20688, 20689, 20690, 20692, 20693, 20695]:
-    MD_ZIP_UTILITY.setdefault(str(_z), "SMECO")
+# SMECO — Southern Maryland Electric Cooperative (only where BGE/Pepco don't serve)
+_SMECO_ZIPS = (
+    20601, 20602, 20603, 20607, 20608, 20611, 20613, 20616, 20617,
+    20618, 20619, 20620, 20621, 20622, 20623, 20624, 20625, 20628,
+    20630, 20632, 20634, 20636, 20637, 20639, 20640, 20643, 20645,
+    20646, 20650, 20653, 20657, 20658, 20659, 20661, 20662, 20667,
+    20670, 20674, 20675, 20676, 20677, 20678, 20680, 20684, 20685,
+    20686, 20687, 20688, 20689, 20690, 20692, 20693, 20695,
+)
+
+# Later entries win: SMECO is the fallback, Pepco overrides BGE where ranges overlap
+MD_ZIP_UTILITY: Mapping[int, str] = MappingProxyType({
+    **dict.fromkeys(_SMECO_ZIPS, "SMECO"),
+    **dict.fromkeys(_BGE_ZIPS, "BGE"),
+    **dict.fromkeys(_PEPCO_ZIPS, "Pepco"),
+})
 
 
+@lru_cache(maxsize=2048)
 def _lookup_utility(zip_code: str) -> str | None:
     """Look up the electric utility for a Maryland zip code."""
     z = (zip_code or "").strip()[:5]
-    return MD_ZIP_UTILITY.get(z)
+    return MD_ZIP_UTILITY.get(int(z)) if z.isdecimal() else None
 
 
 def _extract_land_use_code(raw: str) -> str:
     """Extract code from 'Residential (R)' → 'R'."""
+    code = _LAND_USE_CODE_LOOKUP.get(raw)
+    if code is not None:
+        return code
     match = LAND_USE_RE.search(raw)
     return match.group(1).strip() if match else raw.strip()
 
@@ -160,19 +208,22 @@ def _build_residential_where() -> str:
     return f"starts_with({F_LAND_USE}, 'Residential')"
 
 
-async def fetch_county_properties(
-    county: str,
-    limit: int = 1000,
-    offset: int = 0,
-) -> list[dict[str, Any]]:
-    """Fetch one page of residential properties from Maryland Open Data."""
+def _dataset_url(county: str) -> str:
     dataset_id = COUNTY_DATASETS.get(county)
     if not dataset_id:
         raise ValueError(
             f"Unknown county '{county}'. Available: {', '.join(COUNTY_DATASETS)}"
         )
+    return f"https://opendata.maryland.gov/resource/{dataset_id}.json"
+
 
-    url = f"https://opendata.maryland.gov/resource/{dataset_id}.json"
+async def fetch_county_properties(
+    county: str,
+    limit: int = 1000,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Fetch one page of residential properties from Maryland Open Data."""
+    url = _dataset_url(county)
     where = _build_residential_where()
 
     params = {
@@ -182,15 +233,21 @@ async def fetch_county_properties(
         "$order": f"{F_ASSESSED} DESC",
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.get(
-            url, params=params,
-            headers={"User-Agent": "SolarCommand/1.0", "Accept": "application/json"},
-        )
-        resp.raise_for_status()
-        records = resp.json()
+    resp = await get_client().get(url, params=params)
+    resp.raise_for_status()
+    # Parse the raw bytes directly — resp.json() would first decode a full str copy
+    return orjson.loads(resp.content)
 
-    return records
+
+async def count_county_properties(county: str) -> int:
+    """Return the number of residential records in a county dataset."""
+    resp = await get_client().get(
+        _dataset_url(county),
+        params={"$select": "count(*) AS total", "$where": _build_residential_where()},
+    )
+    resp.raise_for_status()
+    rows = orjson.loads(resp.content)
+    return int(rows[0]["total"]) if rows else 0
 
 
 async def fetch_all_county_properties(
@@ -198,7 +255,10 @@ async def fetch_all_county_properties(
     max_records: int = 10000,
     page_size: int = 1000,
 ) -> list[dict[str, Any]]:
-    """Paginate through residential properties until limit reached or data exhausted.
+    """Fetch residential properties up to a limit, several pages at a time.
+
+    Counts the dataset first, then requests every page concurrently (bounded
+    by _FETCH_CONCURRENCY) over the shared client.
 
     Args:
         county: County name (must be in COUNTY_DATASETS)
@@ -206,40 +266,29 @@ async def fetch_all_county_properties(
         page_size: Records per API request (max ~50000, but 1000 is safe for Cloudflare)
 
     Returns:
-        List of raw SODA records
+        List of raw SODA records, in dataset order
     """
-    all_records: list[dict[str, Any]] = []
-    offset = 0
-
-    while len(all_records) < max_records:
-        # Don't fetch more than we need
-        remaining = max_records - len(all_records)
-        fetch_limit = min(page_size, remaining)
+    _dataset_url(county)  # validate before any network call
+    sem = asyncio.Semaphore(_FETCH_CONCURRENCY)
 
-        records = await fetch_county_properties(county, limit=fetch_limit, offset=offset)
+    total = min(await count_county_properties(county), max_records)
 
-        if not records:
-            logger.info(
-                "No more records at offset %d for %s — total fetched: %d",
-                offset, county, len(all_records),
+    async def fetch_page(offset: int) -> list[dict[str, Any]]:
+        async with sem:
+            records = await fetch_county_properties(
+                county, limit=min(page_size, total - offset), offset=offset,
             )
-            break
-
-        all_records.extend(records)
-        offset += len(records)
-
         logger.info(
-            "Fetched page: %d records (offset %d, total so far: %d) for %s",
-            len(records), offset, len(all_records), county,
+            "Fetched page: %d records (offset %d) for %s",
+            len(records), offset, county,
         )
+        return records
 
-        # If we got fewer than requested, we've hit the end of the dataset
-        if len(records) < fetch_limit:
-            break
-
-        # Rate limit: ~1 req/sec to be polite to the SODA API
-        await asyncio.sleep(0.5)
+    pages = await asyncio.gather(
+        *(fetch_page(offset) for offset in range(0, total, page_size))
+    )
 
+    all_records = [record for page in pages for record in page]
     logger.info(
         "Fetch complete: %d total records from %s (max was %d)",
         len(all_records), county, max_records,
@@ -279,6 +328,12 @@ def _build_address(record: dict[str, Any]) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=4096)
+def _normalize_city(raw: str) -> str:
+    """'COCKEYSVILLE ' → 'Cockeysville'. Memoized: a county has few distinct cities."""
+    return raw.strip().title()
+
+
 def map_to_property_kwargs(record: dict[str, Any]) -> dict[str, Any]:
     """Map a SODA record to Property model constructor kwargs."""
     raw_lu = record.get(F_LAND_USE, "Residential (R)")
@@ -288,12 +343,12 @@ def map_to_property_kwargs(record: dict[str, Any]) -> dict[str, Any]:
     ooi = (record.get(F_OOI) or "").strip().upper()
     owner_occupied = ooi != "N"  # Y, 1, or blank → True; N → False
 
-    city = (record.get(F_CITY) or record.get(F_PREM_CITY) or "").strip()
+    city = _normalize_city(record.get(F_CITY) or record.get(F_PREM_CITY) or "")
     zip_code = (record.get(F_ZIP) or record.get(F_PREM_ZIP) or "").strip()
 
     return {
         "address_line1": normalize_address(_build_address(record)),
-        "city": city.title(),  # "COCKEYSVILLE" → "Cockeysville"
+        "city": city,
         "state": "MD",
         "zip_code": zip_code,
         "county": (record.get(F_COUNTY) or "").strip(),
@@ -310,6 +365,81 @@ def map_to_property_kwargs(record: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def map_records_to_property_kwargs(
+    records: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], int, int]:
+    """Map a page of SODA records to Property kwargs in one pass.
+
+    Records without coordinates are rejected before the full field mapping
+    runs, so they don't pay for address normalization and numeric parsing.
+
+    Returns: (kwargs for ingestible records, number skipped, number of errors)
+    """
+    mapped: list[dict[str, Any]] = []
+    skipped = 0
+    errors = 0
+    for record in records:
+        # Skip if no coordinates (allow ingestion of properties without coords
+        # only if we have a valid address — they just won't show on the map)
+        if _safe_float(record.get(F_LAT)) is None or _safe_float(record.get(F_LON)) is None:
+            skipped += 1
+            continue
+
+        try:
+            kwargs = map_to_property_kwargs(record)
+        except Exception as e:
+            logger.error("Error mapping record: %s", e)
+            errors += 1
+            continue
+
+        # Skip if missing address or zip
+        if not kwargs["address_line1"] or not kwargs["zip_code"]:
+            skipped += 1
+            continue
+
+        mapped.append(kwargs)
+    return mapped, skipped, errors
+
+
+async def _drop_known_duplicates(
+    db: AsyncSession,
+    batch: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Filter out rows already stored (by parcel_id or address+zip) or repeated in the batch.
+
+    Two set-based SELECTs per batch instead of two per record. Keeping known
+    duplicates out of the INSERT also avoids burning sequence values on them.
+    """
+    parcel_ids = {k["parcel_id"] for k in batch if k["parcel_id"]}
+    addr_zips = {(k["address_line1"].upper(), k["zip_code"]) for k in batch}
+
+    seen_parcels: set[str] = set()
+    if parcel_ids:
+        seen_parcels.update((await db.execute(
+            select(Property.parcel_id).where(Property.parcel_id.in_(parcel_ids))
+        )).scalars())
+
+    upper_addr = func.upper(Property.address_line1)
+    seen_addr_zips: set[tuple[str, str]] = {
+        (addr, zip_code)
+        for addr, zip_code in (await db.execute(
+            select(upper_addr, Property.zip_code)
+            .where(tuple_(upper_addr, Property.zip_code).in_(addr_zips))
+        )).all()
+    }
+
+    fresh: list[dict[str, Any]] = []
+    for kwargs in batch:
+        addr_zip = (kwargs["address_line1"].upper(), kwargs["zip_code"])
+        if kwargs["parcel_id"] in seen_parcels or addr_zip in seen_addr_zips:
+            continue
+        if kwargs["parcel_id"]:
+            seen_parcels.add(kwargs["parcel_id"])
+        seen_addr_zips.add(addr_zip)
+        fresh.append(kwargs)
+    return fresh
+
+
 async def run_discovery(
     db: AsyncSession,
     county: str,
@@ -323,98 +453,69 @@ async def run_discovery(
     Returns: { ingested, scored, skipped, errors }
     """
     records = await fetch_all_county_properties(county, max_records=limit)
+    candidates, skipped, errors = map_records_to_property_kwargs(records)
 
     ingested = 0
     scored = 0
-    skipped = 0
-    errors = 0
 
-    for i, record in enumerate(records):
+    for batch_start in range(0, len(candidates), _INGEST_BATCH_SIZE):
+        batch = candidates[batch_start:batch_start + _INGEST_BATCH_SIZE]
         try:
-            kwargs = map_to_property_kwargs(record)
-
-            # Skip if missing address or zip
-            if not kwargs["address_line1"] or not kwargs["zip_code"]:
-                skipped += 1
+            fresh = await _drop_known_duplicates(db, batch)
+            skipped += len(batch) - len(fresh)
+            if not fresh:
                 continue
 
-            # Skip if no coordinates (allow ingestion of properties without coords
-            # only if we have a valid address — they just won't show on the map)
-            if kwargs["latitude"] is None or kwargs["longitude"] is None:
-                skipped += 1
-                continue
+            # ON CONFLICT still skips rows that appear concurrently between
+            # the check above and this INSERT.
+            prop_ids = (await db.execute(_PROPERTY_INSERT, fresh)).scalars().all()
+            skipped += len(fresh) - len(prop_ids)
 
-            # Deduplicate by parcel_id
-            if kwargs["parcel_id"]:
-                existing = await db.execute(
-                    select(Property.id).where(
-                        Property.parcel_id == kwargs["parcel_id"]
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    skipped += 1
-                    continue
-
-            # Also deduplicate by normalized address + zip
-            from sqlalchemy import func as sa_func
-            existing_addr = await db.execute(
-                select(Property.id).where(
-                    sa_func.upper(Property.address_line1) == kwargs["address_line1"].upper(),
-                    Property.zip_code == kwargs["zip_code"],
-                )
-            )
-            if existing_addr.scalar_one_or_none():
-                skipped += 1
+            if not prop_ids:
                 continue
 
-            # Create property
-            prop = Property(**kwargs)
-            db.add(prop)
-            await db.flush()
-
-            # Create lead
-            lead = Lead(
-                property_id=prop.id,
-                status=LeadStatus.ingested,
-            )
-            db.add(lead)
-            await db.flush()
-
-            ingested += 1
+            lead_ids = (await db.execute(
+                _LEAD_INSERT,
+                [{"property_id": pid, "status": LeadStatus.ingested} for pid in prop_ids],
+            )).scalars().all()
+        except Exception as e:
+            logger.error("Error ingesting batch of %d records: %s", len(batch), e)
+            await db.rollback()
+            errors += len(batch)
+            continue
 
-            # Score immediately
-            try:
-                await score_lead(db, lead.id)
-                scored += 1
-            except Exception as e:
-                logger.warning("Scoring failed for lead %d: %s", lead.id, e)
+        ingested += len(lead_ids)
 
+        # Score immediately — one bulk INSERT for the batch's scores
+        try:
+            scored += await score_leads(db, lead_ids)
         except Exception as e:
-            logger.error("Error ingesting record: %s", e)
-            errors += 1
+            logger.warning("Scoring failed for batch of %d leads: %s", len(lead_ids), e)
 
-        # Commit in batches of 100 to avoid huge transactions
-        if ingested > 0 and ingested % 100 == 0:
-            await db.commit()
-            logger.info(
-                "Progress: %d/%d ingested (%d scored, %d skipped, %d errors)",
-                ingested, len(records), scored, skipped, errors,
-            )
+        # Commit per batch to avoid huge transactions
+        await db.commit()
+        logger.info(
+            "Progress: %d/%d ingested (%d scored, %d skipped, %d errors)",
+            ingested, len(records), scored, skipped, errors,
+        )
 
-    # Backfill utility_zone for any existing properties that are missing it
+    # Backfill utility_zone for any existing properties that are missing it —
+    # one UPDATE joined against the zip → utility table, done server-side
+    zip_utility = values(
+        column("zip5", String), column("utility", String), name="zip_utility",
+    ).data([(f"{z:05d}", utility) for z, utility in MD_ZIP_UTILITY.items()])
     backfill_result = await db.execute(
-        select(Property).where(
+        update(Property)
+        .where(
             Property.utility_zone.is_(None),
             Property.zip_code.isnot(None),
             Property.state == "MD",
+            func.left(func.trim(Property.zip_code), 5) == zip_utility.c.zip5,
         )
+        .values(utility_zone=zip_utility.c.utility)
+        .execution_options(synchronize_session=False)
     )
-    backfilled = 0
-    for prop in backfill_result.scalars():
-        utility = _lookup_utility(prop.zip_code)
-        if utility:
-            prop.utility_zone = utility
-            backfilled += 1
+    backfilled = backfill_result.rowcount
 
     await db.commit()
 
@@ -0,0 +1,67 @@
+"""Shared Redis cache — cross-process memo for auth and enrichment lookups.
+
+In-process caches only help the worker that filled them; this layer lets every
+API worker and Celery process reuse a verified token or a provider match.
+Values are stored as orjson bytes (never pickle) under a TTL. Redis is an
+accelerator only: reads fail open as misses and writes are best-effort.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Created lazily per event loop — Celery workers run coroutines on their own loop,
+# and a redis.asyncio pool can't be reused across loops. Short socket timeouts
+# keep a slow/unreachable Redis from stalling the request it is meant to speed up.
+_client: aioredis.Redis | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared async Redis client for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = aioredis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared cache client (app shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+async def get_json(key: str) -> Any | None:
+    """Return the cached value for key, or None on a miss or Redis error."""
+    try:
+        raw = await get_redis().get(key)
+    except aioredis.RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """Cache a JSON-serializable value for ttl_seconds (no-op if ttl <= 0)."""
+    if ttl_seconds <= 0:
+        return
+    try:
+        await get_redis().set(key, orjson.dumps(value), ex=ttl_seconds)
+    except aioredis.RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
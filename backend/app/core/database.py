@@ -1,16 +1,46 @@
 """Database connection and session management."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
+from itertools import chain, islice
+from typing import Any
 
+import orjson
+from sqlalchemy import Column
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-async_engine = create_async_engine(settings.database_url, echo=settings.debug, future=True)
+
+def _json_serializer(obj: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (int dict keys allowed, as with json.dumps)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSONB columns (raw payloads, AI outputs, audit metadata) go through orjson in
+# both directions instead of the stdlib json module. The pool (AsyncAdaptedQueuePool,
+# the async default) is sized explicitly; pre-ping drops connections the server
+# closed while idle instead of failing the request that checks them out. The
+# compiled-statement LRU is sized above the 500 default: ORM adds, Core writes
+# and the dashboard/report queries add up to more distinct statement shapes
+# than that, and a cache miss means recompiling the SQL.
+async_engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=settings.db_query_cache_size,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
 engine = async_engine  # Alias for backward compatibility
 
+# expire_on_commit=False: ORM attributes stay readable after commit without a
+# refresh SELECT. Code building audit rows etc. after commit relies on this.
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -18,7 +48,87 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
+            # Requests that never touched the database (cached/static responses)
+            # have nothing to commit. Anything that began a transaction commits —
+            # flushed ORM writes and Core UPDATE/INSERTs are invisible to
+            # session.new/dirty, so those can't be used to detect read-only work.
+            if session.in_transaction() or session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
+
+
+# Rows per COPY call — bounds the records buffered client-side for one chunk
+_COPY_CHUNK_ROWS = 10_000
+
+
+def _copy_columns(table, keys: Iterable[str]) -> list[Column]:
+    """Columns a COPY writes: the rows' keys plus any with a scalar Python default.
+
+    Generated columns are never written; everything else left out falls back
+    to its server default.
+    """
+    keys = set(keys)
+    return [
+        c for c in table.columns
+        if c.computed is None
+        and (c.key in keys or (c.default is not None and c.default.is_scalar))
+    ]
+
+
+async def bulk_copy(
+    db: AsyncSession,
+    model: type,
+    rows: Iterable[dict[str, Any]],
+    chunk_size: int = _COPY_CHUNK_ROWS,
+) -> int:
+    """Append rows to a model's table with binary COPY instead of INSERT.
+
+    For append-only bulk writes: no ON CONFLICT, no RETURNING, no ORM events.
+    Rows are dicts keyed by column, all with the first row's keys (as for an
+    executemany INSERT). Values get the same bind processing an INSERT would
+    apply (enums by name, JSONB through orjson) and omitted columns their
+    scalar Python default. The COPY runs inside the session's transaction.
+    Returns the number of rows copied.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    table = model.__table__
+    conn = await db.connection()
+    dialect = conn.dialect
+    columns = _copy_columns(table, first)
+    plan = [
+        (
+            c.key,
+            c.default.arg if c.default is not None and c.default.is_scalar else None,
+            c.type.dialect_impl(dialect).bind_processor(dialect),
+        )
+        for c in columns
+    ]
+
+    def _record(row: dict[str, Any]) -> tuple:
+        values = []
+        for key, default, process in plan:
+            value = row.get(key, default)
+            values.append(process(value) if process is not None and value is not None else value)
+        return tuple(values)
+
+    raw = (await conn.get_raw_connection()).driver_connection
+    if not raw.is_in_transaction():
+        # The asyncpg adapter opens the session's transaction lazily, on its
+        # first statement; start it so the COPY commits/rolls back with it
+        await conn.exec_driver_sql("SELECT 1")
+
+    names = [c.name for c in columns]
+    copied = 0
+    records = map(_record, chain((first,), rows))
+    while chunk := list(islice(records, chunk_size)):
+        await raw.copy_records_to_table(
+            table.name, records=chunk, columns=names, schema_name=table.schema,
+        )
+        copied += len(chunk)
+    return copied
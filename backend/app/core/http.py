@@ -0,0 +1,38 @@
+"""Shared outbound HTTP clients — one pooled httpx client per event loop.
+
+Provider and model clients reuse pooled TLS (and HTTP/2) connections instead of
+a fresh handshake per request. A pool belongs to the event loop that opened
+it, and Celery workers run coroutines on their own loop, so each client is
+rebuilt whenever it is used from a different loop than the one it was created
+on. Modules expose get/close from a LoopBoundClient; the app lifespan closes
+them.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+
+
+class LoopBoundClient:
+    """Lazily built httpx.AsyncClient, rebuilt per event loop or after close."""
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None:
+        self._factory = factory
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._factory()
+            self._loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client (app shutdown). The next get() builds a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
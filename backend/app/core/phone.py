@@ -0,0 +1,17 @@
+"""Phone number normalization shared by the inbound webhooks and voice tools."""
+
+import re
+
+# Deletes every Latin-1 char except ASCII digits — str.translate is a single
+# C-level pass, much cheaper than re.sub for short phone strings
+_NON_DIGITS_TABLE = str.maketrans("", "", "".join(
+    chr(c) for c in range(256) if not "0" <= chr(c) <= "9"
+))
+
+
+def normalize_phone(raw: str) -> str:
+    """Normalize a phone number to last 10 digits for matching."""
+    digits = raw.translate(_NON_DIGITS_TABLE)
+    if not digits.isascii():  # chars above U+00FF survive the table — rare
+        digits = re.sub(r"\D", "", raw)
+    return digits[-10:] if len(digits) >= 10 else digits
@@ -0,0 +1,18 @@
+"""Response classes shared across API routers."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Endpoints returning this skip FastAPI's response_model validation and
+    jsonable_encoder pass — only use it for payloads that are already plain
+    JSON-compatible dicts/lists built from typed DB rows.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
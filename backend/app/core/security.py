@@ -1,37 +1,158 @@
 """Authentication and authorization — JWT tokens + RBAC."""
 
+import asyncio
+import hashlib
+import hmac
+import math
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import PyJWTError as JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings
+from app.core import cache
+from app.core.config import settings
 from app.core.database import get_db
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Hot-path auth settings, read once (Settings is frozen for the process lifetime)
+JWT_SECRET: str = settings.jwt_secret
+JWT_ALG: str = settings.jwt_algorithm
+_JWT_ALGORITHMS = [JWT_ALG]
+_JWT_SECRET_BYTES = JWT_SECRET.encode()
+_JWT_EXPIRE = timedelta(minutes=settings.jwt_expire_minutes)
+_JWT_CACHE_TTL: int = settings.jwt_cache_ttl_seconds
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+# Legacy X-API-Key login; Settings defines no api_key field unless one is added,
+# so this is usually empty and the fallback is skipped without per-request lookups.
+_LEGACY_API_KEY: str = getattr(settings, "api_key", "") or ""
 
+# Verified-token cache: sha256(token)[:16] → (valid_until, user_id). Lets repeat
+# requests with the same bearer token skip signature verification. Only the
+# user id is cached — the RepUser is still loaded in the request's session so
+# deactivation and profile edits take effect immediately. Raw tokens are never stored.
+# Entries are mirrored to Redis (core.cache) so other workers can reuse them.
+_token_cache: OrderedDict[bytes, tuple[float, int]] = OrderedDict()
+_TOKEN_CACHE_MAX = 10_000
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+
+# Hash checked for logins with an unknown email so they take as long as a real
+# password check. Computed once at import with the configured work factor.
+DUMMY_PASSWORD_HASH = bcrypt.hashpw(
+    b"dummy-password", bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+).decode("utf-8")
+
+
+# bcrypt releases the GIL, so checks run here in parallel without blocking the event loop
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+
+async def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    hashed = await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, bcrypt.hashpw, password.encode("utf-8"), salt
+    )
+    return hashed.decode("utf-8")
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, bcrypt.checkpw, plain.encode("utf-8"), hashed.encode("utf-8")
+    )
+
+
+def hash_api_key(key: str) -> bytes:
+    """Keyed SHA-256 digest of a machine-generated API key.
+
+    API keys are high-entropy random strings, so a single HMAC is enough —
+    bcrypt is reserved for user-chosen passwords.
+    """
+    return hmac.digest(_JWT_SECRET_BYTES, key.encode(), "sha256")
+
+
+@lru_cache(maxsize=8)
+def _expected_key_digest(expected: str) -> bytes:
+    """Digest of a configured key. Only settings values land here, so the cache stays tiny."""
+    return hash_api_key(expected)
+
+
+def verify_api_key(provided: str | None, expected: str | None) -> bool:
+    """Constant-time API key check. False if either side is missing."""
+    if not expected or not provided:
+        return False
+    return hmac.compare_digest(hash_api_key(provided), _expected_key_digest(expected))
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-    settings = get_settings()
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.jwt_expire_minutes)
-    )
+    expire = datetime.now(timezone.utc) + (expires_delta or _JWT_EXPIRE)
     to_encode["exp"] = expire
-    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALG)
+
+
+async def _user_id_from_token(token: str) -> int:
+    """Verify a JWT and return its subject user id. Raises JWTError or 401.
+
+    Checks this process's cache, then the shared Redis cache, before paying
+    for signature verification.
+    """
+    ttl = _JWT_CACHE_TTL
+    now = time.time()
+
+    if ttl > 0:
+        key = hashlib.sha256(token.encode()).digest()[:16]
+        shared_key = f"jwt:{key.hex()}"
+        cached = _token_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _token_cache.move_to_end(key)
+            return cached[1]
+
+        shared = await cache.get_json(shared_key)
+        if shared is not None and shared["until"] > now:
+            _remember_token(key, shared["until"], shared["uid"])
+            return shared["uid"]
+
+    # Expired replays (stale browser tabs) are rejected from the unverified
+    # claims without an HMAC check; anything still fresh is fully verified below.
+    exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    if isinstance(exp, (int, float)) and exp < now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    payload = jwt.decode(token, JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+    sub = payload.get("sub")
+    if sub is None:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = int(sub)
+
+    if ttl > 0:
+        # Never cache past the token's own expiry
+        exp = payload.get("exp")
+        valid_until = min(now + ttl, exp) if isinstance(exp, (int, float)) else now + ttl
+        _remember_token(key, valid_until, user_id)
+        await cache.set_json(
+            shared_key, {"uid": user_id, "until": valid_until}, math.ceil(valid_until - now)
+        )
+
+    return user_id
+
+
+def _remember_token(key: bytes, valid_until: float, user_id: int) -> None:
+    """Store a verified token in the in-process LRU."""
+    _token_cache[key] = (valid_until, user_id)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > _TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
 
 
 async def get_current_user(
@@ -42,16 +163,12 @@ async def get_current_user(
     """Authenticate via JWT token or legacy API key. Returns RepUser or raises 401."""
     from app.models.schema import RepUser
 
-    settings = get_settings()
-
     # Try JWT token first
     if token:
         try:
-            payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-            sub = payload.get("sub")
-            if sub is None:
-                raise HTTPException(status_code=401, detail="Invalid token")
-            user = await db.get(RepUser, int(sub))
+            # PK get: served from the session identity map when already loaded;
+            # RBAC only reads column attributes, so there is nothing to eager-load.
+            user = await db.get(RepUser, await _user_id_from_token(token))
             if not user or not user.is_active:
                 raise HTTPException(status_code=401, detail="User not found or inactive")
             return user
@@ -59,8 +176,8 @@ async def get_current_user(
             raise HTTPException(status_code=401, detail="Invalid token")
 
     # Fallback: API key check
-    if api_key and getattr(settings, "api_key", None):
-        if api_key == settings.api_key:
+    if api_key and _LEGACY_API_KEY:
+        if verify_api_key(api_key, _LEGACY_API_KEY):
             result = await db.execute(select(RepUser).limit(1))
             user = result.scalar_one_or_none()
             if user:
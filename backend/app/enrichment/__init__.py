@@ -1,5 +1,5 @@
 """Contact enrichment pipeline — PDL, Melissa, Tracerfy integration."""
 
-from app.enrichment.pipeline import enrich_lead, skip_trace_leads, validate_contact
+from app.enrichment.pipeline import enrich_lead, enrich_leads, skip_trace_leads, validate_contact
 
-__all__ = ["enrich_lead", "validate_contact", "skip_trace_leads"]
+__all__ = ["enrich_lead", "enrich_leads", "validate_contact", "skip_trace_leads"]
@@ -0,0 +1,13 @@
+"""Retry backoff shared by the enrichment provider clients."""
+
+import random
+
+# "Full jitter" (uniform 0..min(cap, base * 2**attempt)) so workers that failed
+# together don't retry in lockstep
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 30.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1."""
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
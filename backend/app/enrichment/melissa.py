@@ -2,21 +2,38 @@
 
 import asyncio
 import logging
+import re
+from functools import lru_cache
 
 import httpx
+import orjson
 
-from app.core.config import get_settings
+from app.core.config import settings
+from app.core.http import LoopBoundClient
+from app.enrichment._retry import backoff_delay
 
 logger = logging.getLogger(__name__)
 
 MELISSA_BASE = "https://personator.melissadata.net/v3/WEB/ContactVerify/doContactVerify"
 
+# Head of the response body scanned for an empty "Records" list before parsing
+_PEEK_BYTES = 4096
+_EMPTY_RECORDS_RE = re.compile(rb'"Records"\s*:\s*\[\s*\]')
+
+# Shared Melissa client, rebuilt per event loop (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=15.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+))
+get_client = _http.get
+close_client = _http.close
+
 
 class MelissaClient:
     """Client for Melissa Global Contact Verification API."""
 
     def __init__(self) -> None:
-        settings = get_settings()
         self.api_key = settings.melissa_api_key
 
     @property
@@ -62,23 +79,22 @@ class MelissaClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        MELISSA_BASE,
-                        params=params,
-                        timeout=15,
-                    )
-
+                async with get_client().stream("GET", MELISSA_BASE, params=params) as resp:
                     if resp.status_code == 429:
-                        retry_after = int(resp.headers.get("Retry-After", 2 ** attempt))
-                        logger.warning("Melissa: rate limited, retrying in %ds", retry_after)
-                        await asyncio.sleep(retry_after)
+                        # An explicit Retry-After is honored as-is; otherwise back off with jitter
+                        retry_after = resp.headers.get("Retry-After")
+                        delay = int(retry_after) if retry_after else backoff_delay(attempt)
+                        logger.warning("Melissa: rate limited, retrying in %.1fs", delay)
+                        await resp.aclose()
+                        await asyncio.sleep(delay)
                         continue
 
                     resp.raise_for_status()
-                    data = resp.json()
+                    body = await _read_unless_no_records(resp)
 
-                records = data.get("Records", [])
+                if body is None:
+                    return None
+                records = orjson.loads(body).get("Records", [])
                 if not records:
                     return None
 
@@ -87,28 +103,71 @@ class MelissaClient:
             except httpx.HTTPError as e:
                 logger.error("Melissa validation error (attempt %d/%d): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(backoff_delay(attempt))
                     continue
                 return None
 
         return None
 
 
+async def _read_unless_no_records(resp: httpx.Response) -> bytes | None:
+    """Read a streamed Melissa body, or None as soon as it shows an empty Records list.
+
+    No-match responses are the common case; only the head of the body is
+    checked so matches still cost a single full parse.
+    """
+    buf = bytearray()
+    peeking = True
+    async for chunk in resp.aiter_bytes():
+        buf += chunk
+        if peeking:
+            if _EMPTY_RECORDS_RE.search(buf):
+                return None
+            peeking = len(buf) < _PEEK_BYTES
+    return bytes(buf)
+
+
+# Result codes we act on, packed into an int so each check is a single mask test
+_PS01, _PS02, _ES01, _ES03, _ES04, _AS01, _AS02 = (1 << n for n in range(7))
+_CODE_BITS = {
+    "PS01": _PS01, "PS02": _PS02,  # phone valid
+    "ES01": _ES01, "ES03": _ES03, "ES04": _ES04,  # email valid / undeliverable / disposable
+    "AS01": _AS01, "AS02": _AS02,  # address deliverable / valid
+}
+
+
+# One C-level scan over the result string for every code we care about
+_CODE_RE = re.compile("|".join(_CODE_BITS))
+
+
+@lru_cache(maxsize=1024)
+def _result_flags(results: str) -> int:
+    """Fold Melissa's comma-delimited result string (e.g. "AS01,PS01") into a bitmask.
+
+    Melissa returns a small set of distinct code combinations, so results are
+    memoized — most records cost a single dict lookup.
+    """
+    flags = 0
+    for m in _CODE_RE.finditer(results):
+        flags |= _CODE_BITS[m.group()]
+    return flags
+
+
 def _normalize_melissa(record: dict) -> dict:
     """Normalize Melissa response into our standard validation format."""
-    results = record.get("Results", "")
+    flags = _result_flags(record.get("Results", ""))
 
     # Phone results
-    phone_valid = "PS01" in results or "PS02" in results  # Valid phone
+    phone_valid = bool(flags & (_PS01 | _PS02))  # Valid phone
     phone_type = record.get("PhoneType", "unknown").lower()
 
     # Email results
-    email_valid = "ES01" in results  # Valid email
-    email_deliverable = "ES03" not in results  # Not undeliverable
+    email_valid = bool(flags & _ES01)  # Valid email
+    email_deliverable = not flags & _ES03  # Not undeliverable
 
     # Address results
-    address_valid = "AS01" in results or "AS02" in results  # Valid address
-    address_deliverable = "AS01" in results  # USPS deliverable
+    address_valid = bool(flags & (_AS01 | _AS02))  # Valid address
+    address_deliverable = bool(flags & _AS01)  # USPS deliverable
 
     return {
         "phone_valid": phone_valid if record.get("PhoneNumber") else None,
@@ -117,24 +176,24 @@ def _normalize_melissa(record: dict) -> dict:
         "phone_line_status": record.get("PhoneLineStatus", "").lower() or None,
         "email_valid": email_valid if record.get("EmailAddress") else None,
         "email_deliverable": email_deliverable if record.get("EmailAddress") else None,
-        "email_disposable": "ES04" in results if record.get("EmailAddress") else None,
+        "email_disposable": bool(flags & _ES04) if record.get("EmailAddress") else None,
         "address_valid": address_valid if record.get("AddressLine1") else None,
         "address_deliverable": address_deliverable if record.get("AddressLine1") else None,
-        "confidence": _compute_confidence(results),
+        "confidence": _compute_confidence(flags),
         "raw_response": record,
     }
 
 
-def _compute_confidence(results: str) -> float:
-    """Compute a confidence score 0.0-1.0 from Melissa result codes."""
+def _compute_confidence(flags: int) -> float:
+    """Compute a confidence score 0.0-1.0 from Melissa result-code flags."""
     score = 0.5  # baseline
     # Phone verified
-    if "PS01" in results or "PS02" in results:
+    if flags & (_PS01 | _PS02):
         score += 0.2
     # Email verified
-    if "ES01" in results:
+    if flags & _ES01:
         score += 0.15
     # Address verified
-    if "AS01" in results:
+    if flags & _AS01:
         score += 0.15
     return min(score, 1.0)
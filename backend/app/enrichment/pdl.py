@@ -1,22 +1,54 @@
 """People Data Labs (PDL) integration — contact discovery & enrichment."""
 
 import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 import httpx
+import orjson
 
-from app.core.config import get_settings
+from app.core import cache
+from app.core.config import settings
+from app.core.http import LoopBoundClient
+from app.enrichment._retry import backoff_delay
 
 logger = logging.getLogger(__name__)
 
 PDL_BASE = "https://api.peopledatalabs.com/v5"
 
+# Common street-suffix abbreviations, expanded to match PDL's stored format
+_SUFFIX_MAP = {
+    "rd": "road", "dr": "drive", "ct": "court", "ln": "lane", "st": "street",
+    "ave": "avenue", "blvd": "boulevard", "cir": "circle", "pl": "place",
+    "ter": "terrace", "pkwy": "parkway",
+}
+_SUFFIX_RE = re.compile(r"\s(" + "|".join(_SUFFIX_MAP) + r")$")
+
+# Address-search result cache: query SQL → (expires_at, normalized match).
+# PDL person records behind an address are stable, so a day is safe. Matches
+# are also shared across processes via Redis (core.cache).
+_search_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+_SEARCH_CACHE_MAX = 10_000
+
+# Shared PDL client, rebuilt per event loop (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=15.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+))
+get_client = _http.get
+close_client = _http.close
+
 
 class PDLClient:
     """Client for People Data Labs person enrichment & search API."""
 
     def __init__(self) -> None:
-        settings = get_settings()
         self.api_key = settings.pdl_api_key
 
     @property
@@ -80,41 +112,38 @@ class PDLClient:
     ) -> dict | None:
         """Person Search API (GET) — find residents by street address.
 
-        Uses GET with SQL query param (works on free tier).
-        Address values are lowercased since PDL stores them lowercase.
+        Uses GET with SQL query param (works on free tier). Matches are cached
+        per query for 24h so duplicate addresses in a batch cost one credit.
         """
-        conditions = []
-        if address:
-            # Extract just the street part (before any comma), lowercase for PDL
-            street = address.split(",")[0].strip().lower()
-            # Expand common abbreviations to match PDL's format
-            for abbr, full in [(" rd", " road"), (" dr", " drive"), (" ct", " court"),
-                               (" ln", " lane"), (" st", " street"), (" ave", " avenue"),
-                               (" blvd", " boulevard"), (" cir", " circle"), (" pl", " place"),
-                               (" ter", " terrace"), (" pkwy", " parkway")]:
-                if street.endswith(abbr):
-                    street = street[:-len(abbr)] + full
-                    break
-            conditions.append(f"location_street_address='{street}'")
-        if zip_code:
-            conditions.append(f"location_postal_code='{zip_code}'")
-        if state:
-            conditions.append(f"location_region='{state.lower()}'")
-        if city:
-            conditions.append(f"location_locality='{city.lower()}'")
-
-        if not conditions:
+        sql = _build_search_sql(address, city, state, zip_code)
+        if sql is None:
             return None
 
-        sql = "SELECT * FROM person WHERE " + " AND ".join(conditions)
+        now = time.monotonic()
+        cached = _search_cache.get(sql)
+        if cached is not None and cached[0] > now:
+            _search_cache.move_to_end(sql)
+            return cached[1]
+
+        shared_key = "pdl:search:" + hashlib.sha256(sql.encode()).hexdigest()[:32]
+        shared = await cache.get_json(shared_key)
+        if shared is not None:
+            _remember_search(sql, now, shared)
+            return shared
 
         # Use GET with query params (works reliably on all tiers)
-        return await self._request_with_retry(
+        result = await self._request_with_retry(
             "GET", f"{PDL_BASE}/person/search",
             params={"sql": sql, "size": "1"},
             is_search=True,
         )
 
+        # Only matches are cached — None also covers credit/rate-limit failures
+        if result is not None:
+            _remember_search(sql, now, result)
+            await cache.set_json(shared_key, result, _SEARCH_CACHE_TTL_SECONDS)
+        return result
+
     async def _request_with_retry(
         self,
         method: str,
@@ -127,59 +156,99 @@ class PDLClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    kwargs: dict = {
-                        "headers": {"X-Api-Key": self.api_key, "Content-Type": "application/json"},
-                        "timeout": 15,
-                    }
-                    if params:
-                        kwargs["params"] = params
-                    if json_body:
-                        kwargs["json"] = json_body
-
-                    resp = await client.request(method, url, **kwargs)
-
-                    if resp.status_code == 404:
-                        logger.info("PDL: no match found")
-                        return None
+                kwargs: dict = {
+                    "headers": {"X-Api-Key": self.api_key, "Content-Type": "application/json"},
+                }
+                if params:
+                    kwargs["params"] = params
+                if json_body:
+                    kwargs["json"] = json_body
+
+                resp = await get_client().request(method, url, **kwargs)
+
+                if resp.status_code == 404:
+                    logger.info("PDL: no match found")
+                    return None
+
+                if resp.status_code == 402:
+                    logger.warning("PDL: credit limit reached")
+                    return None
+
+                if resp.status_code == 429:
+                    # An explicit Retry-After is honored as-is; otherwise back off with jitter
+                    retry_after = resp.headers.get("Retry-After")
+                    delay = int(retry_after) if retry_after else backoff_delay(attempt)
+                    logger.warning("PDL: rate limited, retrying in %.1fs", delay)
+                    await asyncio.sleep(delay)
+                    continue
 
-                    if resp.status_code == 402:
-                        logger.warning("PDL: credit limit reached")
-                        return None
+                if resp.status_code >= 400:
+                    body = resp.text
+                    logger.error("PDL %d error: %s", resp.status_code, body[:500])
+                    return None
 
-                    if resp.status_code == 429:
-                        retry_after = int(resp.headers.get("Retry-After", 2 ** attempt))
-                        logger.warning("PDL: rate limited, retrying in %ds", retry_after)
-                        await asyncio.sleep(retry_after)
-                        continue
+                data = orjson.loads(resp.content)
 
-                    if resp.status_code >= 400:
-                        body = resp.text
-                        logger.error("PDL %d error: %s", resp.status_code, body[:500])
+                if is_search:
+                    # Search returns {data: [...], total: N}
+                    results = data.get("data") or []
+                    if not results:
+                        logger.info("PDL search: no results")
                         return None
-
-                    data = resp.json()
-
-                    if is_search:
-                        # Search returns {data: [...], total: N}
-                        results = data.get("data") or []
-                        if not results:
-                            logger.info("PDL search: no results")
-                            return None
-                        return _normalize_pdl(results[0])
-                    else:
-                        return _normalize_pdl(data)
+                    return _normalize_pdl(results[0])
+                else:
+                    return _normalize_pdl(data)
 
             except httpx.HTTPError as e:
                 logger.error("PDL request error (attempt %d/%d): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(backoff_delay(attempt))
                     continue
                 return None
 
         return None
 
 
+def _remember_search(sql: str, now: float, result: dict) -> None:
+    """Store a search match in the in-process LRU."""
+    _search_cache[sql] = (now + _SEARCH_CACHE_TTL_SECONDS, result)
+    _search_cache.move_to_end(sql)
+    if len(_search_cache) > _SEARCH_CACHE_MAX:
+        _search_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=10_000)
+def _build_search_sql(
+    address: str | None,
+    city: str | None,
+    state: str | None,
+    zip_code: str | None,
+) -> str | None:
+    """Build the PDL person-search SQL for an address, or None if nothing to match on.
+
+    Address values are lowercased since PDL stores them lowercase.
+    """
+    conditions = []
+    if address:
+        # Extract just the street part (before any comma), lowercase for PDL
+        street = address.split(",")[0].strip().lower()
+        # Expand common abbreviations to match PDL's format
+        m = _SUFFIX_RE.search(street)
+        if m:
+            street = street[:m.start() + 1] + _SUFFIX_MAP[m.group(1)]
+        conditions.append(f"location_street_address='{street}'")
+    if zip_code:
+        conditions.append(f"location_postal_code='{zip_code}'")
+    if state:
+        conditions.append(f"location_region='{state.lower()}'")
+    if city:
+        conditions.append(f"location_locality='{city.lower()}'")
+
+    if not conditions:
+        return None
+    return "SELECT * FROM person WHERE " + " AND ".join(conditions)
+
+
 def _normalize_pdl(data: dict) -> dict:
     """Normalize PDL response into our standard enrichment format.
 
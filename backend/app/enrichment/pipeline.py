@@ -1,11 +1,15 @@
 """Enrichment pipeline — orchestrates PDL enrichment + Melissa validation."""
 
+import asyncio
 import logging
 
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import get_settings
+from app.core.database import bulk_copy
 from app.enrichment.melissa import MelissaClient
 from app.enrichment.pdl import PDLClient
 from app.models.schema import (
@@ -14,35 +18,24 @@ from app.models.schema import (
     ContactValidation,
     Lead,
     LeadStatus,
+    Property,
 )
 
 logger = logging.getLogger(__name__)
 
+# Only enrich hot/warm/scored/cool/ingested leads
+_ENRICHABLE_STATUSES: frozenset[LeadStatus] = frozenset({
+    LeadStatus.hot, LeadStatus.warm, LeadStatus.scored,
+    LeadStatus.cool, LeadStatus.ingested,
+})
 
-async def enrich_lead(db: AsyncSession, lead: Lead) -> ContactEnrichment | None:
-    """Run PDL enrichment for a lead. Only enriches Hot/Warm/Scored leads.
 
-    Returns the ContactEnrichment record or None if skipped/failed.
-    Uses address-based lookup for leads without name/phone (e.g. SDAT imports).
-    """
-    from app.models.schema import Property
+def _pdl_lookup_kwargs(lead: Lead, prop: Property | None) -> dict:
+    """Build the best PDL identifier set for a lead.
 
-    settings = get_settings()
-
-    # Gate: only enrich hot/warm/scored/cool/ingested leads
-    enrichable = (
-        LeadStatus.hot, LeadStatus.warm, LeadStatus.scored,
-        LeadStatus.cool, LeadStatus.ingested,
-    )
-    if lead.status not in enrichable:
-        logger.info("Lead %d status %s — skipping enrichment", lead.id, lead.status.value)
-        return None
-
-    pdl = PDLClient()
-    if not pdl.enabled:
-        return None
-
-    # Build the best identifier set
+    Includes the property address for address-based lookups (critical for SDAT
+    leads with no name/phone).
+    """
     name_parts = []
     if lead.first_name:
         name_parts.append(lead.first_name)
@@ -50,25 +43,33 @@ async def enrich_lead(db: AsyncSession, lead: Lead) -> ContactEnrichment | None:
         name_parts.append(lead.last_name)
     name = " ".join(name_parts) if name_parts else None
 
-    # Build address for address-based lookups (critical for SDAT leads with no name/phone)
     address = None
-    prop = await db.get(Property, lead.property_id)
     if prop:
-        addr_parts = [prop.address_line1, prop.city, prop.state, prop.zip_code]
-        address = ", ".join(p for p in addr_parts if p)
+        # Stored column; only properties not yet flushed need the Python join
+        address = prop.address_full or ", ".join(
+            p for p in (prop.address_line1, prop.city, prop.state, prop.zip_code) if p
+        )
 
-    result = await pdl.enrich_person(
-        name=name,
-        phone=lead.phone,
-        email=lead.email,
-        address=address,
-        city=prop.city if prop else None,
-        state=prop.state if prop else None,
-        zip_code=prop.zip_code if prop else None,
-    )
+    return {
+        "name": name,
+        "phone": lead.phone,
+        "email": lead.email,
+        "address": address,
+        "city": prop.city if prop else None,
+        "state": prop.state if prop else None,
+        "zip_code": prop.zip_code if prop else None,
+    }
 
-    if not result:
-        return None
+
+def _apply_enrichment(
+    db: AsyncSession, lead: Lead, prop: Property | None, result: dict,
+) -> ContactEnrichment | None:
+    """Record a PDL result and backfill lead/property contact fields.
+
+    Returns None (and records nothing) when the result is below the
+    configured confidence threshold. Caller is responsible for flushing.
+    """
+    settings = get_settings()
 
     # Check confidence threshold
     if result.get("confidence", 0) < settings.enrichment_confidence_min:
@@ -116,8 +117,6 @@ async def enrich_lead(db: AsyncSession, lead: Lead) -> ContactEnrichment | None:
         if lead.email and not prop.owner_email:
             prop.owner_email = lead.email
 
-    await db.flush()
-
     logger.info(
         "Lead %d enriched via PDL (confidence=%.2f, phone=%s, email=%s)",
         lead.id, enrichment.confidence,
@@ -127,6 +126,96 @@ async def enrich_lead(db: AsyncSession, lead: Lead) -> ContactEnrichment | None:
     return enrichment
 
 
+# ContactIntelligence column <- Melissa result key. Booleans are copied
+# whenever reported (False included); strings only when non-empty.
+_CI_VALIDATION_FIELDS = (
+    ("phone_valid", "phone_valid", True),
+    ("phone_type", "phone_type", False),
+    ("carrier_name", "phone_carrier", False),
+    ("email_valid", "email_valid", True),
+    ("email_deliverable", "email_deliverable", True),
+)
+
+
+async def _apply_validation(db: AsyncSession, lead: Lead, result: dict) -> ContactValidation:
+    """Record a Melissa result and mirror it onto ContactIntelligence.
+
+    Caller is responsible for flushing.
+    """
+    validation = ContactValidation(
+        lead_id=lead.id,
+        provider="melissa",
+        phone_valid=result.get("phone_valid"),
+        phone_type=result.get("phone_type"),
+        phone_carrier=result.get("phone_carrier"),
+        phone_line_status=result.get("phone_line_status"),
+        email_valid=result.get("email_valid"),
+        email_deliverable=result.get("email_deliverable"),
+        email_disposable=result.get("email_disposable"),
+        address_valid=result.get("address_valid"),
+        address_deliverable=result.get("address_deliverable"),
+        confidence=result.get("confidence", 0.0),
+        raw_response=result.get("raw_response"),
+    )
+    db.add(validation)
+
+    # Mirror onto ContactIntelligence, if the lead has one, in a single UPDATE
+    # (no SELECT + hydrate). Only fields Melissa actually reported overwrite,
+    # and a re-validation that reports the same values rewrites nothing.
+    ci_values = {
+        column: value
+        for column, key, keep_false in _CI_VALIDATION_FIELDS
+        if (value := result.get(key)) is not None and (keep_false or value)
+    }
+    if ci_values:
+        await db.execute(
+            update(ContactIntelligence)
+            .where(
+                ContactIntelligence.lead_id == lead.id,
+                or_(*(
+                    getattr(ContactIntelligence, column).is_distinct_from(value)
+                    for column, value in ci_values.items()
+                )),
+            )
+            .values(**ci_values)
+        )
+
+    logger.info(
+        "Lead %d validated via Melissa (confidence=%.2f, phone_valid=%s)",
+        lead.id, validation.confidence, validation.phone_valid,
+    )
+    return validation
+
+
+async def enrich_lead(
+    db: AsyncSession, lead: Lead, prop: Property | None = None,
+) -> ContactEnrichment | None:
+    """Run PDL enrichment for a lead. Only enriches Hot/Warm/Scored leads.
+
+    Returns the ContactEnrichment record or None if skipped/failed.
+    Uses address-based lookup for leads without name/phone (e.g. SDAT imports).
+    Callers that already loaded the lead's Property can pass it to skip the lookup.
+    """
+    if lead.status not in _ENRICHABLE_STATUSES:
+        logger.info("Lead %d status %s — skipping enrichment", lead.id, lead.status.value)
+        return None
+
+    pdl = PDLClient()
+    if not pdl.enabled:
+        return None
+
+    if prop is None:
+        prop = await db.get(Property, lead.property_id)
+    result = await pdl.enrich_person(**_pdl_lookup_kwargs(lead, prop))
+    if not result:
+        return None
+
+    enrichment = _apply_enrichment(db, lead, prop, result)
+    if enrichment:
+        await db.flush()
+    return enrichment
+
+
 async def validate_contact(db: AsyncSession, lead: Lead) -> ContactValidation | None:
     """Run Melissa validation for a lead's contact info.
 
@@ -148,48 +237,107 @@ async def validate_contact(db: AsyncSession, lead: Lead) -> ContactValidation |
     if not result:
         return None
 
-    validation = ContactValidation(
-        lead_id=lead.id,
-        provider="melissa",
-        phone_valid=result.get("phone_valid"),
-        phone_type=result.get("phone_type"),
-        phone_carrier=result.get("phone_carrier"),
-        phone_line_status=result.get("phone_line_status"),
-        email_valid=result.get("email_valid"),
-        email_deliverable=result.get("email_deliverable"),
-        email_disposable=result.get("email_disposable"),
-        address_valid=result.get("address_valid"),
-        address_deliverable=result.get("address_deliverable"),
-        confidence=result.get("confidence", 0.0),
-        raw_response=result.get("raw_response"),
-    )
-    db.add(validation)
+    validation = await _apply_validation(db, lead, result)
+    await db.flush()
+    return validation
+
+
+async def enrich_leads(
+    db: AsyncSession, leads: list[Lead], concurrency: int | None = None,
+) -> int:
+    """Enrich (PDL) and then validate (Melissa) a batch of leads.
+
+    Provider lookups for the batch run concurrently, bounded by
+    ``concurrency`` (default: the ``enrichment_concurrency`` setting). All
+    session work stays sequential — an AsyncSession must not be used from
+    concurrent tasks. A failed lookup skips that lead without aborting the batch.
+
+    Returns the number of leads enriched.
+    """
+    pdl = PDLClient()
+    if not pdl.enabled:
+        return 0
 
-    # Also update ContactIntelligence if it exists
-    from sqlalchemy import select
-    ci_result = await db.execute(
-        select(ContactIntelligence).where(ContactIntelligence.lead_id == lead.id).limit(1)
+    leads = [lead for lead in leads if lead.status in _ENRICHABLE_STATUSES]
+    if not leads:
+        return 0
+
+    props_result = await db.execute(
+        select(Property).where(Property.id.in_({lead.property_id for lead in leads}))
+    )
+    props = {prop.id: prop for prop in props_result.scalars().all()}
+
+    if concurrency is None:
+        concurrency = get_settings().enrichment_concurrency
+    sem = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _bounded(call, **kwargs):
+        async with sem:
+            return await call(**kwargs)
+
+    lookups = await asyncio.gather(
+        *(
+            _bounded(pdl.enrich_person, **_pdl_lookup_kwargs(lead, props.get(lead.property_id)))
+            for lead in leads
+        ),
+        return_exceptions=True,
     )
-    ci = ci_result.scalar_one_or_none()
-    if ci:
-        if result.get("phone_valid") is not None:
-            ci.phone_valid = result["phone_valid"]
-        if result.get("phone_type"):
-            ci.phone_type = result["phone_type"]
-        if result.get("phone_carrier"):
-            ci.carrier_name = result["phone_carrier"]
-        if result.get("email_valid") is not None:
-            ci.email_valid = result["email_valid"]
-        if result.get("email_deliverable") is not None:
-            ci.email_deliverable = result["email_deliverable"]
 
+    enriched: list[Lead] = []
+    for lead, result in zip(leads, lookups):
+        if isinstance(result, BaseException):
+            logger.error("Lead %d enrichment failed: %s", lead.id, result)
+            continue
+        if result and _apply_enrichment(db, lead, props.get(lead.property_id), result):
+            enriched.append(lead)
     await db.flush()
 
-    logger.info(
-        "Lead %d validated via Melissa (confidence=%.2f, phone_valid=%s)",
-        lead.id, validation.confidence, validation.phone_valid,
+    melissa = MelissaClient()
+    to_validate = [lead for lead in enriched if lead.phone or lead.email] if melissa.enabled else []
+    validations = await asyncio.gather(
+        *(
+            _bounded(melissa.validate_contact, phone=lead.phone, email=lead.email)
+            for lead in to_validate
+        ),
+        return_exceptions=True,
     )
-    return validation
+    for lead, result in zip(to_validate, validations):
+        if isinstance(result, BaseException):
+            logger.error("Lead %d validation failed: %s", lead.id, result)
+            continue
+        if result:
+            await _apply_validation(db, lead, result)
+    await db.flush()
+
+    return len(enriched)
+
+
+def _namecase(name: str) -> str:
+    """Title-case a provider name ("JANE" -> "Jane", "O'BRIEN" -> "O'Brien").
+
+    Already title-cased names are returned as-is, skipping the copy.
+    """
+    return name if name.istitle() else name.title()
+
+
+def _changed(obj, **values) -> dict:
+    """Subset of values that differ from obj's current attributes."""
+    return {key: value for key, value in values.items() if getattr(obj, key) != value}
+
+
+async def _bulk_update_by_pk(db: AsyncSession, model, updates: list[tuple[object, dict]]) -> None:
+    """Write per-row changes with ORM bulk UPDATE by primary key.
+
+    The loaded instances are then brought in line with what was written via
+    set_committed_value, so they read correctly without being marked dirty
+    (which would re-issue the same UPDATEs at the next flush).
+    """
+    if not updates:
+        return
+    await db.execute(update(model), [{"id": obj.id, **changes} for obj, changes in updates])
+    for obj, changes in updates:
+        for key, value in changes.items():
+            set_committed_value(obj, key, value)
 
 
 async def skip_trace_leads(
@@ -204,9 +352,7 @@ async def skip_trace_leads(
 
     Returns summary dict: {submitted, found, not_found, errors}.
     """
-    from sqlalchemy import select
     from app.enrichment.tracerfy import TracerfyClient
-    from app.models.schema import Property
 
     client = TracerfyClient()
     if not client.enabled:
@@ -214,46 +360,63 @@ async def skip_trace_leads(
         return {"submitted": 0, "found": 0, "not_found": 0, "errors": 0,
                 "error": "TRACERFY_API_KEY not set"}
 
-    # Load leads + properties
+    # Load leads + properties in one round trip (leads without a property can't be traced)
     result = await db.execute(
-        select(Lead).where(Lead.id.in_(lead_ids))
+        select(Lead, Property)
+        .join(Property, Lead.property_id == Property.id)
+        .where(Lead.id.in_(lead_ids))
     )
-    leads = {lead.id: lead for lead in result.scalars().all()}
-
-    # Build address list for Tracerfy
-    lead_address_map: list[tuple[int, dict]] = []  # (lead_id, address_dict)
-    for lid in lead_ids:
+    leads: dict[int, Lead] = {}
+    props: dict[int, Property] = {}
+    for lead, prop in result.all():
+        leads[lead.id] = lead
+        props[prop.id] = prop
+
+    # Build address list for Tracerfy. Each unique address (case-insensitive
+    # street + zip) is submitted once — every row costs a credit — and leads
+    # sharing it are matched to the same result row.
+    addresses: list[dict] = []
+    address_index: dict[tuple[str, str], int] = {}
+    lead_address_map: list[tuple[int, int]] = []  # (lead_id, index into addresses)
+    for lid in dict.fromkeys(lead_ids):
         lead = leads.get(lid)
         if not lead:
             continue
-        prop = await db.get(Property, lead.property_id)
+        prop = props.get(lead.property_id)
         if not prop:
             continue
-        lead_address_map.append((lid, {
+        addr = {
             "address": prop.address_line1 or "",
             "city": prop.city or "",
             "state": prop.state or "MD",
             "zip_code": prop.zip_code or "",
-        }))
+        }
+        key = (addr["address"].upper(), addr["zip_code"])
+        idx = address_index.get(key)
+        if idx is None:
+            idx = address_index[key] = len(addresses)
+            addresses.append(addr)
+        lead_address_map.append((lid, idx))
 
     if not lead_address_map:
         return {"submitted": 0, "found": 0, "not_found": 0, "errors": 0}
 
-    # Submit to Tracerfy and wait
-    addresses = [addr for _, addr in lead_address_map]
-    records = await client.trace_and_wait(addresses, max_wait=max_wait)
+    # Submit to Tracerfy and wait (shared with any concurrent skip-trace calls)
+    records = await client.trace_coalesced(addresses, max_wait=max_wait)
 
     logger.info("Tracerfy returned %d results for %d submitted", len(records), len(addresses))
 
-    # Match results back to leads by address
+    # Match results back to leads by address. Pass 1 (pure Python) builds the
+    # rows to write; pass 2 writes them in bulk instead of one flush per object.
     found = 0
     not_found = 0
     errors = 0
+    enrichment_rows: list[dict] = []
+    lead_updates: list[tuple[Lead, dict]] = []
+    prop_updates: list[tuple[Property, dict]] = []
 
-    for i, (lid, addr_dict) in enumerate(lead_address_map):
-        lead = leads.get(lid)
-        if not lead:
-            continue
+    for lid, i in lead_address_map:
+        lead = leads[lid]
 
         # Results are returned in the same order as submitted
         if i >= len(records):
@@ -285,41 +448,53 @@ async def skip_trace_leads(
         if rec.first_name:
             full_name = f"{rec.first_name} {rec.last_name or ''}".strip()
 
-        # Create ContactEnrichment record
-        enrichment = ContactEnrichment(
-            lead_id=lid,
-            provider="tracerfy",
-            full_name=full_name,
-            emails=all_emails or None,
-            phones=all_phones or None,
-            confidence=0.8,  # Tracerfy address match
-        )
-        db.add(enrichment)
+        enrichment_rows.append({
+            "lead_id": lid,
+            "provider": "tracerfy",
+            "full_name": full_name,
+            "emails": all_emails or None,
+            "phones": all_phones or None,
+            "confidence": 0.8,  # Tracerfy address match
+        })
 
         # Backfill lead contact fields
-        if rec.first_name and not lead.first_name:
-            lead.first_name = rec.first_name.title()
-        if rec.last_name and not lead.last_name:
-            lead.last_name = rec.last_name.title()
-        if rec.primary_phone and not lead.phone:
-            lead.phone = rec.primary_phone
-        elif rec.mobiles and not lead.phone:
-            lead.phone = rec.mobiles[0]
-        if rec.emails and not lead.email:
-            lead.email = rec.emails[0]
+        first_name, last_name = lead.first_name, lead.last_name
+        phone, email = lead.phone, lead.email
+        if rec.first_name and not first_name:
+            first_name = _namecase(rec.first_name)
+        if rec.last_name and not last_name:
+            last_name = _namecase(rec.last_name)
+        if rec.primary_phone and not phone:
+            phone = rec.primary_phone
+        elif rec.mobiles and not phone:
+            phone = rec.mobiles[0]
+        if rec.emails and not email:
+            email = rec.emails[0]
+        lead_changes = _changed(
+            lead, first_name=first_name, last_name=last_name, phone=phone, email=email,
+        )
+        if lead_changes:
+            lead_updates.append((lead, lead_changes))
 
         # Backfill property owner fields
-        prop = await db.get(Property, lead.property_id)
+        prop = props.get(lead.property_id)
         if prop:
+            prop_fields: dict = {}
             if not prop.owner_first_name and rec.first_name:
-                prop.owner_first_name = lead.first_name
-                prop.owner_last_name = lead.last_name
-            if lead.phone and not prop.owner_phone:
-                prop.owner_phone = lead.phone
-            if lead.email and not prop.owner_email:
-                prop.owner_email = lead.email
-
-    await db.flush()
+                prop_fields["owner_first_name"] = first_name
+                prop_fields["owner_last_name"] = last_name
+            if phone and not prop.owner_phone:
+                prop_fields["owner_phone"] = phone
+            if email and not prop.owner_email:
+                prop_fields["owner_email"] = email
+            prop_changes = _changed(prop, **prop_fields)
+            if prop_changes:
+                prop_updates.append((prop, prop_changes))
+
+    # Pass 2: binary COPY of the new rows plus executemany UPDATEs by primary key
+    await bulk_copy(db, ContactEnrichment, enrichment_rows)
+    await _bulk_update_by_pk(db, Lead, lead_updates)
+    await _bulk_update_by_pk(db, Property, prop_updates)
 
     logger.info(
         "Skip-trace complete: %d submitted, %d found, %d not found",
@@ -335,16 +510,19 @@ async def skip_trace_leads(
 
 def enrich_lead_sync(db: Session, lead: Lead) -> None:
     """Synchronous wrapper for Celery tasks — runs enrichment + validation."""
-    import asyncio
     from app.core.database import async_engine
+    from app.workers.celery_app import run_async
     from sqlalchemy.ext.asyncio import AsyncSession as AS
 
     async def _run():
         async with AS(async_engine) as adb:
-            lead_obj = await adb.get(Lead, lead.id)
+            # Lead and its Property in one round trip; enrich_lead reuses prop
+            lead_obj = (await adb.execute(
+                select(Lead).options(selectinload(Lead.property)).where(Lead.id == lead.id)
+            )).scalar_one_or_none()
             if lead_obj:
-                await enrich_lead(adb, lead_obj)
+                await enrich_lead(adb, lead_obj, lead_obj.property)
                 await validate_contact(adb, lead_obj)
                 await adb.commit()
 
-    asyncio.run(_run())
+    run_async(_run())
@@ -12,18 +12,37 @@ import asyncio
 import csv
 import io
 import logging
-from dataclasses import dataclass
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 
 import httpx
+import orjson
 
-from app.core.config import get_settings
+from app.core.config import settings
+from app.core.http import LoopBoundClient
 
 logger = logging.getLogger(__name__)
 
 TRACERFY_BASE = "https://tracerfy.com/v1/api"
 
+# Shared Tracerfy client — keeps the TLS connection alive across the submit,
+# queue-polling and fetch requests of a trace (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+))
+get_client = _http.get
+close_client = _http.close
 
-@dataclass
+# Account analytics barely move over a minute; callers polling the balance
+# share one response per API key instead of a round trip each.
+_balance_cache: dict[str, tuple[float, dict]] = {}
+_BALANCE_CACHE_TTL_SECONDS = 60
+
+
+@dataclass(slots=True)
 class TraceRecord:
     """A single skip-trace result from Tracerfy."""
 
@@ -51,7 +70,6 @@ class TracerfyClient:
     """
 
     def __init__(self) -> None:
-        settings = get_settings()
         self.api_key = settings.tracerfy_api_key
 
     @property
@@ -66,18 +84,23 @@ class TracerfyClient:
         }
 
     async def check_balance(self) -> dict | None:
-        """Check account balance and stats via GET /analytics/."""
+        """Check account balance and stats via GET /analytics/ (cached for 60s)."""
         if not self.enabled:
             return None
+        now = time.monotonic()
+        cached = _balance_cache.get(self.api_key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{TRACERFY_BASE}/analytics/",
-                    headers=self._headers(),
-                    timeout=15,
-                )
-                resp.raise_for_status()
-                return resp.json()
+            resp = await get_client().get(
+                f"{TRACERFY_BASE}/analytics/",
+                headers=self._headers(),
+                timeout=15,
+            )
+            resp.raise_for_status()
+            balance = resp.json()
+            _balance_cache[self.api_key] = (now + _BALANCE_CACHE_TTL_SECONDS, balance)
+            return balance
         except httpx.HTTPError as e:
             logger.error("Tracerfy analytics error: %s", e)
             return None
@@ -103,67 +126,33 @@ class TracerfyClient:
         if not leads:
             return None
 
-        # Build CSV with all required columns (empty strings for ones we don't have)
-        csv_buffer = io.StringIO()
-        fieldnames = [
-            "address", "city", "state", "zip",
-            "first_name", "last_name",
-            "mail_address", "mail_city", "mail_state", "mailing_zip",
-        ]
-        writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
-        writer.writeheader()
-        for lead in leads:
-            writer.writerow({
-                "address": lead.get("address", ""),
-                "city": lead.get("city", ""),
-                "state": lead.get("state", ""),
-                "zip": lead.get("zip_code", ""),
-                "first_name": "",
-                "last_name": "",
-                "mail_address": "",
-                "mail_city": "",
-                "mail_state": "",
-                "mailing_zip": "",
-            })
-
-        csv_bytes = csv_buffer.getvalue().encode("utf-8")
+        # CSV rows are generated as httpx reads the multipart body, so the
+        # upload never holds the whole file in memory
+        csv_upload = _CsvUpload(_csv_rows(leads))
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{TRACERFY_BASE}/trace/",
-                    headers=self._headers(),
-                    files={"csv_file": ("leads.csv", csv_bytes, "text/csv")},
-                    data={
-                        "address_column": "address",
-                        "city_column": "city",
-                        "state_column": "state",
-                        "zip_column": "zip",
-                        "first_name_column": "first_name",
-                        "last_name_column": "last_name",
-                        "mail_address_column": "mail_address",
-                        "mail_city_column": "mail_city",
-                        "mail_state_column": "mail_state",
-                        "mailing_zip_column": "mailing_zip",
-                        "trace_type": trace_type,
-                    },
-                    timeout=30,
+            resp = await get_client().post(
+                f"{TRACERFY_BASE}/trace/",
+                headers=self._headers(),
+                files={"csv_file": ("leads.csv", csv_upload, "text/csv")},
+                data={**_CSV_COLMAP, "trace_type": trace_type},
+                timeout=30,
+            )
+
+            if resp.status_code >= 400:
+                logger.error(
+                    "Tracerfy submit error %d: %s",
+                    resp.status_code, resp.text[:500],
                 )
+                return None
 
-                if resp.status_code >= 400:
-                    logger.error(
-                        "Tracerfy submit error %d: %s",
-                        resp.status_code, resp.text[:500],
-                    )
-                    return None
-
-                data = resp.json()
-                queue_id = data.get("queue_id")
-                logger.info(
-                    "Tracerfy trace submitted: queue_id=%s, rows=%s, type=%s",
-                    queue_id, data.get("rows_uploaded"), trace_type,
-                )
-                return queue_id
+            data = resp.json()
+            queue_id = data.get("queue_id")
+            logger.info(
+                "Tracerfy trace submitted: queue_id=%s, rows=%s, type=%s",
+                queue_id, data.get("rows_uploaded"), trace_type,
+            )
+            return queue_id
 
         except httpx.HTTPError as e:
             logger.error("Tracerfy submit error: %s", e)
@@ -172,60 +161,65 @@ class TracerfyClient:
     async def poll_until_complete(
         self,
         queue_id: int,
-        poll_interval: int = 5,
+        poll_interval: int = 1,
         max_wait: int = 300,
+        max_interval: int = 30,
     ) -> list[TraceRecord]:
         """Poll GET /queues/ until our queue is complete, then fetch records.
 
+        Polls back off exponentially (1s, 2s, 4s, ... capped at max_interval),
+        so short jobs are picked up quickly and long ones don't cost a request
+        every few seconds.
+
         Args:
             queue_id: The queue ID from submit_trace()
-            poll_interval: Seconds between polls
+            poll_interval: Seconds before the second poll (doubles each time)
             max_wait: Maximum seconds to wait before giving up
+            max_interval: Upper bound on the delay between polls
 
         Returns:
             List of TraceRecord results.
         """
         elapsed = 0
+        delay = poll_interval
 
         while elapsed < max_wait:
             try:
-                async with httpx.AsyncClient() as client:
-                    # Check queue status via GET /queues/
-                    resp = await client.get(
-                        f"{TRACERFY_BASE}/queues/",
-                        headers=self._headers(),
-                        timeout=15,
+                # Check queue status via GET /queues/
+                resp = await get_client().get(
+                    f"{TRACERFY_BASE}/queues/",
+                    headers=self._headers(),
+                    timeout=15,
+                )
+                resp.raise_for_status()
+                queues = resp.json()
+
+                # Find our queue
+                our_queue = next((q for q in queues if q.get("id") == queue_id), None)
+
+                if our_queue and not our_queue.get("pending", True):
+                    # Queue complete — fetch records via GET /queue/:id
+                    logger.info(
+                        "Tracerfy queue %d complete (rows=%s, credits=%s)",
+                        queue_id,
+                        our_queue.get("rows_uploaded"),
+                        our_queue.get("credits_deducted"),
                     )
-                    resp.raise_for_status()
-                    queues = resp.json()
-
-                    # Find our queue
-                    our_queue = None
-                    for q in queues:
-                        if q.get("id") == queue_id:
-                            our_queue = q
-                            break
-
-                    if our_queue and not our_queue.get("pending", True):
-                        # Queue complete — fetch records via GET /queue/:id
-                        logger.info(
-                            "Tracerfy queue %d complete (rows=%s, credits=%s)",
-                            queue_id,
-                            our_queue.get("rows_uploaded"),
-                            our_queue.get("credits_deducted"),
-                        )
-                        return await self._fetch_records(queue_id)
-
-                    if our_queue:
-                        logger.debug("Tracerfy queue %d still pending (%ds elapsed)", queue_id, elapsed)
-                    else:
-                        logger.warning("Tracerfy queue %d not found in queues list", queue_id)
+                    return await self._fetch_records(queue_id)
+
+                if our_queue:
+                    logger.debug("Tracerfy queue %d still pending (%ds elapsed)", queue_id, elapsed)
+                else:
+                    logger.warning("Tracerfy queue %d not found in queues list", queue_id)
 
             except httpx.HTTPError as e:
                 logger.error("Tracerfy poll error: %s", e)
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            # Never sleep past the deadline
+            step = min(delay, max_wait - elapsed)
+            await asyncio.sleep(step)
+            elapsed += step
+            delay = min(delay * 2, max_interval)
 
         logger.warning("Tracerfy queue %d timed out after %ds", queue_id, max_wait)
         return []
@@ -233,21 +227,23 @@ class TracerfyClient:
     async def _fetch_records(self, queue_id: int) -> list[TraceRecord]:
         """Fetch trace records via GET /queue/:id — returns JSON array directly."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{TRACERFY_BASE}/queue/{queue_id}",
-                    headers=self._headers(),
-                    timeout=30,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                # API returns a direct JSON array of record objects
-                if isinstance(data, list):
-                    return [_parse_record(r) for r in data]
-
-                logger.warning("Unexpected queue response type: %s", type(data).__name__)
-                return []
+            resp = await get_client().get(
+                f"{TRACERFY_BASE}/queue/{queue_id}",
+                headers=self._headers(),
+                timeout=30,
+            )
+            resp.raise_for_status()
+            # Result arrays run to thousands of rows; orjson decodes them far
+            # faster than the stdlib json behind resp.json()
+            data = orjson.loads(resp.content)
+
+            # API returns a direct JSON array of record objects. Callers slice
+            # and index the result positionally, so it stays a list.
+            if isinstance(data, list):
+                return list(map(_parse_record, data))
+
+            logger.warning("Unexpected queue response type: %s", type(data).__name__)
+            return []
 
         except httpx.HTTPError as e:
             logger.error("Tracerfy fetch records error: %s", e)
@@ -276,42 +272,180 @@ class TracerfyClient:
         logger.info("Waiting for Tracerfy queue %d (%d leads)...", queue_id, len(leads))
         return await self.poll_until_complete(queue_id, max_wait=max_wait)
 
+    async def trace_coalesced(
+        self,
+        leads: list[dict],
+        trace_type: str = "normal",
+        max_wait: int = 300,
+    ) -> list[TraceRecord]:
+        """Like trace_and_wait, but shares one trace with concurrent callers.
+
+        Leads arriving within a short window are submitted together; each
+        caller gets back only the records for its own leads, in its order.
+        """
+        if not leads:
+            return []
+
+        loop = asyncio.get_running_loop()
+        key = (loop, self.api_key, trace_type)
+        batch = _pending_traces.get(key)
+        if batch is None:
+            batch = _pending_traces[key] = _PendingTrace(self, trace_type)
+            batch.timer = loop.call_later(_COALESCE_WINDOW_SECONDS, _flush_trace, key)
+
+        waiter: asyncio.Future[list[TraceRecord]] = loop.create_future()
+        batch.waiters.append((len(batch.leads), len(leads), waiter))
+        batch.leads.extend(leads)
+        batch.max_wait = max(batch.max_wait, max_wait)
+
+        if len(batch.leads) >= _COALESCE_MAX_ROWS:
+            batch.timer.cancel()
+            _flush_trace(key)
+        return await waiter
+
+
+# Concurrent skip-trace calls would each pay a full submit -> poll -> fetch
+# cycle. The first caller opens a short window that later callers join; the
+# window closes early once it holds enough rows to be worth sending.
+_COALESCE_WINDOW_SECONDS = 0.5
+_COALESCE_MAX_ROWS = 100
+
+
+@dataclass(slots=True)
+class _PendingTrace:
+    """Leads collected in one coalescing window, plus who is waiting on them."""
+
+    client: TracerfyClient
+    trace_type: str
+    leads: list[dict] = field(default_factory=list)
+    # (offset into leads, row count, future resolved with that caller's records)
+    waiters: list[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    max_wait: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+_pending_traces: dict[tuple[asyncio.AbstractEventLoop, str, str], _PendingTrace] = {}
+_running_traces: set[asyncio.Task] = set()  # strong refs until each trace finishes
+
+
+def _flush_trace(key: tuple[asyncio.AbstractEventLoop, str, str]) -> None:
+    """Close a coalescing window and run its combined trace in the background."""
+    batch = _pending_traces.pop(key, None)
+    if batch is None:
+        return
+    task = key[0].create_task(_run_trace(batch))
+    _running_traces.add(task)
+    task.add_done_callback(_running_traces.discard)
+
+
+async def _run_trace(batch: _PendingTrace) -> None:
+    """Submit a window's leads as one trace and hand each caller its slice."""
+    try:
+        records = await batch.client.trace_and_wait(
+            batch.leads, batch.trace_type, max_wait=batch.max_wait,
+        )
+    except Exception as e:
+        for _, _, waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_exception(e)
+        return
+
+    # Results come back in submission order, so each caller's rows are a slice
+    for start, count, waiter in batch.waiters:
+        if not waiter.done():
+            waiter.set_result(records[start:start + count])
+
+
+# Upload CSV columns — all required by /trace/; we only ever know the address
+_CSV_FIELDS = (
+    "address", "city", "state", "zip",
+    "first_name", "last_name",
+    "mail_address", "mail_city", "mail_state", "mailing_zip",
+)
+_CSV_BLANK_TAIL = ("",) * (len(_CSV_FIELDS) - 4)
+# Form fields telling /trace/ which CSV column holds what ("<field>_column")
+_CSV_COLMAP = {f"{name}_column": name for name in _CSV_FIELDS}
+
+
+def _csv_rows(leads: Iterable[dict]) -> Iterator[bytes]:
+    """Yield the trace CSV (header first) one encoded row at a time."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(_CSV_FIELDS)
+    for lead in leads:
+        writer.writerow((
+            lead.get("address", ""),
+            lead.get("city", ""),
+            lead.get("state", ""),
+            lead.get("zip_code", ""),
+            *_CSV_BLANK_TAIL,
+        ))
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():  # header-only CSV
+        yield buf.getvalue().encode("utf-8")
+
+
+class _CsvUpload:
+    """Read-only binary file over generated CSV rows.
+
+    httpx streams multipart file fields by calling read(); with no fileno/seek
+    the body is sent chunked instead of being buffered to compute a length.
+    """
+
+    def __init__(self, rows: Iterator[bytes]) -> None:
+        self._rows = rows
+        self._pending = b""
+
+    def read(self, size: int = -1) -> bytes:
+        parts = [self._pending]
+        n = len(self._pending)
+        while size < 0 or n < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            parts.append(row)
+            n += len(row)
+        data = b"".join(parts)
+        if size < 0:
+            self._pending = b""
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+
+# Numbered contact columns in a Tracerfy result row
+_MOBILE_KEYS = tuple(f"mobile_{i}" for i in range(1, 6))
+_LANDLINE_KEYS = tuple(f"landline_{i}" for i in range(1, 4))
+_EMAIL_KEYS = tuple(f"email_{i}" for i in range(1, 6))
+
+
+def _collect(row: dict, keys: tuple[str, ...]) -> list[str] | None:
+    """Stripped, non-empty values of the given columns, or None if there are none."""
+    values = [v for k in keys if (v := (row.get(k) or "").strip())]
+    return values or None
+
+
+def _text(row: dict, key: str) -> str | None:
+    """Stripped column value, or None if missing/blank."""
+    return (row.get(key) or "").strip() or None
+
 
 def _parse_record(row: dict) -> TraceRecord:
     """Parse a single Tracerfy result row into a TraceRecord."""
-    # Collect all mobile phones
-    mobiles = []
-    for i in range(1, 6):
-        m = row.get(f"mobile_{i}", "")
-        if m and m.strip():
-            mobiles.append(m.strip())
-
-    # Collect all landlines
-    landlines = []
-    for i in range(1, 4):
-        ll = row.get(f"landline_{i}", "")
-        if ll and ll.strip():
-            landlines.append(ll.strip())
-
-    # Collect all emails
-    emails = []
-    for i in range(1, 6):
-        e = row.get(f"email_{i}", "")
-        if e and e.strip():
-            emails.append(e.strip())
-
     return TraceRecord(
         address=row.get("address", ""),
         city=row.get("city", ""),
         state=row.get("state", ""),
-        first_name=row.get("first_name", "").strip() or None,
-        last_name=row.get("last_name", "").strip() or None,
-        primary_phone=row.get("primary_phone", "").strip() or None,
-        primary_phone_type=row.get("primary_phone_type", "").strip() or None,
-        mobiles=mobiles or None,
-        landlines=landlines or None,
-        emails=emails or None,
-        mail_address=row.get("mail_address", "").strip() or None,
-        mail_city=row.get("mail_city", "").strip() or None,
-        mail_state=row.get("mail_state", "").strip() or None,
+        first_name=_text(row, "first_name"),
+        last_name=_text(row, "last_name"),
+        primary_phone=_text(row, "primary_phone"),
+        primary_phone_type=_text(row, "primary_phone_type"),
+        mobiles=_collect(row, _MOBILE_KEYS),
+        landlines=_collect(row, _LANDLINE_KEYS),
+        emails=_collect(row, _EMAIL_KEYS),
+        mail_address=_text(row, "mail_address"),
+        mail_city=_text(row, "mail_city"),
+        mail_state=_text(row, "mail_state"),
     )
@@ -6,7 +6,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import admin, ai_routes, appointments, auth, cost_center, dashboard, deals, discovery, insights, leads, messages, nba, outreach, portal, qa, sales_board, scripts, vapi_tools, webhooks
+from app.ai import client as claude_client
+from app.connectors import md_sdat
+from app.core import cache
 from app.core.config import get_settings
+from app.enrichment import melissa, pdl, tracerfy
+from app.services import ai_client
 
 
 @asynccontextmanager
@@ -16,6 +21,13 @@ async def lifespan(app: FastAPI):
     print(f"Starting {settings.app_name}...")
     yield
     print(f"Shutting down {settings.app_name}...")
+    await md_sdat.close_client()
+    await melissa.close_client()
+    await pdl.close_client()
+    await tracerfy.close_client()
+    await ai_client.close_client()
+    await claude_client.close_client()
+    await cache.close_redis()
 
 
 app = FastAPI(
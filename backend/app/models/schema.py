@@ -4,18 +4,27 @@ import enum
 from datetime import datetime
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    Column,
+    Computed,
     DateTime,
     Enum,
+    FetchedValue,
     Float,
     ForeignKey,
     Index,
     Integer,
+    MetaData,
+    PrimaryKeyConstraint,
+    SmallInteger,
     String,
+    Table,
     Text,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import INET, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -113,6 +122,17 @@ class Property(Base):
     city: Mapped[str] = mapped_column(String(100), nullable=False)
     state: Mapped[str] = mapped_column(String(2), nullable=False, default="MD")
     zip_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    # "line1, city, state, zip" (blank parts skipped), maintained by Postgres
+    address_full: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            "rtrim(coalesce(nullif(address_line1, '') || ', ', '')"
+            " || coalesce(nullif(city, '') || ', ', '')"
+            " || coalesce(nullif(state, '') || ', ', '')"
+            " || coalesce(zip_code, ''), ', ')",
+            persisted=True,
+        ),
+    )
     county: Mapped[str] = mapped_column(String(100), nullable=False)
     parcel_id: Mapped[str | None] = mapped_column(String(50), unique=True)
 
@@ -120,7 +140,7 @@ class Property(Base):
     property_type: Mapped[PropertyType] = mapped_column(
         Enum(PropertyType), default=PropertyType.SFH
     )
-    year_built: Mapped[int | None] = mapped_column(Integer)
+    year_built: Mapped[int | None] = mapped_column(SmallInteger)
     roof_area_sqft: Mapped[float | None] = mapped_column(Float)
     assessed_value: Mapped[float | None] = mapped_column(Float)
     lot_size_sqft: Mapped[float | None] = mapped_column(Float)
@@ -151,8 +171,9 @@ class Property(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Set by the set_updated_at trigger (migration 031)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -162,7 +183,32 @@ class Property(Base):
         Index("ix_property_county", "county"),
         Index("ix_property_zip", "zip_code"),
         Index("ix_property_state", "state"),
-    )
+        # Dedup key for ingest (ON CONFLICT DO NOTHING) — created by migration 008
+        Index(
+            "ix_property_addr_zip",
+            text("upper(address_line1)"),
+            "zip_code",
+            unique=True,
+            postgresql_where=text("address_line1 IS NOT NULL AND zip_code IS NOT NULL"),
+        ),
+        # JSONB containment (@>) lookups; jsonb_path_ops keeps the GIN small (migration 021)
+        Index(
+            "ix_property_raw_data_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
+        # Substring search (ILIKE '%main st%') in the lead list (migration 025)
+        Index(
+            "ix_property_address_trgm",
+            "address_line1",
+            postgresql_using="gin",
+            postgresql_ops={"address_line1": "gin_trgm_ops"},
+        ),
+    )
+    # Fetch address_full back via RETURNING on UPDATE too, so an enriched
+    # property never needs a lazy refresh (illegal under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class Lead(Base):
@@ -185,12 +231,21 @@ class Lead(Base):
     last_name: Mapped[str | None] = mapped_column(String(100))
     phone: Mapped[str | None] = mapped_column(String(20))
     email: Mapped[str | None] = mapped_column(String(255))
+    # Last 10 digits of phone, maintained by Postgres — indexed lookup for inbound numbers
+    phone_last10: Mapped[str | None] = mapped_column(
+        String(10), Computed(r"right(regexp_replace(phone, '\D', '', 'g'), 10)", persisted=True)
+    )
+
+    # Latest LeadScore, copied by the lead_score insert trigger (migration 019)
+    # so ranking by score doesn't have to join lead_score
+    current_score: Mapped[int | None] = mapped_column(SmallInteger)
+    current_score_scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     # Outreach tracking
     last_contacted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    total_call_attempts: Mapped[int] = mapped_column(Integer, default=0)
-    total_sms_sent: Mapped[int] = mapped_column(Integer, default=0)
-    total_emails_sent: Mapped[int] = mapped_column(Integer, default=0)
+    total_call_attempts: Mapped[int] = mapped_column(SmallInteger, default=0)
+    total_sms_sent: Mapped[int] = mapped_column(SmallInteger, default=0)
+    total_emails_sent: Mapped[int] = mapped_column(SmallInteger, default=0)
     next_outreach_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     next_outreach_channel: Mapped[ContactChannel | None] = mapped_column(
         Enum(ContactChannel)
@@ -200,52 +255,126 @@ class Lead(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Set by the set_updated_at trigger (migration 031)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
+    # The per-lead histories raise instead of lazy loading, so iterating a page
+    # of leads can't silently issue one query per lead; load them explicitly
+    # with selectinload (see app.api.leads.leads_with_full_context).
     property: Mapped["Property"] = relationship(back_populates="lead")
+    # passive_deletes: the database cascades lead deletes (ON DELETE CASCADE,
+    # migration 022), so the ORM doesn't load children to delete them one by one.
     scores: Mapped[list["LeadScore"]] = relationship(
-        back_populates="lead", order_by="desc(LeadScore.scored_at)"
+        back_populates="lead",
+        order_by="desc(LeadScore.scored_at)",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     outreach_attempts: Mapped[list["OutreachAttempt"]] = relationship(
-        back_populates="lead"
+        back_populates="lead", lazy="raise_on_sql", passive_deletes=True
+    )
+    consent_logs: Mapped[list["ConsentLog"]] = relationship(
+        back_populates="lead", lazy="raise_on_sql"
+    )
+    appointments: Mapped[list["Appointment"]] = relationship(
+        back_populates="lead", lazy="raise_on_sql"
+    )
+    notes: Mapped[list["Note"]] = relationship(
+        back_populates="lead",
+        order_by="desc(Note.created_at)",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
-    consent_logs: Mapped[list["ConsentLog"]] = relationship(back_populates="lead")
-    appointments: Mapped[list["Appointment"]] = relationship(back_populates="lead")
-    notes: Mapped[list["Note"]] = relationship(back_populates="lead")
     assigned_rep: Mapped["RepUser | None"] = relationship(back_populates="assigned_leads")
 
     __table_args__ = (
-        Index("ix_lead_status", "status"),
+        # Only the in-pipeline statuses are selective enough to be worth an
+        # index; the bulk (ingested/scored/cool) and terminal states are left
+        # out to keep it small (migration 013)
+        Index(
+            "ix_lead_status_active",
+            "status",
+            postgresql_where=text(
+                "status IN ('hot', 'warm', 'contacting', 'contacted', 'qualified', "
+                "'appointment_set', 'nurturing', 'closed_won')"
+            ),
+        ),
         Index("ix_lead_next_outreach", "next_outreach_at"),
+        # A rep's follow-ups due (sales board): index-only count (migration 014)
+        Index(
+            "ix_lead_rep_outreach_due",
+            "assigned_rep_id",
+            "next_outreach_at",
+            postgresql_include=["status"],
+            postgresql_where=text("next_outreach_at IS NOT NULL"),
+        ),
         Index("ix_lead_assigned_rep", "assigned_rep_id"),
-    )
+        Index("ix_lead_phone_last10", "phone_last10"),
+        # Trigram indexes for the lead list's ILIKE '%q%' search (migration 025)
+        Index(
+            "ix_lead_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_lead_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_lead_phone_trgm",
+            "phone",
+            postgresql_using="gin",
+            postgresql_ops={"phone": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_lead_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        # Top-N by score, newest first among ties (discovery/activation lists)
+        Index(
+            "ix_lead_current_score",
+            text("current_score DESC NULLS LAST"),
+            text("created_at DESC"),
+        ),
+        # Leave free space per page so counter/timestamp updates, which touch no
+        # indexed column, can stay HOT and skip index maintenance (migration 026)
+        {"postgresql_with": {"fillfactor": "80"}},
+    )
+    # Fetch the trigger-maintained updated_at back via RETURNING on UPDATE, so
+    # reading it after a flush never needs a lazy refresh (illegal under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class LeadScore(Base):
     __tablename__ = "lead_score"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
 
-    total_score: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     score_version: Mapped[str] = mapped_column(
         String(10), nullable=False, default="v1"
     )
 
     # Individual factor scores (for explainability)
-    roof_age_score: Mapped[int] = mapped_column(Integer, default=0)
-    ownership_score: Mapped[int] = mapped_column(Integer, default=0)
-    roof_area_score: Mapped[int] = mapped_column(Integer, default=0)
-    home_value_score: Mapped[int] = mapped_column(Integer, default=0)
-    utility_rate_score: Mapped[int] = mapped_column(Integer, default=0)
-    shade_score: Mapped[int] = mapped_column(Integer, default=0)
-    neighborhood_score: Mapped[int] = mapped_column(Integer, default=0)
-    income_score: Mapped[int] = mapped_column(Integer, default=0)
-    property_type_score: Mapped[int] = mapped_column(Integer, default=0)
-    existing_solar_score: Mapped[int] = mapped_column(Integer, default=0)
+    roof_age_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    ownership_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    roof_area_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    home_value_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    utility_rate_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    shade_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    neighborhood_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    income_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    property_type_score: Mapped[int] = mapped_column(SmallInteger, default=0)
+    existing_solar_score: Mapped[int] = mapped_column(SmallInteger, default=0)
 
     scored_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -255,16 +384,30 @@ class LeadScore(Base):
     lead: Mapped["Lead"] = relationship(back_populates="scores")
 
     __table_args__ = (
-        Index("ix_lead_score_lead_id", "lead_id"),
-        Index("ix_lead_score_total", "total_score"),
+        # Serves lead_id lookups and the newest-first Lead.scores load; INCLUDE
+        # makes "latest total_score for a lead" an index-only probe (migration 030)
+        Index(
+            "ix_lead_score_latest",
+            "lead_id",
+            text("scored_at DESC"),
+            postgresql_include=["total_score"],
+        ),
+        # Append-only, so scored_at follows the heap order: a BRIN index answers
+        # "scored in the last N days" range scans at a tiny size (migration 024)
+        Index(
+            "ix_lead_score_scored_at_brin",
+            "scored_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": "32"},
+        ),
     )
 
 
 class OutreachAttempt(Base):
     __tablename__ = "outreach_attempt"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     channel: Mapped[ContactChannel] = mapped_column(
         Enum(ContactChannel), nullable=False
     )
@@ -303,13 +446,23 @@ class OutreachAttempt(Base):
         Index("ix_outreach_lead_id", "lead_id"),
         Index("ix_outreach_channel", "channel"),
         Index("ix_outreach_started_at", "started_at"),
+        # Outreach queue poll: attempts with no disposition yet (migration 014)
+        Index("ix_outreach_pending", "id", postgresql_where=text("disposition IS NULL")),
+        Index(
+            "ix_outreach_qualification_gin",
+            "qualification_data",
+            postgresql_using="gin",
+            postgresql_ops={"qualification_data": "jsonb_path_ops"},
+        ),
     )
 
 
 class ConsentLog(Base):
     __tablename__ = "consent_log"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # No ON DELETE CASCADE: opt-out evidence must block deleting the lead,
+    # not disappear with it
     lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
     consent_type: Mapped[ConsentType] = mapped_column(
         Enum(ConsentType), nullable=False
@@ -328,7 +481,7 @@ class ConsentLog(Base):
     evidence_url: Mapped[str | None] = mapped_column(
         String(500)
     )  # recording URL, screenshot, etc.
-    ip_address: Mapped[str | None] = mapped_column(String(45))
+    ip_address: Mapped[str | None] = mapped_column(INET)
     user_agent: Mapped[str | None] = mapped_column(String(500))
 
     recorded_at: Mapped[datetime] = mapped_column(
@@ -341,6 +494,13 @@ class ConsentLog(Base):
     __table_args__ = (
         Index("ix_consent_lead_id", "lead_id"),
         Index("ix_consent_status", "status"),
+        # Subnet lookups (ip_address <<= '203.0.113.0/24') for consent review (migration 027)
+        Index(
+            "ix_consent_ip_gist",
+            "ip_address",
+            postgresql_using="gist",
+            postgresql_ops={"ip_address": "inet_ops"},
+        ),
     )
 
 
@@ -366,8 +526,9 @@ class Appointment(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Set by the set_updated_at trigger (migration 031)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -378,7 +539,17 @@ class Appointment(Base):
         Index("ix_appointment_rep_id", "rep_id"),
         Index("ix_appointment_scheduled", "scheduled_start"),
         Index("ix_appointment_status", "status"),
+        # A rep's upcoming appointments (sales board) — created by migration 013
+        Index(
+            "ix_appointment_upcoming",
+            "rep_id",
+            "scheduled_start",
+            postgresql_where=text("status IN ('scheduled', 'confirmed')"),
+        ),
     )
+    # Fetch the trigger-maintained updated_at back via RETURNING on UPDATE, so
+    # reading it after a flush never needs a lazy refresh (illegal under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class RepUser(Base):
@@ -399,9 +570,15 @@ class RepUser(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
-    # Relationships
-    appointments: Mapped[list["Appointment"]] = relationship(back_populates="rep")
-    assigned_leads: Mapped[list["Lead"]] = relationship(back_populates="assigned_rep")
+    # Relationships — never loaded implicitly: RepUser is fetched on every
+    # authenticated request, so a stray attribute access must not add queries.
+    # Use selectinload() where a collection is actually needed.
+    appointments: Mapped[list["Appointment"]] = relationship(
+        back_populates="rep", lazy="raise_on_sql"
+    )
+    assigned_leads: Mapped[list["Lead"]] = relationship(
+        back_populates="assigned_rep", lazy="raise_on_sql"
+    )
 
 
 class ScriptVersion(Base):
@@ -424,9 +601,10 @@ class ScriptVersion(Base):
 
 
 class AuditLog(Base):
+    """Append-only audit trail, range-partitioned by month on created_at (migration 015)."""
     __tablename__ = "audit_log"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, autoincrement=True)
     actor: Mapped[str] = mapped_column(
         String(100), nullable=False
     )  # "system", "ai_agent", user email
@@ -436,7 +614,7 @@ class AuditLog(Base):
     entity_type: Mapped[str] = mapped_column(
         String(50), nullable=False
     )  # "lead", "property", "appointment"
-    entity_id: Mapped[int | None] = mapped_column(Integer)
+    entity_id: Mapped[int | None] = mapped_column(BigInteger)
     old_value: Mapped[str | None] = mapped_column(Text)
     new_value: Mapped[str | None] = mapped_column(Text)
     metadata_json: Mapped[dict | None] = mapped_column(JSONB)
@@ -446,17 +624,22 @@ class AuditLog(Base):
     )
 
     __table_args__ = (
+        # Partitioned tables need the partition key in the primary key
+        PrimaryKeyConstraint("id", "created_at"),
         Index("ix_audit_entity", "entity_type", "entity_id"),
         Index("ix_audit_created_at", "created_at"),
         Index("ix_audit_actor", "actor"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    # id alone (from a sequence) still identifies a row for the ORM
+    __mapper_args__ = {"primary_key": [id]}
 
 
 class Note(Base):
     __tablename__ = "note"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     author: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -507,7 +690,7 @@ class ContactIntelligence(Base):
     __tablename__ = "contact_intelligence"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
 
     # Phone validation
     phone_valid: Mapped[bool | None] = mapped_column(Boolean)
@@ -519,8 +702,8 @@ class ContactIntelligence(Base):
     email_deliverable: Mapped[bool | None] = mapped_column(Boolean)
 
     # Best contact time (learned from response patterns)
-    best_call_hour: Mapped[int | None] = mapped_column(Integer)  # 0-23 ET
-    best_sms_hour: Mapped[int | None] = mapped_column(Integer)
+    best_call_hour: Mapped[int | None] = mapped_column(SmallInteger)  # 0-23 ET
+    best_sms_hour: Mapped[int | None] = mapped_column(SmallInteger)
     timezone: Mapped[str] = mapped_column(String(50), default="America/New_York")
 
     # Provider raw response
@@ -529,23 +712,28 @@ class ContactIntelligence(Base):
     validated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Set by the set_updated_at trigger (migration 031)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     lead: Mapped["Lead"] = relationship()
 
     __table_args__ = (
-        Index("ix_ci_lead_id", "lead_id"),
+        # One row per lead — validation mirrors onto it by lead_id (migration 012)
+        Index("ix_ci_lead_id", "lead_id", unique=True),
     )
+    # Fetch the trigger-maintained updated_at back via RETURNING on UPDATE, so
+    # reading it after a flush never needs a lazy refresh (illegal under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class InboundMessage(Base):
     """SMS inbound/outbound message tracking with threading."""
     __tablename__ = "inbound_message"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
 
     direction: Mapped[MessageDirection] = mapped_column(
         Enum(MessageDirection), nullable=False
@@ -570,7 +758,9 @@ class InboundMessage(Base):
     # Tracking
     sent_by: Mapped[str | None] = mapped_column(String(100))  # "ai_agent", "rep:email", "system"
     script_version_id: Mapped[int | None] = mapped_column(ForeignKey("script_version.id"))
-    outreach_attempt_id: Mapped[int | None] = mapped_column(ForeignKey("outreach_attempt.id"))
+    outreach_attempt_id: Mapped[int | None] = mapped_column(
+        ForeignKey("outreach_attempt.id", ondelete="SET NULL")
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -590,11 +780,14 @@ class ConversationTranscript(Base):
     """Call/SMS transcript storage with AI-generated summary."""
     __tablename__ = "conversation_transcript"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     channel: Mapped[ContactChannel] = mapped_column(Enum(ContactChannel), nullable=False)
-    outreach_attempt_id: Mapped[int | None] = mapped_column(ForeignKey("outreach_attempt.id"))
+    outreach_attempt_id: Mapped[int | None] = mapped_column(
+        ForeignKey("outreach_attempt.id", ondelete="SET NULL")
+    )
 
+    # Large text/JSONB here is TOASTed with LZ4 where available (migration 016)
     raw_transcript: Mapped[str] = mapped_column(Text, nullable=False)
     ai_summary: Mapped[str | None] = mapped_column(Text)
     ai_sentiment: Mapped[str | None] = mapped_column(String(20))  # positive, neutral, negative
@@ -621,6 +814,12 @@ class ConversationTranscript(Base):
         Index("ix_transcript_lead_id", "lead_id"),
         Index("ix_transcript_created_at", "created_at"),
         Index("ix_transcript_call_sid", "call_sid"),
+        Index(
+            "ix_transcript_ai_output_gin",
+            "ai_output",
+            postgresql_using="gin",
+            postgresql_ops={"ai_output": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -629,12 +828,12 @@ class QAReview(Base):
     __tablename__ = "qa_review"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     conversation_id: Mapped[int | None] = mapped_column(
-        ForeignKey("conversation_transcript.id")
+        ForeignKey("conversation_transcript.id", ondelete="CASCADE")
     )
 
-    compliance_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 0-100
+    compliance_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 0-100
     flags: Mapped[dict | None] = mapped_column(JSONB)  # [{"flag": "...", "severity": "..."}]
     checklist_pass: Mapped[bool] = mapped_column(Boolean, default=True)
     rationale: Mapped[str | None] = mapped_column(Text)
@@ -654,6 +853,14 @@ class QAReview(Base):
         Index("ix_qa_lead_id", "lead_id"),
         Index("ix_qa_compliance_score", "compliance_score"),
         Index("ix_qa_created_at", "created_at"),
+        # Admin queue: flagged_only filter ordered by newest first
+        Index(
+            "ix_qa_flagged_recent",
+            text("created_at DESC"),
+            postgresql_where=text("checklist_pass = false"),
+        ),
+        # Admin queue: min_score/max_score range ordered by newest first
+        Index("ix_qa_score_recent", "compliance_score", text("created_at DESC")),
     )
 
 
@@ -661,11 +868,11 @@ class ObjectionTag(Base):
     """Objections extracted from conversations."""
     __tablename__ = "objection_tag"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     conversation_id: Mapped[int] = mapped_column(
-        ForeignKey("conversation_transcript.id"), nullable=False
+        ForeignKey("conversation_transcript.id", ondelete="CASCADE"), nullable=False
     )
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
 
     tag: Mapped[str] = mapped_column(String(100), nullable=False)  # "too_expensive", "roof_condition"
     confidence: Mapped[float] = mapped_column(Float, default=0.0)
@@ -689,8 +896,8 @@ class NBADecision(Base):
     """Next-Best-Action recommendation for a lead."""
     __tablename__ = "nba_decision"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
 
     recommended_action: Mapped[NBAAction] = mapped_column(
         Enum(NBAAction), nullable=False
@@ -717,9 +924,16 @@ class NBADecision(Base):
     lead: Mapped["Lead"] = relationship()
 
     __table_args__ = (
-        Index("ix_nba_lead_id", "lead_id"),
+        # Latest decision per lead: lead_id = ? ORDER BY created_at DESC LIMIT 1
+        Index("ix_nba_lead_latest", "lead_id", text("created_at DESC")),
         Index("ix_nba_created_at", "created_at"),
         Index("ix_nba_expires_at", "expires_at"),
+        Index(
+            "ix_nba_reason_codes_gin",
+            "reason_codes",
+            postgresql_using="gin",
+            postgresql_ops={"reason_codes": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -764,13 +978,18 @@ class ScriptExperiment(Base):
 
 
 class AIRun(Base):
-    """Audit trail for every AI API call — reproducibility + cost tracking."""
+    """Audit trail for every AI API call — reproducibility + cost tracking.
+
+    Range-partitioned by month on created_at (migration 015).
+    """
     __tablename__ = "ai_run"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, autoincrement=True)
     task_type: Mapped[str] = mapped_column(String(50), nullable=False)  # nba, qa, objection_tags, rep_brief, etc.
-    lead_id: Mapped[int | None] = mapped_column(ForeignKey("lead.id"))
-    conversation_id: Mapped[int | None] = mapped_column(ForeignKey("conversation_transcript.id"))
+    lead_id: Mapped[int | None] = mapped_column(ForeignKey("lead.id", ondelete="SET NULL"))
+    conversation_id: Mapped[int | None] = mapped_column(
+        ForeignKey("conversation_transcript.id", ondelete="SET NULL")
+    )
 
     # Model config (for reproducibility)
     model: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -796,11 +1015,14 @@ class AIRun(Base):
     )
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at"),
         Index("ix_ai_run_task_type", "task_type"),
         Index("ix_ai_run_lead_id", "lead_id"),
         Index("ix_ai_run_created_at", "created_at"),
         Index("ix_ai_run_status", "status"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
 
 
 class AIMemory(Base):
@@ -834,7 +1056,7 @@ class ContactEnrichment(Base):
     __tablename__ = "contact_enrichment"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     provider: Mapped[str] = mapped_column(String(50), nullable=False)  # pdl, clearbit, etc.
 
     full_name: Mapped[str | None] = mapped_column(String(200))
@@ -856,6 +1078,13 @@ class ContactEnrichment(Base):
 
     __table_args__ = (
         Index("ix_enrichment_lead_id", "lead_id"),
+        # Provider-facet containment lookups (raw_response @> ...) (migration 029)
+        Index(
+            "ix_enrichment_raw_gin",
+            "raw_response",
+            postgresql_using="gin",
+            postgresql_ops={"raw_response": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -864,7 +1093,7 @@ class ContactValidation(Base):
     __tablename__ = "contact_validation"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id"), nullable=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("lead.id", ondelete="CASCADE"), nullable=False)
     provider: Mapped[str] = mapped_column(String(50), nullable=False)  # melissa, twilio_lookup
 
     # Phone validation
@@ -896,6 +1125,12 @@ class ContactValidation(Base):
 
     __table_args__ = (
         Index("ix_validation_lead_id", "lead_id"),
+        Index(
+            "ix_validation_raw_gin",
+            "raw_response",
+            postgresql_using="gin",
+            postgresql_ops={"raw_response": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -976,3 +1211,20 @@ class Sale(Base):
         Index("ix_sale_status", "status"),
         Index("ix_sale_date", "sale_date"),
     )
+
+
+# ── Materialized views ────────────────────────────────────────────────────
+# Read-only, created in SQL and refreshed by a worker task. Kept on their own
+# MetaData so create_all/autogenerate never mistake them for tables.
+
+views_metadata = MetaData()
+
+# Lead counts per (status, assigned rep) for dashboard aggregates (migration
+# 028); refreshed every minute by app.workers.tasks.refresh_lead_status_counts
+lead_status_counts = Table(
+    "mv_lead_status_counts",
+    views_metadata,
+    Column("status", Enum(LeadStatus), nullable=False),
+    Column("assigned_rep_id", Integer),
+    Column("lead_count", BigInteger, nullable=False),
+)
@@ -11,11 +11,22 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http import LoopBoundClient
 
 logger = logging.getLogger(__name__)
 
 _TIMEOUT = 30.0
 
+# Shared chat completions API client — model calls reuse a pooled HTTP/2 connection
+# instead of a fresh TCP+TLS handshake each (see app.core.http)
+_http = LoopBoundClient(lambda: httpx.AsyncClient(
+    http2=True,
+    timeout=_TIMEOUT,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+))
+get_http_client = _http.get
+close_client = _http.close
+
 
 class AIClient:
     """Thin wrapper around an OpenAI-compatible chat completions API."""
@@ -68,14 +79,13 @@ class AIClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-                resp = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=body,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                f"{self.base_url}/chat/completions",
+                json=body,
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             content = data["choices"][0]["message"]["content"]
             # Try to parse as JSON
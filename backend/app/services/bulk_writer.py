@@ -0,0 +1,73 @@
+"""Buffered bulk inserts — one executemany INSERT (or COPY) per batch of rows."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import bulk_copy
+
+# Past ~1000 rows per INSERT, Postgres ingest gains flatten out while the
+# client-side buffer keeps growing
+DEFAULT_BATCH_SIZE = 1000
+
+
+class BulkWriter:
+    """Collect rows for one model and write them in batches.
+
+    Rows are dicts keyed by column, as for session.execute(insert(Model), rows).
+    A batch is written once batch_size rows are buffered and again on flush().
+    Used as an async context manager, the remainder is flushed on a clean exit
+    and discarded if the block raises. Writes go through the session's
+    transaction; committing stays with the caller.
+
+    use_copy=True writes each batch with binary COPY (app.core.database.bulk_copy)
+    instead of INSERT. That suits append-only firehoses of 10k+ rows, but every
+    row must then have the first row's keys, and ORM events don't fire.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        model: type,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        use_copy: bool = False,
+    ) -> None:
+        self.db = db
+        self.model = model
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.written = 0
+        self._rows: list[dict[str, Any]] = []
+
+    async def add(self, row: dict[str, Any]) -> None:
+        """Buffer a row, writing the batch once it is full."""
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            await self.flush()
+
+    async def add_all(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            await self.add(row)
+
+    async def flush(self) -> int:
+        """Write the buffered rows. Returns how many were written."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+        if self.use_copy:
+            await bulk_copy(self.db, self.model, rows)
+        else:
+            await self.db.execute(insert(self.model), rows)
+        self.written += len(rows)
+        return len(rows)
+
+    async def __aenter__(self) -> "BulkWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
+        else:
+            self._rows.clear()
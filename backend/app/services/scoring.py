@@ -1,11 +1,17 @@
 """Solar Readiness Scoring Engine v1 (heuristic-based)."""
 
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schema import Lead, LeadScore, LeadStatus, Property
+from app.services.bulk_writer import BulkWriter
+
+logger = logging.getLogger(__name__)
 
 
 class ScoringResult:
@@ -136,6 +142,41 @@ def compute_score(prop: Property) -> ScoringResult:
     return result
 
 
+# Statuses a rescore never downgrades
+_PROTECTED_STATUSES = frozenset({
+    LeadStatus.appointment_set,
+    LeadStatus.qualified,
+    LeadStatus.closed_won,
+})
+
+
+def _status_for_score(total: int) -> LeadStatus:
+    if total >= 75:
+        return LeadStatus.hot
+    if total >= 50:
+        return LeadStatus.warm
+    return LeadStatus.cool
+
+
+def _score_row(lead_id: int, result: ScoringResult) -> dict:
+    """LeadScore column values for a scoring result."""
+    return {
+        "lead_id": lead_id,
+        "total_score": result.total,
+        "score_version": "v1",
+        "roof_age_score": result.roof_age_score,
+        "ownership_score": result.ownership_score,
+        "roof_area_score": result.roof_area_score,
+        "home_value_score": result.home_value_score,
+        "utility_rate_score": result.utility_rate_score,
+        "shade_score": result.shade_score,
+        "neighborhood_score": result.neighborhood_score,
+        "income_score": result.income_score,
+        "property_type_score": result.property_type_score,
+        "existing_solar_score": result.existing_solar_score,
+    }
+
+
 async def score_lead(db: AsyncSession, lead_id: int) -> LeadScore:
     """Score a lead and persist the result."""
     lead = await db.get(Lead, lead_id)
@@ -148,36 +189,51 @@ async def score_lead(db: AsyncSession, lead_id: int) -> LeadScore:
 
     result = compute_score(prop)
 
-    score_record = LeadScore(
-        lead_id=lead.id,
-        total_score=result.total,
-        score_version="v1",
-        roof_age_score=result.roof_age_score,
-        ownership_score=result.ownership_score,
-        roof_area_score=result.roof_area_score,
-        home_value_score=result.home_value_score,
-        utility_rate_score=result.utility_rate_score,
-        shade_score=result.shade_score,
-        neighborhood_score=result.neighborhood_score,
-        income_score=result.income_score,
-        property_type_score=result.property_type_score,
-        existing_solar_score=result.existing_solar_score,
-    )
+    score_record = LeadScore(**_score_row(lead.id, result))
     db.add(score_record)
 
     # Update lead status based on score — but never downgrade from protected statuses
-    protected_statuses = {
-        LeadStatus.appointment_set,
-        LeadStatus.qualified,
-        LeadStatus.closed_won,
-    }
-    if lead.status not in protected_statuses:
-        if result.total >= 75:
-            lead.status = LeadStatus.hot
-        elif result.total >= 50:
-            lead.status = LeadStatus.warm
-        else:
-            lead.status = LeadStatus.cool
+    if lead.status not in _PROTECTED_STATUSES:
+        lead.status = _status_for_score(result.total)
 
     await db.flush()
     return score_record
+
+
+async def score_leads(db: AsyncSession, lead_ids: Sequence[int]) -> int:
+    """Score a batch of leads: one SELECT, bulk score INSERTs, one UPDATE per status.
+
+    Same outcome as score_lead for each id, without its two lookups and flush
+    per lead. Ids whose lead or property is missing are skipped. Returns the
+    number of leads scored.
+    """
+    if not lead_ids:
+        return 0
+    rows = (await db.execute(
+        select(Lead.id, Property)
+        .join(Property, Lead.property_id == Property.id)
+        .where(Lead.id.in_(lead_ids))
+    )).all()
+
+    by_status: dict[LeadStatus, list[int]] = defaultdict(list)
+    async with BulkWriter(db, LeadScore) as writer:
+        for lead_id, prop in rows:
+            result = compute_score(prop)
+            await writer.add(_score_row(lead_id, result))
+            by_status[_status_for_score(result.total)].append(lead_id)
+
+    if len(rows) < len(lead_ids):
+        missing = sorted(set(lead_ids) - {lead_id for lead_id, _ in rows})
+        logger.warning("Skipped scoring leads with no lead or property row: %s", missing)
+
+    for new_status, ids in by_status.items():
+        await db.execute(
+            update(Lead)
+            .where(
+                Lead.id.in_(ids),
+                Lead.status.not_in(_PROTECTED_STATUSES),
+                Lead.status.is_distinct_from(new_status),
+            )
+            .values(status=new_status)
+        )
+    return writer.written
@@ -30,7 +30,9 @@ from app.workers.celery_app import celery_app
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
-sync_engine = create_engine(settings.database_url_sync, echo=False)
+sync_engine = create_engine(
+    settings.database_url_sync, echo=False, query_cache_size=settings.db_query_cache_size,
+)
 
 
 @celery_app.task(name="app.workers.ai_operator_tasks.task_process_new_conversations")
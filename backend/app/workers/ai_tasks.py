@@ -1,6 +1,5 @@
 """Celery tasks for AI modules: SMS, QA, NBA, objections, contact validation, scripts."""
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
@@ -46,21 +45,19 @@ from app.services.prompts import (
     SMS_AGENT_USER,
     render_template,
 )
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
-sync_engine = create_engine(settings.database_url_sync, echo=False)
+sync_engine = create_engine(
+    settings.database_url_sync, echo=False, query_cache_size=settings.db_query_cache_size,
+)
 
 
 def _run_async(coro):
     """Run an async coroutine from sync Celery task context."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return run_async(coro)
 
 
 # ── Contact Validation ───────────────────────────────────────────────────
@@ -150,7 +147,8 @@ def task_send_sms(lead_id: int, message: str, script_version_id: int | None = No
         db.add(msg)
 
         # Update lead tracking
-        lead.total_sms_sent += 1
+        # Incremented in SQL so concurrent sends can't lose a count
+        lead.total_sms_sent = Lead.total_sms_sent + 1
         lead.last_contacted_at = datetime.now(tz=timezone.utc)
 
         # Create outreach attempt
@@ -1,7 +1,12 @@
 """Celery application configuration."""
 
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from app.core.config import get_settings
 
@@ -60,5 +65,57 @@ celery_app.conf.update(
             "task": "app.workers.enrichment_tasks.task_enrich_batch",
             "schedule": crontab(hour=3, minute=0),
         },
+        # Nightly at 1am ET: upcoming audit/AI-run partitions + retention
+        "maintain-log-partitions": {
+            "task": "app.workers.tasks.maintain_log_partitions",
+            "schedule": crontab(hour=1, minute=0),
+        },
+        # Every minute: lead status counts behind the dashboard KPIs
+        "refresh-lead-status-counts": {
+            "task": "app.workers.tasks.refresh_lead_status_counts",
+            "schedule": 60.0,
+        },
     },
 )
+
+
+T = TypeVar("T")
+
+# One event loop per worker process, reused by every task. asyncio.run() per
+# task builds and tears down a loop each time, and the async engine's pooled
+# asyncpg connections (like the shared HTTP/Redis clients) are bound to the
+# loop that opened them — a persistent loop keeps all of them warm.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**_: Any) -> None:
+    """Give each forked worker its own loop and a pool free of parent connections."""
+    from app.core.database import async_engine
+
+    global _loop
+    _loop = None
+    async_engine.sync_engine.dispose(close=False)
+    _get_loop()
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**_: Any) -> None:
+    from app.core.database import async_engine
+
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(async_engine.dispose())
+        _loop.close()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on this worker process's event loop."""
+    return _get_loop().run_until_complete(coro)
@@ -2,7 +2,7 @@
 
 import logging
 
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,6 @@ logger = logging.getLogger(__name__)
 )
 def task_enrich_contact(self, lead_id: int):
     """Enrich a lead via PDL — only Hot/Warm leads above confidence threshold."""
-    import asyncio
     from sqlalchemy.ext.asyncio import AsyncSession as AS
     from app.core.database import async_engine
     from app.enrichment.pipeline import enrich_lead
@@ -36,7 +35,7 @@ def task_enrich_contact(self, lead_id: int):
             else:
                 logger.info("Lead %d enrichment skipped or failed", lead_id)
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @celery_app.task(
@@ -47,7 +46,6 @@ def task_enrich_contact(self, lead_id: int):
 )
 def task_validate_contact(self, lead_id: int):
     """Validate a lead's phone/email via Melissa."""
-    import asyncio
     from sqlalchemy.ext.asyncio import AsyncSession as AS
     from app.core.database import async_engine
     from app.enrichment.pipeline import validate_contact
@@ -69,7 +67,7 @@ def task_validate_contact(self, lead_id: int):
                     lead_id, result.phone_valid, result.confidence,
                 )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @celery_app.task(
@@ -80,7 +78,6 @@ def task_validate_contact(self, lead_id: int):
 )
 def task_enrich_batch(self):
     """Batch enrichment: enrich all Hot/Warm leads that haven't been enriched yet."""
-    import asyncio
     from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession as AS
     from app.core.database import async_engine
@@ -107,4 +104,4 @@ def task_enrich_batch(self):
             task_enrich_contact.delay(lid)
             task_validate_contact.delay(lid)
 
-    asyncio.run(_run())
+    run_async(_run())
@@ -5,7 +5,7 @@ import random
 from datetime import datetime, timezone
 
 import redis
-from sqlalchemy import create_engine, select, update
+from sqlalchemy import create_engine, select, text, update
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -24,11 +24,18 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Celery tasks use synchronous DB (Celery doesn't support async natively)
-sync_engine = create_engine(settings.database_url_sync, echo=False)
+sync_engine = create_engine(
+    settings.database_url_sync, echo=False, query_cache_size=settings.db_query_cache_size,
+)
 
 # Redis client for distributed locking
 _redis = redis.from_url(settings.redis_url)
 
+# Monthly range-partitioned log tables (migration 015) and how far ahead
+# their partitions are created
+_PARTITIONED_LOG_TABLES = ("audit_log", "ai_run")
+_PARTITION_MONTHS_AHEAD = 3
+
 
 @celery_app.task(
     name="app.workers.tasks.process_outreach_queue",
@@ -215,3 +222,40 @@ def _simulate_outreach(db: Session, attempt: OutreachAttempt):
             new_value=f"disposition={attempt.disposition.value}" if attempt.disposition else "",
         )
     )
+
+
+@celery_app.task(name="app.workers.tasks.maintain_log_partitions")
+def maintain_log_partitions():
+    """Precreate upcoming monthly log partitions and detach expired ones.
+
+    Runs nightly. Partitions past LOG_RETENTION_MONTHS are detached, not
+    dropped, so they stay queryable as standalone tables until archived.
+    """
+    with Session(sync_engine) as db:
+        for table in _PARTITIONED_LOG_TABLES:
+            db.execute(
+                text(
+                    "SELECT ensure_monthly_partitions(CAST(:table AS regclass), current_date, "
+                    "(current_date + make_interval(months => :ahead))::date)"
+                ),
+                {"table": table, "ahead": _PARTITION_MONTHS_AHEAD},
+            )
+            if settings.log_retention_months > 0:
+                detached = db.execute(
+                    text("SELECT detach_expired_partitions(CAST(:table AS regclass), :keep)"),
+                    {"table": table, "keep": settings.log_retention_months},
+                ).scalars().all()
+                if detached:
+                    logger.info("Detached expired %s partitions: %s", table, ", ".join(detached))
+        db.commit()
+
+
+@celery_app.task(name="app.workers.tasks.refresh_lead_status_counts")
+def refresh_lead_status_counts():
+    """Refresh the lead status-count view behind the dashboard aggregates.
+
+    CONCURRENTLY keeps the view readable while it recomputes.
+    """
+    with Session(sync_engine) as db:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_lead_status_counts"))
+        db.commit()
@@ -2,7 +2,7 @@
 
 import logging
 
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,6 @@ def task_place_voice_call(self, lead_id: int, script_version_id: int | None = No
 
     Dispatches AI follow-up tasks on call completion.
     """
-    import asyncio
     from sqlalchemy.ext.asyncio import AsyncSession as AS
     from app.core.database import async_engine
     from app.models.schema import (
@@ -107,7 +106,8 @@ def task_place_voice_call(self, lead_id: int, script_version_id: int | None = No
             # Update lead tracking
             from datetime import datetime, timezone
             lead.last_contacted_at = datetime.now(timezone.utc)
-            lead.total_call_attempts += 1
+            # Incremented in SQL so concurrent calls can't lose a count
+            lead.total_call_attempts = Lead.total_call_attempts + 1
             if lead.status == LeadStatus.scored:
                 lead.status = LeadStatus.contacting
 
@@ -131,7 +131,7 @@ def task_place_voice_call(self, lead_id: int, script_version_id: int | None = No
                 lead_id, result.call_sid, result.status,
             )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @celery_app.task(
@@ -142,7 +142,6 @@ def task_place_voice_call(self, lead_id: int, script_version_id: int | None = No
 )
 def task_process_call_completion(self, call_sid: str, provider_name: str):
     """Process a completed call — fetch recording, transcript, trigger AI tasks."""
-    import asyncio
     from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession as AS
     from app.core.database import async_engine
@@ -195,4 +194,4 @@ def task_process_call_completion(self, call_sid: str, provider_name: str):
                 bool(recording_url), bool(convo.raw_transcript),
             )
 
-    asyncio.run(_run())
+    run_async(_run())
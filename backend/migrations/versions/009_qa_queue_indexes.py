@@ -0,0 +1,32 @@
+"""Add indexes backing the admin QA queue filters.
+
+The flagged_only filter is served by a partial index on recent failing reviews,
+and min_score/max_score range scans by a (compliance_score, created_at DESC) index.
+
+Revision ID: 009_qa_queue_indexes
+Revises: 008_dedup_properties
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "009_qa_queue_indexes"
+down_revision = "008_dedup_properties"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_qa_flagged_recent "
+        "ON qa_review(created_at DESC) WHERE checklist_pass = false;"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_qa_score_recent "
+        "ON qa_review(compliance_score, created_at DESC);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_qa_score_recent;")
+    op.execute("DROP INDEX IF EXISTS ix_qa_flagged_recent;")
@@ -0,0 +1,33 @@
+"""Add generated phone_last10 column to lead for indexed inbound-number lookup.
+
+Webhook and Vapi handlers match callers by the last 10 digits of the lead's
+phone. A trailing-wildcard ILIKE on lead.phone can't use an index, so store the
+normalized digits in a generated column and btree-index it.
+
+Revision ID: 010_lead_phone_last10
+Revises: 009_qa_queue_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "010_lead_phone_last10"
+down_revision = "009_qa_queue_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(r"""
+        ALTER TABLE lead
+        ADD COLUMN IF NOT EXISTS phone_last10 VARCHAR(10)
+        GENERATED ALWAYS AS (right(regexp_replace(phone, '\D', '', 'g'), 10)) STORED;
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_lead_phone_last10 ON lead(phone_last10);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_lead_phone_last10;")
+    op.execute("ALTER TABLE lead DROP COLUMN IF EXISTS phone_last10;")
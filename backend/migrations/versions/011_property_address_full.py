@@ -0,0 +1,35 @@
+"""Add generated address_full column to property.
+
+PDL address lookups send "line1, city, state, zip" for every enriched lead.
+Store it as a generated column so reads are a plain column fetch instead of a
+join done in Python on each enrichment.
+
+Revision ID: 011_property_address_full
+Revises: 010_lead_phone_last10
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "011_property_address_full"
+down_revision = "010_lead_phone_last10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # || and coalesce (unlike concat_ws) are immutable, as generated columns require
+    op.execute("""
+        ALTER TABLE property
+        ADD COLUMN IF NOT EXISTS address_full TEXT
+        GENERATED ALWAYS AS (
+            rtrim(coalesce(nullif(address_line1, '') || ', ', '')
+                || coalesce(nullif(city, '') || ', ', '')
+                || coalesce(nullif(state, '') || ', ', '')
+                || coalesce(zip_code, ''), ', ')
+        ) STORED;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE property DROP COLUMN IF EXISTS address_full;")
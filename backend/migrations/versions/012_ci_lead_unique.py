@@ -0,0 +1,38 @@
+"""Make contact_intelligence.lead_id unique.
+
+Each lead has at most one contact_intelligence row: validation reads it with
+scalar_one_or_none() and mirrors Melissa results onto it by lead_id. Enforce
+that with a unique index, so lookups stop at the first match and a stray
+duplicate can't break the reads. For leads that already have duplicates, the
+newest row (highest id) is kept.
+
+lead.property_id needs nothing: it has been UNIQUE (and so indexed) since 001.
+
+Revision ID: 012_ci_lead_unique
+Revises: 011_property_address_full
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "012_ci_lead_unique"
+down_revision = "011_property_address_full"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM contact_intelligence ci
+        USING contact_intelligence newer
+        WHERE newer.lead_id = ci.lead_id AND newer.id > ci.id;
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_ci_lead_id;")
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_ci_lead_id ON contact_intelligence(lead_id);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_ci_lead_id;")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_ci_lead_id ON contact_intelligence(lead_id);")
@@ -0,0 +1,45 @@
+"""Replace full status indexes with partial ones on the hot subsets.
+
+Lead queries that filter on status go after the in-pipeline statuses (hot
+leads, sales-board stages, closed-won revenue). The bulk of the table is
+ingested/scored/cool and gains nothing from a status index, so
+ix_lead_status is replaced with a much smaller partial index. A rep's
+upcoming appointments get a (rep_id, scheduled_start) index limited to
+scheduled/confirmed rows.
+
+Indexes are built CONCURRENTLY (outside the migration transaction) so lead
+and appointment writes aren't blocked while they build.
+
+Revision ID: 013_partial_status_indexes
+Revises: 012_ci_lead_unique
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "013_partial_status_indexes"
+down_revision = "012_ci_lead_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_status_active ON lead(status)
+            WHERE status IN ('hot', 'warm', 'contacting', 'contacted', 'qualified',
+                             'appointment_set', 'nurturing', 'closed_won');
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_appointment_upcoming
+            ON appointment(rep_id, scheduled_start)
+            WHERE status IN ('scheduled', 'confirmed');
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_status;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_status ON lead(status);")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_appointment_upcoming;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_status_active;")
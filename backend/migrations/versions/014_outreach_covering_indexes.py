@@ -0,0 +1,50 @@
+"""Add composite/covering indexes for the follow-up, outreach-queue and NBA lookups.
+
+- ix_lead_rep_outreach_due: the sales board counts a rep's follow-ups due by
+  (assigned_rep_id, next_outreach_at) and filters out closed statuses;
+  INCLUDE (status) lets that count run as an index-only scan.
+- ix_outreach_pending: the outreach queue worker polls attempts with no
+  disposition every minute; a partial index keeps that off a full table scan.
+- ix_nba_lead_latest: "latest decision for a lead" becomes a single index
+  probe instead of fetching and sorting every decision for the lead. It
+  supersedes ix_nba_lead_id.
+
+Revision ID: 014_outreach_covering_indexes
+Revises: 013_partial_status_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "014_outreach_covering_indexes"
+down_revision = "013_partial_status_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_rep_outreach_due
+            ON lead(assigned_rep_id, next_outreach_at) INCLUDE (status)
+            WHERE next_outreach_at IS NOT NULL;
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_outreach_pending
+            ON outreach_attempt(id) WHERE disposition IS NULL;
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_nba_lead_latest
+            ON nba_decision(lead_id, created_at DESC);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_nba_lead_id;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_nba_lead_id ON nba_decision(lead_id);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_nba_lead_latest;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_outreach_pending;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_rep_outreach_due;")
@@ -0,0 +1,152 @@
+"""Range-partition audit_log and ai_run by month on created_at.
+
+Both tables are append-only logs that grow without bound and are read by
+time window (weekly AI stats, cost center, audit review). Monthly partitions
+let those reads prune to the months they touch and make retention an
+ALTER TABLE ... DETACH PARTITION instead of a bulk DELETE.
+
+Each table is rebuilt as a partitioned table with the same columns, keeping
+its id sequence. The primary key becomes (id, created_at) because Postgres
+requires the partition key in it. Existing rows are copied into monthly
+partitions. A DEFAULT partition catches anything outside the precreated
+months.
+
+Two helper functions are installed for the nightly maintenance task
+(app.workers.tasks.maintain_log_partitions):
+- ensure_monthly_partitions(parent, first_month, last_month)
+- detach_expired_partitions(parent, keep_months)
+
+outreach_attempt and conversation_transcript stay unpartitioned. Other
+tables hold foreign keys to their id, and a foreign key can't reference a
+partitioned table unless it includes the partition key. inbound_message is
+read by lead and phone number, not by time, so pruning wouldn't help it.
+
+Revision ID: 015_partition_log_tables
+Revises: 014_outreach_covering_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "015_partition_log_tables"
+down_revision = "014_outreach_covering_indexes"
+branch_labels = None
+depends_on = None
+
+# table -> (index DDL, foreign-key DDL) recreated on the partitioned parent
+_TABLES = {
+    "audit_log": (
+        [
+            "CREATE INDEX ix_audit_entity ON audit_log(entity_type, entity_id)",
+            "CREATE INDEX ix_audit_created_at ON audit_log(created_at)",
+            "CREATE INDEX ix_audit_actor ON audit_log(actor)",
+        ],
+        [],
+    ),
+    "ai_run": (
+        [
+            "CREATE INDEX ix_ai_run_task_type ON ai_run(task_type)",
+            "CREATE INDEX ix_ai_run_lead_id ON ai_run(lead_id)",
+            "CREATE INDEX ix_ai_run_created_at ON ai_run(created_at)",
+            "CREATE INDEX ix_ai_run_status ON ai_run(status)",
+        ],
+        [
+            "ALTER TABLE ai_run ADD FOREIGN KEY (lead_id) REFERENCES lead(id)",
+            "ALTER TABLE ai_run ADD FOREIGN KEY (conversation_id) "
+            "REFERENCES conversation_transcript(id)",
+        ],
+    ),
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+            parent regclass, first_month date, last_month date
+        ) RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            month_start date;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', first_month), date_trunc('month', last_month),
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                    parent::text || '_' || to_char(month_start, 'YYYY_MM'),
+                    parent, month_start, (month_start + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+    """)
+    op.execute(r"""
+        CREATE OR REPLACE FUNCTION detach_expired_partitions(
+            parent regclass, keep_months int
+        ) RETURNS SETOF text LANGUAGE plpgsql AS $$
+        DECLARE
+            part regclass;
+            cutoff date := (
+                date_trunc('month', now()) - make_interval(months => keep_months)
+            )::date;
+        BEGIN
+            FOR part IN
+                SELECT c.oid::regclass
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = parent
+                  AND c.relname ~ '_\d{4}_\d{2}$'
+                  AND to_date(right(c.relname, 7), 'YYYY_MM') < cutoff
+            LOOP
+                EXECUTE format('ALTER TABLE %s DETACH PARTITION %s', parent, part);
+                RETURN NEXT part::text;
+            END LOOP;
+        END $$;
+    """)
+
+    for table, (indexes, foreign_keys) in _TABLES.items():
+        old = f"{table}_unpartitioned"
+        op.execute(f"ALTER TABLE {table} RENAME TO {old};")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old}_pkey;")
+        op.execute(f"UPDATE {old} SET created_at = now() WHERE created_at IS NULL;")
+
+        op.execute(f"""
+            CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)
+            PARTITION BY RANGE (created_at);
+        """)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL;")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at);")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id;")
+
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;")
+        op.execute(f"""
+            SELECT ensure_monthly_partitions(
+                '{table}',
+                coalesce((SELECT min(created_at) FROM {old})::date, current_date),
+                (current_date + interval '3 months')::date
+            );
+        """)
+        op.execute(f"INSERT INTO {table} SELECT * FROM {old};")
+        op.execute(f"DROP TABLE {old};")
+
+        for ddl in indexes + foreign_keys:
+            op.execute(ddl + ";")
+
+
+def downgrade() -> None:
+    for table, (indexes, foreign_keys) in _TABLES.items():
+        partitioned = f"{table}_partitioned"
+        op.execute(f"ALTER TABLE {table} RENAME TO {partitioned};")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {partitioned}_pkey;")
+
+        op.execute(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS);")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id);")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id;")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned};")
+        op.execute(f"DROP TABLE {partitioned};")
+
+        for ddl in indexes + foreign_keys:
+            op.execute(ddl + ";")
+
+    op.execute("DROP FUNCTION IF EXISTS detach_expired_partitions(regclass, int);")
+    op.execute("DROP FUNCTION IF EXISTS ensure_monthly_partitions(regclass, date, date);")
@@ -0,0 +1,72 @@
+"""Compress large transcript/payload columns with LZ4 instead of pglz.
+
+Transcripts, audit values and AI run payloads are mostly TOASTed. LZ4
+(PostgreSQL 14+) decompresses several times faster than the default pglz at
+a similar ratio. Reporting and QA reads of these columns are bound by
+decompression. Only values written after the change use LZ4; existing
+values stay pglz until they are rewritten.
+
+conversation_transcript also gets toast_tuple_target = 128, so transcripts
+move out of line and scans of the call metadata stop dragging them through
+the main heap. audit_log and ai_run are partitioned (015). Storage
+parameters can't be set on a partitioned parent, so they keep only the
+compression setting, which their partitions inherit.
+
+If the server was built without LZ4, this migration is a no-op.
+
+Revision ID: 016_lz4_toast_compression
+Revises: 015_partition_log_tables
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "016_lz4_toast_compression"
+down_revision = "015_partition_log_tables"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = {
+    "conversation_transcript": ("raw_transcript", "ai_summary", "ai_output"),
+    "outreach_attempt": ("transcript",),
+    "audit_log": ("old_value", "new_value", "metadata_json"),
+    "ai_run": ("input_json", "output_json"),
+}
+
+
+def _set_compression(method: str) -> list[str]:
+    return [
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}"
+        for table, columns in _COLUMNS.items()
+        for column in columns
+    ]
+
+
+def _when_lz4_supported(statements: list[str]) -> str:
+    """Wrap statements in a DO block that only runs them if LZ4 is available."""
+    body = "\n                ".join(f"EXECUTE '{stmt}';" for stmt in statements)
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_settings
+                WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)
+            ) THEN
+                {body}
+            ELSE
+                RAISE NOTICE 'LZ4 TOAST compression unavailable; keeping pglz';
+            END IF;
+        END $$;
+    """
+
+
+def upgrade() -> None:
+    op.execute(_when_lz4_supported(_set_compression("lz4") + [
+        "ALTER TABLE conversation_transcript SET (toast_tuple_target = 128)",
+    ]))
+
+
+def downgrade() -> None:
+    op.execute(_when_lz4_supported(_set_compression("pglz") + [
+        "ALTER TABLE conversation_transcript RESET (toast_tuple_target)",
+    ]))
@@ -0,0 +1,63 @@
+"""Widen ids on the high-volume tables to bigint.
+
+Outreach attempts, inbound messages, transcripts and the AI/audit logs gain
+rows per message or per model call. int4 ids run out at ~2.1B, and widening
+a large table later is a long locked rewrite. These tables are still small,
+so the rewrite is cheap now.
+
+The referenced primary keys are widened first, then the foreign keys that
+point at them, and each backing sequence is switched to AS bigint so it can
+count past the int4 limit. audit_log.entity_id is widened too, because it
+can hold an id from any of these tables.
+
+Revision ID: 017_bigint_log_ids
+Revises: 016_lz4_toast_compression
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "017_bigint_log_ids"
+down_revision = "016_lz4_toast_compression"
+branch_labels = None
+depends_on = None
+
+# Tables whose serial id becomes bigint
+_ID_TABLES = (
+    "lead_score",
+    "outreach_attempt",
+    "consent_log",
+    "inbound_message",
+    "conversation_transcript",
+    "objection_tag",
+    "nba_decision",
+    "ai_run",
+    "audit_log",
+)
+
+# (table, column) holding a reference to one of the ids above
+_REF_COLUMNS = (
+    ("inbound_message", "outreach_attempt_id"),
+    ("conversation_transcript", "outreach_attempt_id"),
+    ("qa_review", "conversation_id"),
+    ("objection_tag", "conversation_id"),
+    ("ai_run", "conversation_id"),
+    ("audit_log", "entity_id"),
+)
+
+
+def _retype(type_: str) -> None:
+    for table in _ID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE {type_};")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS {type_};")
+    for table, column in _REF_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_};")
+
+
+def upgrade() -> None:
+    _retype("bigint")
+
+
+def downgrade() -> None:
+    # Fails if any id has already passed the int4 range, which is the point.
+    _retype("integer")
@@ -0,0 +1,35 @@
+"""Index lead_score by (lead_id, scored_at DESC).
+
+Lead.scores is loaded newest-first, both through selectinload and by the
+"latest score" lookups. With lead_id plus scored_at DESC in one index, those
+reads come back already in order, so no sort step is needed. The new index
+also serves plain lead_id lookups, so ix_lead_score_lead_id is dropped.
+
+Revision ID: 018_lead_score_scored_desc
+Revises: 017_bigint_log_ids
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "018_lead_score_scored_desc"
+down_revision = "017_bigint_log_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_lead_scored_desc
+            ON lead_score(lead_id, scored_at DESC);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_lead_id;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_lead_id ON lead_score(lead_id);"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_lead_scored_desc;")
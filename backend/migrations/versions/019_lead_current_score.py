@@ -0,0 +1,75 @@
+"""Denormalize the latest lead_score onto lead.current_score.
+
+Discovery and activation lists rank leads by their latest score. Without a
+score on lead itself, every page has to group lead_score to find each lead's
+newest row and join back to it. An AFTER INSERT trigger on lead_score now
+copies total_score and scored_at onto the lead. A late-arriving older score
+can't overwrite a newer one. The lists then read lead alone, in the order of
+ix_lead_current_score.
+
+Existing leads are backfilled from their newest lead_score row.
+
+Revision ID: 019_lead_current_score
+Revises: 018_lead_score_scored_desc
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "019_lead_current_score"
+down_revision = "018_lead_score_scored_desc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE lead ADD COLUMN IF NOT EXISTS current_score INTEGER;")
+    op.execute(
+        "ALTER TABLE lead ADD COLUMN IF NOT EXISTS current_score_scored_at TIMESTAMPTZ;"
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_lead_current_score() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE lead
+            SET current_score = NEW.total_score,
+                current_score_scored_at = NEW.scored_at
+            WHERE id = NEW.lead_id
+              AND (current_score_scored_at IS NULL
+                   OR current_score_scored_at <= NEW.scored_at);
+            RETURN NULL;
+        END $$;
+    """)
+    op.execute("""
+        CREATE TRIGGER lead_score_sync_current
+        AFTER INSERT ON lead_score
+        FOR EACH ROW EXECUTE FUNCTION sync_lead_current_score();
+    """)
+
+    op.execute("""
+        UPDATE lead l
+        SET current_score = s.total_score,
+            current_score_scored_at = s.scored_at
+        FROM (
+            SELECT DISTINCT ON (lead_id) lead_id, total_score, scored_at
+            FROM lead_score
+            ORDER BY lead_id, scored_at DESC, id DESC
+        ) s
+        WHERE l.id = s.lead_id;
+    """)
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_current_score
+            ON lead(current_score DESC NULLS LAST, created_at DESC);
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_current_score;")
+    op.execute("DROP TRIGGER IF EXISTS lead_score_sync_current ON lead_score;")
+    op.execute("DROP FUNCTION IF EXISTS sync_lead_current_score();")
+    op.execute("ALTER TABLE lead DROP COLUMN IF EXISTS current_score_scored_at;")
+    op.execute("ALTER TABLE lead DROP COLUMN IF EXISTS current_score;")
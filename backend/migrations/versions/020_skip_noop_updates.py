@@ -0,0 +1,62 @@
+"""Skip no-op UPDATEs and set updated_at in the database.
+
+Postgres writes a new row version for every UPDATE, even one that changes
+nothing. That costs WAL, dirty pages and index churn. Re-running enrichment
+or validation over the same leads mostly issues UPDATEs like that.
+
+skip_noop_update() runs BEFORE UPDATE on property, lead, appointment and
+contact_intelligence. If no column changed, it returns NULL and nothing is
+written. Otherwise it sets updated_at = now(). This replaces the ORM's
+onupdate=func.now(); the models mark updated_at as server-maintained
+(server_onupdate=FetchedValue()).
+
+Rows are compared as jsonb, leaving out updated_at and any stored
+generated columns, which aren't yet computed in a BEFORE trigger. The trigger
+arguments list those columns.
+
+Revision ID: 020_skip_noop_updates
+Revises: 019_lead_current_score
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "020_skip_noop_updates"
+down_revision = "019_lead_current_score"
+branch_labels = None
+depends_on = None
+
+# table -> columns left out of the change check
+_TABLES = {
+    "property": ("updated_at", "address_full"),
+    "lead": ("updated_at", "phone_last10"),
+    "appointment": ("updated_at",),
+    "contact_intelligence": ("updated_at",),
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION skip_noop_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF to_jsonb(NEW) - TG_ARGV = to_jsonb(OLD) - TG_ARGV THEN
+                RETURN NULL;
+            END IF;
+            NEW.updated_at := now();
+            RETURN NEW;
+        END $$;
+    """)
+    for table, ignored in _TABLES.items():
+        args = ", ".join(f"'{column}'" for column in ignored)
+        op.execute(f"""
+            CREATE TRIGGER {table}_skip_noop_update
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION skip_noop_update({args});
+        """)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_skip_noop_update ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS skip_noop_update();")
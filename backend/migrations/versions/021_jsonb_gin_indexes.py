@@ -0,0 +1,47 @@
+"""GIN indexes for JSONB containment queries.
+
+property.raw_data, outreach_attempt.qualification_data,
+conversation_transcript.ai_output and nba_decision.reason_codes are searched
+ad hoc with @>, for example raw_data @> '{"source": "assessor_2024"}'.
+Without an index, each of those queries reads every JSONB value in the table.
+The indexes use the jsonb_path_ops opclass. It only supports @> and the
+jsonpath match operators, but it is a fraction of the size of the default
+jsonb_ops and faster to probe.
+
+ai_run.input_json is left unindexed. It holds full prompt payloads written
+on every model call, and ai_run is only read by task type, lead and time.
+
+Revision ID: 021_jsonb_gin_indexes
+Revises: 020_skip_noop_updates
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "021_jsonb_gin_indexes"
+down_revision = "020_skip_noop_updates"
+branch_labels = None
+depends_on = None
+
+# index -> (table, column)
+_INDEXES = {
+    "ix_property_raw_data_gin": ("property", "raw_data"),
+    "ix_outreach_qualification_gin": ("outreach_attempt", "qualification_data"),
+    "ix_transcript_ai_output_gin": ("conversation_transcript", "ai_output"),
+    "ix_nba_reason_codes_gin": ("nba_decision", "reason_codes"),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, column) in _INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} jsonb_path_ops);"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
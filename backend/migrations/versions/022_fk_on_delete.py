@@ -0,0 +1,64 @@
+"""Cascade lead deletes in the database with ON DELETE rules.
+
+Deleting a lead used to need every dependent row removed first, child by
+child. The per-lead history tables now use ON DELETE CASCADE, so one DELETE
+on lead removes them in the same statement. Links that should survive get
+SET NULL instead: the AI run log, and messages or transcripts whose outreach
+attempt is removed.
+
+consent_log, appointment and sale keep the default NO ACTION. Opt-out
+evidence and booked or sold business must block deleting the lead, not
+disappear with it.
+
+Revision ID: 022_fk_on_delete
+Revises: 021_jsonb_gin_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "022_fk_on_delete"
+down_revision = "021_jsonb_gin_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table, ON DELETE action)
+_FOREIGN_KEYS = (
+    ("lead_score", "lead_id", "lead", "CASCADE"),
+    ("outreach_attempt", "lead_id", "lead", "CASCADE"),
+    ("note", "lead_id", "lead", "CASCADE"),
+    ("contact_intelligence", "lead_id", "lead", "CASCADE"),
+    ("inbound_message", "lead_id", "lead", "CASCADE"),
+    ("conversation_transcript", "lead_id", "lead", "CASCADE"),
+    ("qa_review", "lead_id", "lead", "CASCADE"),
+    ("objection_tag", "lead_id", "lead", "CASCADE"),
+    ("nba_decision", "lead_id", "lead", "CASCADE"),
+    ("contact_enrichment", "lead_id", "lead", "CASCADE"),
+    ("contact_validation", "lead_id", "lead", "CASCADE"),
+    ("ai_run", "lead_id", "lead", "SET NULL"),
+    ("inbound_message", "outreach_attempt_id", "outreach_attempt", "SET NULL"),
+    ("conversation_transcript", "outreach_attempt_id", "outreach_attempt", "SET NULL"),
+    ("qa_review", "conversation_id", "conversation_transcript", "CASCADE"),
+    ("objection_tag", "conversation_id", "conversation_transcript", "CASCADE"),
+    ("ai_run", "conversation_id", "conversation_transcript", "SET NULL"),
+)
+
+
+def _recreate(on_delete: bool) -> None:
+    for table, column, parent, action in _FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        rule = f" ON DELETE {action}" if on_delete else ""
+        op.execute(f"""
+            ALTER TABLE {table}
+                DROP CONSTRAINT IF EXISTS {name},
+                ADD CONSTRAINT {name} FOREIGN KEY ({column})
+                    REFERENCES {parent}(id){rule};
+        """)
+
+
+def upgrade() -> None:
+    _recreate(on_delete=True)
+
+
+def downgrade() -> None:
+    _recreate(on_delete=False)
@@ -0,0 +1,54 @@
+"""Store scores, hours and per-lead counters as smallint.
+
+These columns hold small values: 0-100 scores, 0-23 hours, per-lead contact
+counters and a four-digit year. int4 spends four bytes and four-byte
+alignment on each of them. lead_score alone carries eleven such columns per
+row, so smallint packs noticeably more rows per page for scans.
+
+Each table is altered in a single statement, so it is rewritten once.
+
+Revision ID: 023_smallint_scores
+Revises: 022_fk_on_delete
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "023_smallint_scores"
+down_revision = "022_fk_on_delete"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = {
+    "property": ("year_built",),
+    "lead": ("current_score", "total_call_attempts", "total_sms_sent", "total_emails_sent"),
+    "lead_score": (
+        "total_score",
+        "roof_age_score",
+        "ownership_score",
+        "roof_area_score",
+        "home_value_score",
+        "utility_rate_score",
+        "shade_score",
+        "neighborhood_score",
+        "income_score",
+        "property_type_score",
+        "existing_solar_score",
+    ),
+    "contact_intelligence": ("best_call_hour", "best_sms_hour"),
+    "qa_review": ("compliance_score",),
+}
+
+
+def _retype(type_: str) -> None:
+    for table, columns in _COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {column} TYPE {type_}" for column in columns)
+        op.execute(f"ALTER TABLE {table} {alters};")
+
+
+def upgrade() -> None:
+    _retype("smallint")
+
+
+def downgrade() -> None:
+    _retype("integer")
@@ -0,0 +1,31 @@
+"""BRIN index on lead_score.scored_at.
+
+lead_score is append-only, so scored_at rises with physical row order. A BRIN
+index stores one min/max summary per 32 pages. That lets "scores in the last
+N days" range scans skip most of the table, with an index a tiny fraction of
+a B-tree's size.
+
+Revision ID: 024_lead_score_brin
+Revises: 023_smallint_scores
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "024_lead_score_brin"
+down_revision = "023_smallint_scores"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_scored_at_brin
+            ON lead_score USING brin (scored_at) WITH (pages_per_range = 32);
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_scored_at_brin;")
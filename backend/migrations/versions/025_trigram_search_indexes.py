@@ -0,0 +1,46 @@
+"""Trigram indexes for the lead list's substring search.
+
+GET /leads?q= matches ILIKE '%q%' against the lead's first name, last name,
+phone and email, and the property's street address. A leading wildcard
+can't use a B-tree, so every search read the whole lead table. pg_trgm GIN
+indexes on each searched column let Postgres answer the OR as a bitmap
+union of index scans.
+
+GIN indexes can't INCLUDE extra columns, so none are added.
+
+Revision ID: 025_trigram_search_indexes
+Revises: 024_lead_score_brin
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "025_trigram_search_indexes"
+down_revision = "024_lead_score_brin"
+branch_labels = None
+depends_on = None
+
+# index -> (table, column)
+_INDEXES = {
+    "ix_lead_first_name_trgm": ("lead", "first_name"),
+    "ix_lead_last_name_trgm": ("lead", "last_name"),
+    "ix_lead_phone_trgm": ("lead", "phone"),
+    "ix_lead_email_trgm": ("lead", "email"),
+    "ix_property_address_trgm": ("property", "address_line1"),
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    with op.get_context().autocommit_block():
+        for name, (table, column) in _INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops);"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
@@ -0,0 +1,31 @@
+"""Lower lead's fillfactor to 80 for HOT updates.
+
+Outreach updates lead rows constantly: contact counters, last_contacted_at
+and updated_at. None of those columns is indexed, so Postgres can rewrite
+such a row as a heap-only tuple (HOT) and skip touching the indexes. That
+only works if the new version fits on the same page. A fillfactor of 80
+keeps a fifth of each page free for it.
+
+The setting applies to pages written from now on. Existing pages pick up the
+headroom as they are rewritten, or all at once on the next VACUUM FULL or
+pg_repack.
+
+Revision ID: 026_lead_fillfactor
+Revises: 025_trigram_search_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "026_lead_fillfactor"
+down_revision = "025_trigram_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE lead SET (fillfactor = 80);")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE lead RESET (fillfactor);")
@@ -0,0 +1,40 @@
+"""Store consent_log.ip_address as inet, with a GiST index for subnet lookups.
+
+inet takes 7 bytes for IPv4 and 19 for IPv6, against up to 46 for the
+varchar(45) text. It also validates the address. The GiST inet_ops index
+answers containment queries like ip_address <<= '203.0.113.0/24' ("any
+consent recorded from this network?") without scanning the log.
+
+Blank strings become NULL. Any other value that isn't an address makes the
+migration fail, so it can be fixed by hand instead of silently lost.
+
+Revision ID: 027_consent_ip_inet
+Revises: 026_lead_fillfactor
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "027_consent_ip_inet"
+down_revision = "026_lead_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE consent_log
+        ALTER COLUMN ip_address TYPE inet USING nullif(btrim(ip_address), '')::inet;
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_consent_ip_gist
+        ON consent_log USING gist (ip_address inet_ops);
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_consent_ip_gist;")
+    op.execute("""
+        ALTER TABLE consent_log
+        ALTER COLUMN ip_address TYPE varchar(45) USING host(ip_address);
+    """)
@@ -0,0 +1,38 @@
+"""Materialized view of lead counts per status and assigned rep.
+
+The dashboard KPIs and weekly insights ran
+SELECT status, count(*) FROM lead GROUP BY status, plus a separate
+count(*), on every load. Both read the whole lead table. mv_lead_status_counts
+holds those counts per (status, assigned_rep_id). It is a few dozen rows,
+refreshed every minute by the refresh_lead_status_counts beat task.
+
+The unique index lets REFRESH ... CONCURRENTLY run without blocking readers.
+
+Revision ID: 028_lead_status_counts_mv
+Revises: 027_consent_ip_inet
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "028_lead_status_counts_mv"
+down_revision = "027_consent_ip_inet"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_lead_status_counts AS
+        SELECT status, assigned_rep_id, count(*) AS lead_count
+        FROM lead
+        GROUP BY status, assigned_rep_id;
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_lead_status_counts
+        ON mv_lead_status_counts (status, assigned_rep_id);
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_lead_status_counts;")
@@ -0,0 +1,41 @@
+"""jsonb_path_ops GIN indexes on the enrichment and validation payloads.
+
+Extends migration 021 to the provider payloads that analytics and QA filter
+with @>:
+- contact_enrichment.raw_response
+- contact_validation.raw_response
+
+Both tables are written once per lead, so the indexes cost little to
+maintain. They are built CONCURRENTLY. audit_log.metadata_json is left
+unindexed: nothing queries it by containment, and it is the table that takes
+the most inserts.
+
+Revision ID: 029_more_jsonb_gin_indexes
+Revises: 028_lead_status_counts_mv
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "029_more_jsonb_gin_indexes"
+down_revision = "028_lead_status_counts_mv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_enrichment_raw_gin
+            ON contact_enrichment USING gin (raw_response jsonb_path_ops);
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_validation_raw_gin
+            ON contact_validation USING gin (raw_response jsonb_path_ops);
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_validation_raw_gin;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_enrichment_raw_gin;")
@@ -0,0 +1,46 @@
+"""Cover total_score in the (lead_id, scored_at DESC) lead_score index.
+
+The AI tasks, sales board and NBA context each look up a lead's latest
+total_score. The lookup is SELECT total_score ... WHERE lead_id = ?
+ORDER BY scored_at DESC LIMIT 1. With total_score in INCLUDE, it is answered
+from the index alone, with no heap fetch.
+
+ix_lead_score_latest replaces ix_lead_score_lead_scored_desc. It also
+replaces ix_lead_score_total: since migration 019, ranking and filtering by
+score read lead.current_score, so nothing filters lead_score by total_score
+any more.
+
+Revision ID: 030_lead_score_latest_covering
+Revises: 029_more_jsonb_gin_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "030_lead_score_latest_covering"
+down_revision = "029_more_jsonb_gin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_latest
+            ON lead_score(lead_id, scored_at DESC) INCLUDE (total_score);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_lead_scored_desc;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_total;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_total
+            ON lead_score(total_score);
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lead_score_lead_scored_desc
+            ON lead_score(lead_id, scored_at DESC);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_lead_score_latest;")
@@ -0,0 +1,76 @@
+"""Maintain updated_at with a trigger that never skips the row.
+
+Migration 020's skip_noop_update() returned NULL for an UPDATE that changed
+nothing. That made the statement match 0 rows, and the ORM raises
+StaleDataError when an UPDATE it flushed matches fewer rows than expected. A
+session whose copy of a row was stale (another writer already set the same
+value) then failed and rolled back its whole transaction.
+
+set_updated_at() only sets updated_at = now() and always lets the row through.
+The models still read updated_at back as a server-maintained value. The
+no-op guard moves to the bulk Core UPDATEs it was meant for, as
+WHERE col IS DISTINCT FROM :new.
+
+Revision ID: 031_set_updated_at_trigger
+Revises: 030_lead_score_latest_covering
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "031_set_updated_at_trigger"
+down_revision = "030_lead_score_latest_covering"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("property", "lead", "appointment", "contact_intelligence")
+
+# Columns migration 020's trigger left out of its change check
+_SKIP_NOOP_IGNORED = {
+    "property": ("updated_at", "address_full"),
+    "lead": ("updated_at", "phone_last10"),
+    "appointment": ("updated_at",),
+    "contact_intelligence": ("updated_at",),
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END $$;
+    """)
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_skip_noop_update ON {table};")
+        op.execute(f"""
+            CREATE TRIGGER {table}_set_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+        """)
+    op.execute("DROP FUNCTION IF EXISTS skip_noop_update();")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION skip_noop_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF to_jsonb(NEW) - TG_ARGV = to_jsonb(OLD) - TG_ARGV THEN
+                RETURN NULL;
+            END IF;
+            NEW.updated_at := now();
+            RETURN NEW;
+        END $$;
+    """)
+    for table, ignored in _SKIP_NOOP_IGNORED.items():
+        args = ", ".join(f"'{column}'" for column in ignored)
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table};")
+        op.execute(f"""
+            CREATE TRIGGER {table}_skip_noop_update
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION skip_noop_update({args});
+        """)
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at();")
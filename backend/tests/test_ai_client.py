@@ -1,7 +1,11 @@
-"""Tests for AI client fallback behavior (no API key needed)."""
+"""Tests for AI client fallback behavior and HTTP pooling (no API key needed)."""
+
+import asyncio
 
 import pytest
 
+from app.ai import client as claude_client
+from app.services import ai_client
 from app.services.ai_client import AIClient
 
 
@@ -74,3 +78,25 @@ class TestAIClientFallback:
     def test_enabled_property_true(self, client):
         client.api_key = "sk-test"
         assert client.enabled is True
+
+
+@pytest.fixture(params=[ai_client, claude_client], ids=["openai", "claude"])
+def http_module(request):
+    return request.param
+
+
+class TestSharedHttpClient:
+    """Verify model calls share one pooled HTTP client per event loop."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self, http_module):
+        first = http_module.get_http_client()
+        assert http_module.get_http_client() is first
+        await http_module.close_client()
+        assert first.is_closed
+
+    def test_rebuilt_for_new_event_loop(self, http_module):
+        async def _get():
+            return http_module.get_http_client()
+
+        assert asyncio.run(_get()) is not asyncio.run(_get())
@@ -2,15 +2,52 @@
 
 import pytest
 
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    create_access_token,
+    hash_password,
+    verify_api_key,
+    verify_password,
+)
 
 
-def test_hash_and_verify_password():
+async def test_hash_and_verify_password():
     """Password hashing and verification should work correctly."""
-    hashed = hash_password("testpassword123")
+    hashed = await hash_password("testpassword123")
     assert hashed != "testpassword123"
-    assert verify_password("testpassword123", hashed) is True
-    assert verify_password("wrongpassword", hashed) is False
+    assert await verify_password("testpassword123", hashed) is True
+    assert await verify_password("wrongpassword", hashed) is False
+
+
+async def test_dummy_hash_matches_configured_cost():
+    """The unknown-user dummy hash should cost the same as a real password hash."""
+    from app.core.config import settings
+    from app.core.security import DUMMY_PASSWORD_HASH
+
+    assert DUMMY_PASSWORD_HASH.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert await verify_password("anything", DUMMY_PASSWORD_HASH) is False
+
+
+async def test_password_hash_uses_configured_rounds():
+    """New password hashes should embed the configured bcrypt work factor."""
+    from app.core.config import settings
+
+    assert (await hash_password("pw")).startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+
+
+@pytest.mark.parametrize(
+    "provided,expected,ok",
+    [
+        ("k3y-abc", "k3y-abc", True),
+        ("k3y-abd", "k3y-abc", False),
+        ("", "k3y-abc", False),
+        (None, "k3y-abc", False),
+        ("k3y-abc", "", False),
+        ("ключ", "k3y-abc", False),
+    ],
+)
+def test_verify_api_key(provided, expected, ok):
+    """API keys are compared by HMAC digest; empty values never match."""
+    assert verify_api_key(provided, expected) is ok
 
 
 def test_create_access_token():
@@ -27,3 +64,84 @@ def test_create_token_with_different_data():
     token1 = create_access_token({"sub": "1", "role": "admin"})
     token2 = create_access_token({"sub": "2", "role": "rep"})
     assert token1 != token2
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    """Replace the Redis-backed cache with an in-memory dict."""
+    from app.core import cache
+
+    store: dict = {}
+
+    async def get_json(key):
+        return store.get(key)
+
+    async def set_json(key, value, ttl_seconds):
+        store[key] = value
+
+    monkeypatch.setattr(cache, "get_json", get_json)
+    monkeypatch.setattr(cache, "set_json", set_json)
+    return store
+
+
+async def test_verified_token_cached(monkeypatch, shared_cache):
+    """A verified token should be served from the cache on repeat use."""
+    from app.core import security
+
+    security._token_cache.clear()
+    token = create_access_token({"sub": "42", "role": "rep"})
+    assert await security._user_id_from_token(token) == 42
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode should not run on a cache hit")
+
+    monkeypatch.setattr(security.jwt, "decode", fail_decode)
+    assert await security._user_id_from_token(token) == 42
+    security._token_cache.clear()
+
+
+async def test_verified_token_shared_across_workers(monkeypatch, shared_cache):
+    """Another worker's verification should be reused via the shared cache."""
+    from app.core import security
+
+    security._token_cache.clear()
+    token = create_access_token({"sub": "42", "role": "rep"})
+    await security._user_id_from_token(token)
+    security._token_cache.clear()  # simulate a different process
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode should not run on a shared-cache hit")
+
+    monkeypatch.setattr(security.jwt, "decode", fail_decode)
+    assert await security._user_id_from_token(token) == 42
+    assert all(token not in key for key in shared_cache)
+    security._token_cache.clear()
+
+
+async def test_invalid_token_not_cached(shared_cache):
+    """Tokens that fail verification must never enter the cache."""
+    from jwt import PyJWTError as JWTError
+
+    from app.core import security
+
+    security._token_cache.clear()
+    with pytest.raises(JWTError):
+        await security._user_id_from_token("not.a.jwt")
+    assert len(security._token_cache) == 0
+    assert not shared_cache
+
+
+async def test_expired_token_rejected_before_verification(shared_cache):
+    """Expired tokens should be rejected from their claims, before the signature check."""
+    import time
+
+    import jwt
+
+    from app.core import security
+
+    security._token_cache.clear()
+    # Wrong key: a signature check would raise InvalidSignatureError instead
+    token = jwt.encode({"sub": "42", "exp": int(time.time()) - 60}, "x" * 32, algorithm="HS256")
+    with pytest.raises(jwt.ExpiredSignatureError):
+        await security._user_id_from_token(token)
+    assert len(security._token_cache) == 0
@@ -0,0 +1,58 @@
+"""Tests for the buffered BulkWriter (no DB required)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.schema import AuditLog
+from app.services import bulk_writer
+from app.services.bulk_writer import BulkWriter
+
+
+def _rows(n: int) -> list[dict]:
+    return [{"actor": "worker", "action": "test", "entity_id": i} for i in range(n)]
+
+
+def _db() -> MagicMock:
+    db = MagicMock()
+    db.execute = AsyncMock()
+    return db
+
+
+class TestBulkWriter:
+    """Verify rows are batched into executemany INSERTs or COPY calls."""
+
+    async def test_full_batches_written_and_remainder_on_exit(self):
+        db = _db()
+        async with BulkWriter(db, AuditLog, batch_size=2) as writer:
+            await writer.add_all(_rows(5))
+            assert db.execute.await_count == 2
+
+        batches = [c.args[1] for c in db.execute.await_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert writer.written == 5
+
+    async def test_exception_discards_buffer(self):
+        db = _db()
+        with pytest.raises(RuntimeError):
+            async with BulkWriter(db, AuditLog, batch_size=10) as writer:
+                await writer.add_all(_rows(3))
+                raise RuntimeError("boom")
+
+        db.execute.assert_not_awaited()
+        assert writer.written == 0
+
+    async def test_empty_flush_is_noop(self):
+        db = _db()
+        assert await BulkWriter(db, AuditLog).flush() == 0
+        db.execute.assert_not_awaited()
+
+    async def test_copy_mode_uses_bulk_copy(self, monkeypatch):
+        copy = AsyncMock()
+        monkeypatch.setattr(bulk_writer, "bulk_copy", copy)
+        db = _db()
+        async with BulkWriter(db, AuditLog, use_copy=True) as writer:
+            await writer.add_all(_rows(3))
+
+        copy.assert_awaited_once_with(db, AuditLog, _rows(3))
+        db.execute.assert_not_awaited()
@@ -0,0 +1,36 @@
+"""Tests for the Celery worker event-loop helper (no broker required)."""
+
+import asyncio
+
+from app.workers import celery_app
+
+
+class TestRunAsync:
+    """Verify tasks share one persistent event loop per worker process."""
+
+    def test_loop_reused_across_tasks(self, monkeypatch):
+        monkeypatch.setattr(celery_app, "_loop", None)
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = celery_app.run_async(current_loop())
+        second = celery_app.run_async(current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+        first.close()
+
+    def test_closed_loop_replaced(self, monkeypatch):
+        monkeypatch.setattr(celery_app, "_loop", None)
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = celery_app.run_async(current_loop())
+        first.close()
+        second = celery_app.run_async(current_loop())
+
+        assert second is not first
+        assert celery_app.run_async(asyncio.sleep(0, result=7)) == 7
+        second.close()
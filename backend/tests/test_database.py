@@ -0,0 +1,138 @@
+"""Tests for session handling and the COPY bulk loader (no DB required)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core import database
+from app.models.schema import ContactEnrichment, Lead, LeadStatus
+
+
+def _session(in_transaction: bool, new: set | None = None) -> MagicMock:
+    session = MagicMock()
+    session.in_transaction.return_value = in_transaction
+    session.new = new or set()
+    session.dirty = set()
+    session.deleted = set()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+async def _drive(session: MagicMock, monkeypatch) -> None:
+    monkeypatch.setattr(database, "async_session", lambda: session)
+    gen = database.get_db()
+    assert await gen.__anext__() is session
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+
+
+class TestGetDb:
+    """Verify get_db only commits sessions that did database work."""
+
+    async def test_untouched_session_skips_commit(self, monkeypatch):
+        session = _session(in_transaction=False)
+        await _drive(session, monkeypatch)
+        session.commit.assert_not_awaited()
+
+    async def test_open_transaction_commits(self, monkeypatch):
+        session = _session(in_transaction=True)
+        await _drive(session, monkeypatch)
+        session.commit.assert_awaited_once()
+
+    async def test_pending_objects_commit(self, monkeypatch):
+        session = _session(in_transaction=False, new={object()})
+        await _drive(session, monkeypatch)
+        session.commit.assert_awaited_once()
+
+
+def _copy_session(in_transaction: bool = True) -> tuple[MagicMock, MagicMock]:
+    driver = MagicMock()
+    driver.is_in_transaction.return_value = in_transaction
+    driver.copy_records_to_table = AsyncMock()
+    conn = MagicMock()
+    conn.dialect = database.async_engine.dialect
+    conn.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+    conn.exec_driver_sql = AsyncMock()
+    db = MagicMock()
+    db.connection = AsyncMock(return_value=conn)
+    return db, driver
+
+
+class TestBulkCopy:
+    """Verify bulk_copy encodes rows like an INSERT and chunks the COPY."""
+
+    async def test_rows_encoded_and_chunked(self):
+        db, driver = _copy_session()
+        rows = [
+            {"lead_id": i, "provider": "tracerfy", "phones": [{"number": "4105551234"}]}
+            for i in range(5)
+        ]
+
+        assert await database.bulk_copy(db, ContactEnrichment, rows, chunk_size=2) == 5
+
+        calls = driver.copy_records_to_table.await_args_list
+        assert [len(c.kwargs["records"]) for c in calls] == [2, 2, 1]
+        columns = calls[0].kwargs["columns"]
+        assert columns == ["lead_id", "provider", "phones", "confidence"]
+        assert calls[0].kwargs["records"][0] == (0, "tracerfy", '[{"number":"4105551234"}]', 0.0)
+
+    async def test_enums_by_name_and_generated_columns_skipped(self):
+        db, driver = _copy_session()
+
+        await database.bulk_copy(db, Lead, [{"property_id": 1, "status": LeadStatus.hot}])
+
+        kwargs = driver.copy_records_to_table.await_args.kwargs
+        assert "phone_last10" not in kwargs["columns"]
+        record = dict(zip(kwargs["columns"], kwargs["records"][0]))
+        assert record["status"] == "hot"
+
+    async def test_starts_session_transaction(self):
+        db, driver = _copy_session(in_transaction=False)
+        await database.bulk_copy(db, ContactEnrichment, [{"lead_id": 1, "provider": "pdl"}])
+        db.connection.return_value.exec_driver_sql.assert_awaited_once()
+
+    async def test_no_rows(self):
+        db, driver = _copy_session()
+        assert await database.bulk_copy(db, ContactEnrichment, []) == 0
+        db.connection.assert_not_awaited()
+
+
+class TestTriggerMaintainedColumns:
+    """Columns set by UPDATE triggers must come back via RETURNING."""
+
+    def test_server_onupdate_models_fetch_eagerly(self):
+        from app.models.schema import Base
+
+        for mapper in Base.registry.mappers:
+            if any(c.server_onupdate is not None for c in mapper.local_table.columns):
+                assert mapper.eager_defaults is True, mapper.class_.__name__
+
+
+@pytest.mark.skip(reason="Requires running database")
+class TestUpdatedAtTrigger:
+    """An ORM flush that rewrites a row's current values must still match the row."""
+
+    async def test_stale_session_update_to_same_value(self):
+        from app.models.schema import Property
+
+        async with database.async_session() as db:
+            prop = Property(address_line1="1 Trigger Ln", city="Towson", state="MD",
+                            zip_code="21204", county="Baltimore")
+            lead = Lead(property=prop, status=LeadStatus.hot)
+            db.add(lead)
+            await db.commit()
+            lead_id = lead.id
+
+        async with database.async_session() as stale, database.async_session() as rep:
+            stale_lead = await stale.get(Lead, lead_id)
+            (await rep.get(Lead, lead_id)).status = LeadStatus.qualified
+            await rep.commit()
+
+            # The stale copy still says hot, so the ORM emits an UPDATE that
+            # changes nothing in the row; it must not raise StaleDataError
+            stale_lead.status = LeadStatus.qualified
+            await stale.commit()
+            assert stale_lead.updated_at is not None
@@ -0,0 +1,582 @@
+"""Tests for enrichment provider clients (no network or DB required)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core import cache
+from app.core.config import Settings
+from app.enrichment import melissa, pdl, pipeline, tracerfy
+from app.enrichment._retry import backoff_delay
+from app.models.schema import ContactEnrichment, Lead, LeadStatus, Property
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch):
+    """Replace the Redis-backed cache with an in-memory dict."""
+    store: dict = {}
+
+    async def get_json(key):
+        return store.get(key)
+
+    async def set_json(key, value, ttl_seconds):
+        store[key] = value
+
+    monkeypatch.setattr(cache, "get_json", get_json)
+    monkeypatch.setattr(cache, "set_json", set_json)
+    return store
+
+
+@pytest.fixture(params=[melissa, pdl, tracerfy], ids=["melissa", "pdl", "tracerfy"])
+def provider(request):
+    return request.param
+
+
+class TestSharedClient:
+    """Verify provider HTTP clients are pooled per event loop."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self, provider):
+        first = provider.get_client()
+        assert provider.get_client() is first
+        await provider.close_client()
+
+    @pytest.mark.asyncio
+    async def test_close_then_recreate(self, provider):
+        first = provider.get_client()
+        await provider.close_client()
+        assert first.is_closed
+        assert provider.get_client() is not first
+        await provider.close_client()
+
+    def test_rebuilt_for_new_event_loop(self, provider):
+        async def _get() -> httpx.AsyncClient:
+            return provider.get_client()
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+        assert second is not first
+
+
+class _FakePDL:
+    """PDL stand-in that records peak in-flight lookups."""
+
+    enabled = True
+
+    def __init__(self, fail_for: set[str] = frozenset()):
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_for = fail_for
+
+    async def enrich_person(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if kwargs["name"] in self.fail_for:
+            raise RuntimeError("boom")
+        return {"full_name": kwargs["name"], "phones": [], "emails": [], "confidence": 0.9}
+
+
+def _batch_db(props: list[Property]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = props
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.flush = AsyncMock()
+    return db
+
+
+class TestBatchEnrichment:
+    """Verify enrich_leads overlaps provider lookups and isolates failures."""
+
+    @pytest.fixture
+    def fake_pdl(self, monkeypatch):
+        fake = _FakePDL(fail_for={"Lead 3"})
+        monkeypatch.setattr(pipeline, "PDLClient", lambda: fake)
+        monkeypatch.setattr(pipeline, "MelissaClient", lambda: MagicMock(enabled=False))
+        monkeypatch.setattr(pipeline, "get_settings", lambda: Settings(enrichment_concurrency=4))
+        return fake
+
+    async def test_lookups_bounded_and_failures_skipped(self, fake_pdl):
+        leads = [
+            Lead(id=i, property_id=i, first_name="Lead", last_name=str(i), status=LeadStatus.hot)
+            for i in range(10)
+        ]
+        props = [Property(id=i, address_line1=f"{i} Main St", state="MD") for i in range(10)]
+        db = _batch_db(props)
+
+        count = await pipeline.enrich_leads(db, leads)
+
+        assert count == 9
+        assert fake_pdl.peak == 4
+        assert db.add.call_count == 9
+        db.execute.assert_awaited_once()
+
+    async def test_explicit_concurrency_overrides_setting(self, fake_pdl):
+        leads = [
+            Lead(id=i, property_id=i, first_name="Lead", last_name=str(i), status=LeadStatus.warm)
+            for i in range(6)
+        ]
+        db = _batch_db([])
+
+        await pipeline.enrich_leads(db, leads, concurrency=2)
+
+        assert fake_pdl.peak == 2
+
+    async def test_ineligible_leads_not_looked_up(self, fake_pdl):
+        leads = [Lead(id=1, property_id=1, first_name="Lead", status=LeadStatus.closed_won)]
+        db = _batch_db([])
+
+        assert await pipeline.enrich_leads(db, leads) == 0
+        assert fake_pdl.peak == 0
+
+
+class TestLookupAddress:
+    """Verify PDL lookups use the stored full address when it is loaded."""
+
+    def test_stored_address_preferred(self):
+        prop = Property(address_line1="1 Main St", city="Towson", state="MD", zip_code="21204")
+        prop.address_full = "1 MAIN ST, TOWSON, MD, 21204"
+        kwargs = pipeline._pdl_lookup_kwargs(Lead(first_name="Jane"), prop)
+        assert kwargs["address"] == "1 MAIN ST, TOWSON, MD, 21204"
+
+    def test_unflushed_property_joined(self):
+        prop = Property(address_line1="1 Main St", city="", state="MD", zip_code="21204")
+        kwargs = pipeline._pdl_lookup_kwargs(Lead(), prop)
+        assert kwargs["address"] == "1 Main St, MD, 21204"
+
+
+class TestAddressSearch:
+    """Verify street suffixes are expanded before the PDL address search."""
+
+    @pytest.mark.parametrize(
+        "address,street",
+        [
+            ("123 Oak Rd, Towson, MD", "123 oak road"),
+            ("9 Elm St", "9 elm street"),
+            ("40 Harbor Pkwy", "40 harbor parkway"),
+            ("7 Stone Ave", "7 stone avenue"),
+            ("12 Drury Ln", "12 drury lane"),
+            ("5 Main Street", "5 main street"),
+            ("100 Rd", "100 road"),
+        ],
+    )
+    async def test_suffix_expansion(self, monkeypatch, address, street):
+        client = pdl.PDLClient()
+        request = AsyncMock(return_value=None)
+        monkeypatch.setattr(client, "_request_with_retry", request)
+
+        await client._search_by_address(address, None, None, None)
+
+        sql = request.await_args.kwargs["params"]["sql"]
+        assert sql == f"SELECT * FROM person WHERE location_street_address='{street}'"
+
+    async def test_matches_cached_per_query(self, monkeypatch):
+        monkeypatch.setattr(pdl, "_search_cache", pdl.OrderedDict())
+        client = pdl.PDLClient()
+        request = AsyncMock(return_value={"full_name": "jane doe"})
+        monkeypatch.setattr(client, "_request_with_retry", request)
+
+        first = await client._search_by_address("1 Oak Rd", "Towson", "MD", "21204")
+        second = await client._search_by_address("1 oak road", "towson", "md", "21204")
+
+        assert first is second
+        assert request.await_count == 1
+
+    async def test_matches_shared_across_workers(self, monkeypatch, shared_cache):
+        monkeypatch.setattr(pdl, "_search_cache", pdl.OrderedDict())
+        client = pdl.PDLClient()
+        request = AsyncMock(return_value={"full_name": "jane doe"})
+        monkeypatch.setattr(client, "_request_with_retry", request)
+
+        await client._search_by_address("1 Oak Rd", None, "MD", None)
+        pdl._search_cache.clear()  # simulate a different process
+        result = await client._search_by_address("1 Oak Rd", None, "MD", None)
+
+        assert result == {"full_name": "jane doe"}
+        assert request.await_count == 1
+        assert len(shared_cache) == 1
+
+    async def test_misses_not_cached(self, monkeypatch):
+        monkeypatch.setattr(pdl, "_search_cache", pdl.OrderedDict())
+        client = pdl.PDLClient()
+        request = AsyncMock(return_value=None)
+        monkeypatch.setattr(client, "_request_with_retry", request)
+
+        await client._search_by_address("1 Oak Rd", None, None, None)
+        await client._search_by_address("1 Oak Rd", None, None, None)
+
+        assert request.await_count == 2
+
+
+class TestResponseParsing:
+    """Verify provider JSON bodies are decoded from raw bytes."""
+
+    async def test_pdl_search_result(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=b'{"data": [{"full_name": "jane doe", "likelihood": 8}], "total": 1}',
+            )
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(pdl, "get_client", lambda: mock_client)
+        client = pdl.PDLClient()
+        client.api_key = "test"
+
+        result = await client._request_with_retry(
+            "GET", f"{pdl.PDL_BASE}/person/search", is_search=True,
+        )
+
+        assert result["full_name"] == "jane doe"
+        assert result["confidence"] == 8
+
+    async def test_melissa_record(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=b'{"Records": [{"Results": "PS01,ES01", "PhoneNumber": "4105551234"}]}',
+            )
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(melissa, "get_client", lambda: mock_client)
+        client = melissa.MelissaClient()
+        client.api_key = "test"
+
+        result = await client.validate_contact(phone="4105551234")
+
+        assert result["phone_valid"] is True
+        assert result["email_valid"] is None
+
+    async def test_melissa_empty_records_short_circuits(self, monkeypatch):
+        async def body():
+            yield b'{"TransmissionResults": "", "Records": [ ], '
+            raise AssertionError("body read past the empty Records list")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(melissa, "get_client", lambda: mock_client)
+        client = melissa.MelissaClient()
+        client.api_key = "test"
+
+        assert await client.validate_contact(phone="4105551234") is None
+
+
+class TestMelissaResultCodes:
+    """Verify Melissa result codes are matched as whole codes."""
+
+    def test_confidence_from_codes(self):
+        assert melissa._compute_confidence(melissa._result_flags("AS01,ES01,PS01")) == 1.0
+        assert melissa._compute_confidence(melissa._result_flags("PS02, GS05")) == 0.7
+        assert melissa._compute_confidence(melissa._result_flags("")) == 0.5
+
+    def test_normalize_flags(self):
+        record = {
+            "Results": "AS02,ES01,ES04",
+            "EmailAddress": "a@b.com",
+            "AddressLine1": "1 Main St",
+        }
+        result = melissa._normalize_melissa(record)
+
+        assert result["email_valid"] is True
+        assert result["email_deliverable"] is True
+        assert result["email_disposable"] is True
+        assert result["address_valid"] is True
+        assert result["address_deliverable"] is False
+        assert result["phone_valid"] is None
+
+
+class TestRetryBackoff:
+    """Verify retry delays are jittered within the capped exponential window."""
+
+    @pytest.mark.parametrize("attempt,ceiling", [(0, 0.5), (1, 1.0), (2, 2.0), (10, 30.0)])
+    def test_delay_within_window(self, attempt, ceiling):
+        delays = [backoff_delay(attempt) for _ in range(200)]
+        assert all(0 <= d <= ceiling for d in delays)
+        assert len(set(delays)) > 1
+
+
+def _trace_record(**fields):
+    base = {
+        "first_name": None, "last_name": None, "primary_phone": None,
+        "primary_phone_type": None, "mobiles": [], "landlines": [], "emails": [],
+    }
+    return SimpleNamespace(**{**base, **fields})
+
+
+class TestSkipTrace:
+    """Verify skip-trace loads its batch in one query and backfills contacts."""
+
+    @pytest.fixture
+    def tracerfy(self, monkeypatch):
+        fake = MagicMock(enabled=True)
+        monkeypatch.setattr(tracerfy, "TracerfyClient", lambda: fake)
+        return fake
+
+    @pytest.fixture(autouse=True)
+    def bulk_copy(self, monkeypatch):
+        copy = AsyncMock()
+        monkeypatch.setattr(pipeline, "bulk_copy", copy)
+        return copy
+
+    async def test_single_load_and_backfill(self, tracerfy, bulk_copy):
+        leads = [Lead(id=i, property_id=10 + i, status=LeadStatus.hot) for i in (1, 2)]
+        props = [
+            Property(id=10 + i, address_line1=f"{i} Main St", city="Towson", state="MD")
+            for i in (1, 2)
+        ]
+        result = MagicMock()
+        result.all.return_value = list(zip(leads, props))
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        db.flush = AsyncMock()
+        tracerfy.trace_coalesced = AsyncMock(return_value=[
+            _trace_record(first_name="JANE", last_name="DOE", primary_phone="4105551234"),
+            _trace_record(),
+        ])
+
+        summary = await pipeline.skip_trace_leads(db, [1, 2, 3])
+
+        assert summary == {"submitted": 2, "found": 1, "not_found": 1, "errors": 0}
+        # One joined load, a COPY of the enrichments, one bulk UPDATE each for leads/properties
+        assert db.execute.await_count == 3
+        assert bulk_copy.await_args.args[1] is ContactEnrichment
+        assert [row["lead_id"] for row in bulk_copy.await_args.args[2]] == [1]
+        lead_rows = db.execute.await_args_list[1].args[1]
+        assert lead_rows == [
+            {"id": 1, "first_name": "Jane", "last_name": "Doe", "phone": "4105551234"},
+        ]
+        db.add.assert_not_called()
+        assert leads[0].first_name == "Jane" and leads[0].phone == "4105551234"
+        assert props[0].owner_phone == "4105551234"
+        assert leads[1].phone is None
+
+    async def test_shared_address_submitted_once(self, tracerfy):
+        leads = [Lead(id=i, property_id=10 + i, status=LeadStatus.hot) for i in (1, 2)]
+        props = [
+            Property(id=11, address_line1="1 Main St", city="Towson", state="MD", zip_code="21204"),
+            Property(id=12, address_line1="1 MAIN ST", city="Towson", state="MD", zip_code="21204"),
+        ]
+        result = MagicMock()
+        result.all.return_value = list(zip(leads, props))
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        tracerfy.trace_coalesced = AsyncMock(
+            return_value=[_trace_record(primary_phone="4105551234")],
+        )
+
+        summary = await pipeline.skip_trace_leads(db, [1, 2, 1])
+
+        assert len(tracerfy.trace_coalesced.await_args.args[0]) == 1
+        assert summary == {"submitted": 2, "found": 2, "not_found": 0, "errors": 0}
+        assert leads[0].phone == leads[1].phone == "4105551234"
+
+
+class TestTracerfyPolling:
+    """Verify queue polling backs off and stops as soon as the job completes."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        delays: list[float] = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(tracerfy.asyncio, "sleep", fake_sleep)
+        return delays
+
+    def _install(self, monkeypatch, pending_polls: int) -> list[str]:
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/queues/"):
+                pending = sum(p.endswith("/queues/") for p in paths) <= pending_polls
+                return httpx.Response(
+                    200, json=[{"id": 99, "pending": pending}, {"id": 7, "pending": True}],
+                )
+            return httpx.Response(200, json=[{"address": "1 Main St", "first_name": "Jane"}])
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(tracerfy, "get_client", lambda: mock_client)
+        return paths
+
+    async def test_backoff_then_fetch(self, monkeypatch, sleeps):
+        paths = self._install(monkeypatch, pending_polls=4)
+        client = tracerfy.TracerfyClient()
+        client.api_key = "test"
+
+        records = await client.poll_until_complete(99)
+
+        assert sleeps == [1, 2, 4, 8]
+        assert [r.first_name for r in records] == ["Jane"]
+        assert paths[-1].endswith("/queue/99")
+
+    async def test_delay_capped_and_deadline_respected(self, monkeypatch, sleeps):
+        self._install(monkeypatch, pending_polls=1000)
+        client = tracerfy.TracerfyClient()
+        client.api_key = "test"
+
+        assert await client.poll_until_complete(99, max_wait=100) == []
+        assert max(sleeps) <= 30
+        assert sum(sleeps) == 100
+
+
+class TestTracerfyParse:
+    """Verify result rows parse into compact TraceRecords."""
+
+    def test_parse_row(self):
+        record = tracerfy._parse_record({
+            "address": "1 Main St", "city": "Towson", "state": "MD",
+            "first_name": " Jane ", "last_name": "", "primary_phone": "4105551234",
+            "mobile_1": "4105550001", "mobile_2": "  ", "mobile_5": "4105550005",
+            "landline_2": "4105550002", "email_1": "a@b.com", "email_3": None,
+        })
+
+        assert record.first_name == "Jane"
+        assert record.last_name is None
+        assert record.mobiles == ["4105550001", "4105550005"]
+        assert record.landlines == ["4105550002"]
+        assert record.emails == ["a@b.com"]
+        assert record.mail_city is None
+        assert not hasattr(record, "__dict__")
+
+
+class TestTracerfySubmit:
+    """Verify the trace CSV is streamed into the multipart upload."""
+
+    async def test_csv_rows_uploaded(self, monkeypatch):
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.read())
+            return httpx.Response(200, json={"queue_id": 42, "rows_uploaded": 2})
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(tracerfy, "get_client", lambda: mock_client)
+        client = tracerfy.TracerfyClient()
+        client.api_key = "test"
+
+        queue_id = await client.submit_trace([
+            {"address": "1 Main St", "city": "Towson", "state": "MD", "zip_code": "21204"},
+            {"address": "2 Oak Ave, Apt 3", "city": "Towson", "state": "MD", "zip_code": "21286"},
+        ])
+
+        assert queue_id == 42
+        assert b"address,city,state,zip,first_name,last_name," in bodies[0]
+        assert b"1 Main St,Towson,MD,21204,,,,,,\r\n" in bodies[0]
+        assert b'"2 Oak Ave, Apt 3",Towson,MD,21286,,,,,,\r\n' in bodies[0]
+        assert b'name="mailing_zip_column"\r\n\r\nmailing_zip\r\n' in bodies[0]
+
+    def test_upload_reads_in_sized_chunks(self):
+        upload = tracerfy._CsvUpload(iter([b"abc", b"defg", b"h"]))
+        assert upload.read(2) == b"ab"
+        assert upload.read(4) == b"cdef"
+        assert upload.read() == b"gh"
+        assert upload.read() == b""
+
+
+class TestTracerfyBalance:
+    """Verify the analytics call is memoized for a short TTL."""
+
+    async def test_balance_cached(self, monkeypatch):
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if len(calls) > 1:
+                return httpx.Response(500)
+            return httpx.Response(200, json={"balance": 120})
+
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(tracerfy, "get_client", lambda: mock_client)
+        monkeypatch.setattr(tracerfy, "_balance_cache", {})
+        client = tracerfy.TracerfyClient()
+        client.api_key = "test"
+
+        assert await client.check_balance() == {"balance": 120}
+        assert await client.check_balance() == {"balance": 120}
+        assert len(calls) == 1
+
+        tracerfy._balance_cache["test"] = (0.0, {"balance": 120})
+        assert await client.check_balance() is None
+        assert len(calls) == 2
+
+
+class TestTracerfyCoalescing:
+    """Verify concurrent trace calls share one submission and get their own rows."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(tracerfy, "_COALESCE_WINDOW_SECONDS", 0.01)
+        client = tracerfy.TracerfyClient()
+        client.api_key = "test"
+        client.trace_and_wait = AsyncMock(
+            side_effect=lambda leads, *_, **__: [f"rec:{lead['address']}" for lead in leads],
+        )
+        return client
+
+    async def test_window_shared(self, client):
+        first, second = await asyncio.gather(
+            client.trace_coalesced([{"address": "1"}, {"address": "2"}], max_wait=60),
+            client.trace_coalesced([{"address": "3"}], max_wait=600),
+        )
+
+        assert first == ["rec:1", "rec:2"]
+        assert second == ["rec:3"]
+        client.trace_and_wait.assert_awaited_once()
+        assert client.trace_and_wait.await_args.kwargs["max_wait"] == 600
+
+    async def test_full_window_flushes_early(self, client, monkeypatch):
+        monkeypatch.setattr(tracerfy, "_COALESCE_WINDOW_SECONDS", 60)
+        monkeypatch.setattr(tracerfy, "_COALESCE_MAX_ROWS", 2)
+
+        records = await asyncio.wait_for(
+            client.trace_coalesced([{"address": "1"}, {"address": "2"}]), timeout=1,
+        )
+
+        assert records == ["rec:1", "rec:2"]
+
+    async def test_short_results_and_errors(self, client):
+        client.trace_and_wait.side_effect = None
+        client.trace_and_wait.return_value = ["rec:1"]
+        assert await client.trace_coalesced([{"address": "1"}, {"address": "2"}]) == ["rec:1"]
+
+        client.trace_and_wait.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            await client.trace_coalesced([{"address": "1"}])
+
+
+class TestApplyValidation:
+    """Verify Melissa results reach ContactIntelligence without a SELECT."""
+
+    async def test_single_update_with_reported_fields(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        result = {"phone_valid": False, "phone_type": "", "phone_carrier": "Verizon",
+                  "email_valid": None, "confidence": 0.4}
+
+        await pipeline._apply_validation(db, Lead(id=7), result)
+
+        db.add.assert_called_once()
+        stmt = db.execute.await_args.args[0]
+        assert stmt.is_update and stmt.table.name == "contact_intelligence"
+        params = stmt.compile().params
+        assert params["phone_valid"] is False and params["carrier_name"] == "Verizon"
+        assert "phone_type" not in params and "email_valid" not in params
+        # Same values reported again rewrite nothing
+        assert "IS DISTINCT FROM" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    async def test_nothing_reported_skips_update(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        await pipeline._apply_validation(db, Lead(id=7), {"confidence": 0.0})
+
+        db.execute.assert_not_awaited()
@@ -34,3 +34,32 @@ class TestLeadScore:
     async def test_score_nonexistent_lead_404(self, client):
         response = await client.post("/leads/99999/score")
         assert response.status_code == 404
+
+
+class TestLeadLoading:
+    """Per-lead histories must be loaded explicitly, never lazily."""
+
+    def test_histories_raise_on_lazy_load(self):
+        from app.models.schema import Lead
+
+        for rel in (
+            Lead.scores,
+            Lead.outreach_attempts,
+            Lead.consent_logs,
+            Lead.appointments,
+            Lead.notes,
+        ):
+            assert rel.property.lazy == "raise_on_sql"
+
+    def test_full_context_filters_outreach_window(self):
+        from datetime import datetime, timezone
+
+        from app.api.leads import leads_with_full_context
+
+        since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        paths = [str(opt.path) for opt in leads_with_full_context(since)._with_options]
+        assert any("outreach_attempts" in p for p in paths)
+        assert not any(
+            "outreach_attempts" in str(opt.path)
+            for opt in leads_with_full_context()._with_options
+        )
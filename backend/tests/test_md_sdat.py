@@ -0,0 +1,165 @@
+"""Tests for the Maryland SDAT connector's pure mapping helpers (no network)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.connectors import md_sdat
+from app.connectors.md_sdat import (
+    F_ACCOUNT,
+    F_ADDRESS,
+    F_CITY,
+    F_LAND_USE,
+    F_LAT,
+    F_LON,
+    F_ZIP,
+    MD_ZIP_UTILITY,
+    _lookup_utility,
+    map_records_to_property_kwargs,
+)
+from app.models.schema import PropertyType
+
+
+class TestUtilityLookup:
+    """Verify zip → electric utility resolution."""
+
+    @pytest.mark.parametrize(
+        "zip_code,expected",
+        [
+            ("21201", "BGE"),
+            ("21201-1234", "BGE"),
+            (" 21401 ", "BGE"),
+            ("20850", "Pepco"),
+            ("20601", "Pepco"),  # Pepco range overrides SMECO
+            ("20650", "SMECO"),
+        ],
+    )
+    def test_known_zips(self, zip_code: str, expected: str):
+        assert _lookup_utility(zip_code) == expected
+
+    @pytest.mark.parametrize("zip_code", ["", "abcde", "99999", "2120"])
+    def test_unknown_zips(self, zip_code: str):
+        assert _lookup_utility(zip_code) is None
+
+    def test_mapping_is_read_only(self):
+        with pytest.raises(TypeError):
+            MD_ZIP_UTILITY[21201] = "Other"
+
+
+def _record(**overrides):
+    record = {
+        F_ADDRESS: "123 Oak Street",
+        F_CITY: "ANNAPOLIS",
+        F_ZIP: "21401",
+        F_LAND_USE: "Residential (R)",
+        F_LAT: "38.97",
+        F_LON: "-76.49",
+        F_ACCOUNT: "0201-123",
+    }
+    record.update(overrides)
+    return record
+
+
+class TestMapRecords:
+    """Verify batch record mapping and filtering."""
+
+    def test_maps_valid_record(self):
+        mapped, skipped, errors = map_records_to_property_kwargs([_record()])
+        assert (skipped, errors) == (0, 0)
+        assert mapped[0]["address_line1"] == "123 OAK ST"
+        assert mapped[0]["city"] == "Annapolis"
+        assert mapped[0]["property_type"] == PropertyType.SFH
+        assert mapped[0]["utility_zone"] == "BGE"
+
+    def test_skips_missing_coordinates_and_address(self):
+        records = [
+            _record(**{F_LAT: None}),
+            _record(**{F_LON: "not-a-number"}),
+            _record(**{F_ADDRESS: "", F_ZIP: ""}),
+            _record(),
+        ]
+        mapped, skipped, errors = map_records_to_property_kwargs(records)
+        assert len(mapped) == 1
+        assert skipped == 3
+        assert errors == 0
+
+
+class TestFetchAllCountyProperties:
+    """Verify concurrent page fetching against a mocked SODA endpoint."""
+
+    @pytest.fixture
+    def soda(self, monkeypatch):
+        requests: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            requests.append(params)
+            if "$select" in params:
+                return httpx.Response(200, json=[{"total": "2500"}])
+            offset, limit = int(params["$offset"]), int(params["$limit"])
+            return httpx.Response(200, json=[{"i": i} for i in range(offset, offset + limit)])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(md_sdat, "get_client", lambda: client)
+        return requests
+
+    @pytest.mark.asyncio
+    async def test_pages_returned_in_order_and_capped(self, soda):
+        records = await md_sdat.fetch_all_county_properties(
+            "Howard County", max_records=2300, page_size=1000,
+        )
+        assert [r["i"] for r in records] == list(range(2300))
+        page_limits = sorted(int(p["$limit"]) for p in soda if "$offset" in p)
+        assert page_limits == [300, 1000, 1000]
+
+    @pytest.mark.asyncio
+    async def test_unknown_county_raises(self, soda):
+        with pytest.raises(ValueError):
+            await md_sdat.fetch_all_county_properties("Nowhere County")
+        assert soda == []
+
+
+class TestLandUseCode:
+    """Verify land-use code extraction for known and unknown strings."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Residential (R)", "R"),
+            ("Residential Townhouse (TH)", "TH"),
+            ("Residential Condominium (CO)", "CO"),
+            ("Residential Multi-Family (MF)", "MF"),
+            ("Residential Mobile Home ( MH )", "MH"),
+            ("Commercial", "Commercial"),
+            ("  Agricultural  ", "Agricultural"),
+        ],
+    )
+    def test_extract(self, raw: str, expected: str):
+        assert md_sdat._extract_land_use_code(raw) == expected
+
+
+class TestDropKnownDuplicates:
+    """Verify batch-level dedup against stored rows and within the batch."""
+
+    @pytest.mark.asyncio
+    async def test_filters_stored_and_repeated_rows(self):
+        stored_parcels = MagicMock()
+        stored_parcels.scalars.return_value = iter(["P-1"])
+        stored_addrs = MagicMock()
+        stored_addrs.all.return_value = [("2 ELM ST", "21401")]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[stored_parcels, stored_addrs])
+
+        batch = [
+            {"parcel_id": "P-1", "address_line1": "1 OAK ST", "zip_code": "21401"},
+            {"parcel_id": "P-2", "address_line1": "2 ELM ST", "zip_code": "21401"},
+            {"parcel_id": "P-3", "address_line1": "3 ASH ST", "zip_code": "21401"},
+            {"parcel_id": "P-3", "address_line1": "3 ASH ST", "zip_code": "21401"},
+            {"parcel_id": None, "address_line1": "4 FIR ST", "zip_code": "21401"},
+            {"parcel_id": None, "address_line1": "4 FIR ST", "zip_code": "21401"},
+        ]
+        fresh = await md_sdat._drop_known_duplicates(db, batch)
+
+        assert [k["address_line1"] for k in fresh] == ["3 ASH ST", "4 FIR ST"]
+        assert db.execute.await_count == 2
@@ -1,9 +1,12 @@
 """Tests for the Solar Readiness Scoring Engine."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from app.models.schema import Property, PropertyType
-from app.services.scoring import ScoringResult, compute_score
+from app.models.schema import LeadScore, LeadStatus, Property, PropertyType
+from app.services.scoring import ScoringResult, compute_score, score_leads
 
 
 def _make_property(**overrides) -> Property:
@@ -115,3 +118,43 @@ class TestComputeScore:
         )
         result = compute_score(prop)
         assert 0 <= result.total <= 100
+
+
+class TestScoreLeads:
+    """Verify batch scoring writes scores in bulk and buckets status UPDATEs."""
+
+    @staticmethod
+    def _db(rows: list) -> MagicMock:
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[MagicMock(all=lambda: rows)] + [MagicMock()] * 4)
+        return db
+
+    async def test_bulk_insert_and_one_update_per_status(self):
+        poor = _make_property(
+            year_built=1950, roof_area_sqft=300.0, assessed_value=80000.0,
+            tree_cover_pct=80.0, neighborhood_solar_pct=0.0, has_existing_solar=True,
+            owner_occupied=False, median_household_income=20000.0, utility_zone=None,
+        )
+        db = self._db([(1, _make_property()), (2, _make_property()), (3, poor)])
+
+        assert await score_leads(db, [1, 2, 3]) == 3
+
+        insert_call, *update_calls = db.execute.await_args_list[1:]
+        assert insert_call.args[0].table.name == LeadScore.__tablename__
+        assert [row["lead_id"] for row in insert_call.args[1]] == [1, 2, 3]
+
+        updates = {}
+        for call in update_calls:
+            params = call.args[0].compile(dialect=postgresql.dialect()).params
+            assert set(params["status_1"]) == {
+                LeadStatus.appointment_set, LeadStatus.qualified, LeadStatus.closed_won,
+            }
+            assert params["status_2"] == params["status"]  # IS DISTINCT FROM the new status
+            updates[params["status"]] = params["id_1"]
+        assert updates == {LeadStatus.hot: [1, 2], LeadStatus.cool: [3]}
+
+    async def test_missing_leads_logged(self, caplog):
+        db = self._db([(1, _make_property())])
+
+        assert await score_leads(db, [1, 2]) == 1
+        assert "[2]" in caplog.text
@@ -0,0 +1,110 @@
+"""Tests for Vapi tool-call helpers (no DB required)."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api import vapi_tools, webhooks
+from app.models.schema import Lead, RepUser
+
+
+@pytest.fixture(autouse=True)
+def _reset_rep_cache():
+    vapi_tools.invalidate_active_rep_cache()
+    yield
+    vapi_tools.invalidate_active_rep_cache()
+
+
+def _mock_db(rep_id: int | None):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = rep_id
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.get = AsyncMock(
+        side_effect=lambda model, pk: RepUser(id=pk, name="Rep", is_active=True)
+    )
+    return db
+
+
+class TestActiveRepFallback:
+    """Verify the unassigned-lead rep fallback is memoized."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_queried_once_within_ttl(self):
+        db = _mock_db(7)
+        lead = Lead(assigned_rep_id=None)
+
+        first = await vapi_tools._get_available_rep(db, lead)
+        second = await vapi_tools._get_available_rep(db, lead)
+
+        assert first.id == second.id == 7
+        assert db.execute.await_count == 1
+        assert db.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_requery(self):
+        db = _mock_db(7)
+        lead = Lead(assigned_rep_id=None)
+
+        await vapi_tools._get_available_rep(db, lead)
+        vapi_tools.invalidate_active_rep_cache()
+        await vapi_tools._get_available_rep(db, lead)
+
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_active_rep_not_cached(self):
+        db = _mock_db(None)
+        lead = Lead(assigned_rep_id=None)
+
+        assert await vapi_tools._get_available_rep(db, lead) is None
+        assert await vapi_tools._get_available_rep(db, lead) is None
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_assigned_rep_bypasses_cache(self):
+        db = _mock_db(7)
+        lead = Lead(assigned_rep_id=3)
+
+        rep = await vapi_tools._get_available_rep(db, lead)
+
+        assert rep.id == 3
+        db.execute.assert_not_awaited()
+
+
+class TestSpokenDatetime:
+    """Verify tool-response date formatting matches the strftime output."""
+
+    @pytest.mark.parametrize(
+        "dt",
+        [
+            datetime(2026, 3, 9, 0, 5),
+            datetime(2026, 3, 9, 9, 30),
+            datetime(2026, 7, 4, 12, 0),
+            datetime(2026, 12, 31, 13, 45),
+            datetime(2026, 1, 1, 23, 59),
+        ],
+    )
+    def test_matches_strftime(self, dt: datetime):
+        expected = dt.strftime("%A, %B %d at %-I:%M %p")
+        assert vapi_tools._format_spoken_datetime(dt) == expected
+
+
+class TestNormalizePhone:
+    """Verify caller numbers reduce to their last 10 digits on both inbound paths."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("+14105551234", "4105551234"),
+            ("+1 (410) 555-1234", "4105551234"),
+            ("410.555.1234", "4105551234"),
+            ("555-1234", "5551234"),
+            ("", ""),
+            ("+1410555123４", "410555123４"),  # non-Latin-1 input falls back to regex
+        ],
+    )
+    @pytest.mark.parametrize("router", [vapi_tools, webhooks], ids=["vapi", "webhooks"])
+    def test_normalize(self, router, raw: str, expected: str):
+        assert router.normalize_phone(raw) == expected
@@ -0,0 +1,74 @@
+"""Tests for webhook verification helpers (no DB required)."""
+
+import hashlib
+import hmac
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api import webhooks
+from app.core.config import Settings
+
+_SECRET = "test_webhook_secret"
+
+
+@pytest.fixture
+def twilio_secret(monkeypatch):
+    monkeypatch.setattr(webhooks, "settings", Settings(twilio_webhook_secret=_SECRET))
+    monkeypatch.setattr(webhooks, "_TWILIO_SECRET", _SECRET.encode())
+
+
+def _request(signature: str | None) -> MagicMock:
+    request = MagicMock()
+    request.headers = {"X-Twilio-Signature": signature} if signature is not None else {}
+    return request
+
+
+class TestTwilioSignature:
+    """Verify HMAC-SHA256 webhook signature checks."""
+
+    body = b"From=%2B14105551234&Body=Hello"
+
+    def test_valid_signature(self, twilio_secret):
+        signature = hmac.new(_SECRET.encode(), self.body, hashlib.sha256).hexdigest()
+        assert webhooks._verify_twilio_signature(_request(signature), self.body) is True
+
+    def test_tampered_body_rejected(self, twilio_secret):
+        signature = hmac.new(_SECRET.encode(), self.body, hashlib.sha256).hexdigest()
+        assert webhooks._verify_twilio_signature(_request(signature), self.body + b"x") is False
+
+    @pytest.mark.parametrize("signature", [None, "", "not-hex", "abcd"])
+    def test_missing_or_malformed_signature_rejected(self, twilio_secret, signature):
+        assert webhooks._verify_twilio_signature(_request(signature), self.body) is False
+
+
+class TestTwilioDetection:
+    """Verify voice-callback provider detection."""
+
+    @pytest.mark.parametrize(
+        "headers,content_type,body,expected",
+        [
+            ({"X-Twilio-Signature": "abc"}, "application/x-www-form-urlencoded", b"", True),
+            ({"user-agent": "TwilioProxy/1.1"}, "application/x-www-form-urlencoded", b"", True),
+            ({}, "application/json", b'{"CallSid": "CA123"}', False),
+            ({}, "application/x-www-form-urlencoded", b"CallSid=CA123", True),
+            ({}, "application/x-www-form-urlencoded", b"call_sid=abc", False),
+        ],
+    )
+    def test_detection(self, headers, content_type, body, expected):
+        request = MagicMock()
+        request.headers = headers
+        assert webhooks._is_twilio_request(request, content_type, body) is expected
+
+
+class TestRateLimit:
+    """Verify the limiter fails open when Redis misbehaves."""
+
+    async def test_redis_timeout_allows_request(self, monkeypatch):
+        import redis.asyncio as aioredis
+
+        redis = MagicMock()
+        redis.pipeline.side_effect = aioredis.TimeoutError("Timeout reading from socket")
+        monkeypatch.setattr(webhooks.cache, "get_redis", lambda: redis)
+
+        assert await webhooks._check_rate_limit("203.0.113.7") is True